@@ -4,8 +4,13 @@ File: debug_logger.py
 Purpose: Multi-level logging system for development and production.
 """
 
+import os
 import time
 import sys
+import queue
+import atexit
+import weakref
+import threading
 from enum import Enum
 
 class LogLevel(Enum):
@@ -16,6 +21,56 @@ class LogLevel(Enum):
     DEBUG = 3       # Development: Detailed logs
     VERBOSE = 4     # Development: Everything + timing data
 
+# Plain-int levels for hot call sites (skips Enum attribute lookups)
+_SILENT, _MINIMAL, _NORMAL, _DEBUG, _VERBOSE = 0, 1, 2, 3, 4
+
+# Every possible progress bar, indexed by filled cells
+_BAR_LENGTH = 40
+_BARS = tuple('█' * f + '░' * (_BAR_LENGTH - f) for f in range(_BAR_LENGTH + 1))
+
+_live_loggers = weakref.WeakSet()
+
+@atexit.register
+def _flush_live_loggers():
+    for logger in list(_live_loggers):
+        logger.flush()
+
+class _BackgroundLogSink:
+    """
+    Appends log lines to a file from a daemon thread.
+    Lines are queued by the caller and written in batches (one write per batch),
+    keeping file I/O off the rendering thread for headless batch runs.
+    """
+    
+    def __init__(self, path, max_batch=64):
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._queue = queue.Queue()
+        self._max_batch = max_batch
+        threading.Thread(target=self._drain, name="log-sink", daemon=True).start()
+        
+    def write(self, line):
+        self._queue.put(line)
+        
+    def _drain(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                os.write(self._fd, ('\n'.join(batch) + '\n').encode('utf-8'))
+            except OSError:
+                pass  # Never let logging take down a render
+            for _ in batch:
+                self._queue.task_done()
+                
+    def flush(self):
+        """Block until every queued line has been written"""
+        self._queue.join()
+
+
 class DebugLogger:
     """
     Flexible logging system with section tracking and progress bars.
@@ -26,114 +81,182 @@ class DebugLogger:
         logger.log("Processing file 1/5")
         logger.data("Duration", "3.45s")
         logger.section_end("Audio Generation")
+    
+    `log`/`data`/`logf` accept either a LogLevel or its int value.
+    Pass `sink="path/to/run.log"` to send log lines to a file via a
+    background writer thread (headless runs); progress bars stay on stdout.
     """
     
-    def __init__(self, level=LogLevel.NORMAL):
+    def __init__(self, level=LogLevel.NORMAL, sink=None):
         self.level = level
         self.start_time = time.time()
+        self._start_mono = time.monotonic()
         self.section_times = {}
         self.indent_level = 0
+        self._indent = ''
+        self._row_fmt = None
+        self._row_cols = 0
+        self._last_progress_pct = None
+        self._last_flush_ts = 0.0
+        self._sink = _BackgroundLogSink(sink) if sink else None
+        _live_loggers.add(self)
+        
+    @property
+    def level(self):
+        return self._level
+        
+    @level.setter
+    def level(self, value):
+        # Hot paths compare the cached int, so keep it in sync with the Enum
+        self._level = value
+        self._level_int = value.value
+        # MoviePy progress-bar argument for write_videofile(logger=...)
+        self.moviepy_bar = None if value == LogLevel.SILENT else 'bar'
+        
+    def _emit(self, line):
+        """
+        Write one log line: to the sink's background writer when configured, else
+        straight to stdout so it stays in order with plain print() output and errors.
+        """
+        if self._sink is not None:
+            self._sink.write(line)
+            return
+        print(line)
+            
+    def flush(self):
+        """Write out any queued sink lines and flush stdout"""
+        if self._sink is not None:
+            self._sink.flush()
+        sys.stdout.flush()
         
     def section_start(self, name):
         """Mark start of a processing section"""
-        if self.level.value >= LogLevel.DEBUG.value:
-            print(f"\n{'  ' * self.indent_level}{'='*60}")
-            print(f"{'  ' * self.indent_level}🔧 SECTION: {name}")
-            print(f"{'  ' * self.indent_level}{'='*60}")
-        elif self.level == LogLevel.NORMAL:
-            print(f"\n{'  ' * self.indent_level}🔧 {name}...")
+        if self._level_int >= _DEBUG:
+            self._emit(f"\n{self._indent}{'='*60}")
+            self._emit(f"{self._indent}🔧 SECTION: {name}")
+            self._emit(f"{self._indent}{'='*60}")
+        elif self._level_int == _NORMAL:
+            self._emit(f"\n{self._indent}🔧 {name}...")
             
         self.section_times[name] = time.time()
         self.indent_level += 1
+        self._indent = '  ' * self.indent_level
         
     def section_end(self, name):
         """Mark end and show duration"""
         self.indent_level = max(0, self.indent_level - 1)
+        self._indent = '  ' * self.indent_level
+        self._row_fmt = None
         
         if name in self.section_times:
             duration = time.time() - self.section_times[name]
-            if self.level.value >= LogLevel.DEBUG.value:
-                print(f"{'  ' * self.indent_level}✅ {name} completed in {duration:.2f}s")
-            elif self.level == LogLevel.NORMAL:
-                print(f"{'  ' * self.indent_level}✅ {name} done ({duration:.1f}s)")
+            if self._level_int >= _DEBUG:
+                self._emit(f"{self._indent}✅ {name} completed in {duration:.2f}s")
+            elif self._level_int == _NORMAL:
+                self._emit(f"{self._indent}✅ {name} done ({duration:.1f}s)")
                 
-    def log(self, message, level=LogLevel.NORMAL):
+    def log(self, message, level=_NORMAL):
         """Conditional logging based on level"""
-        if self.level.value >= level.value:
-            timestamp = time.time() - self.start_time
-            indent = '  ' * self.indent_level
-            print(f"{indent}[{timestamp:6.2f}s] {message}")
+        if (level if level.__class__ is int else level.value) > self._level_int:
+            return
+        self._emit('%s[%6.2fs] %s' % (self._indent, time.monotonic() - self._start_mono, message))
             
-    def data(self, label, value, level=LogLevel.VERBOSE):
+    def logf(self, fmt, *args, level=_NORMAL):
+        """Like log(), but only formats `fmt` with `args` when the level is enabled"""
+        if (level if level.__class__ is int else level.value) > self._level_int:
+            return
+        self.log(fmt.format(*args), level)
+            
+    def data(self, label, value, level=_VERBOSE):
         """Log data values (for debugging)"""
-        if self.level.value >= level.value:
-            indent = '  ' * self.indent_level
-            print(f"{indent}   📊 {label}: {value}")
+        if (level if level.__class__ is int else level.value) > self._level_int:
+            return
+        self._emit(f"{self._indent}   📊 {label}: {value}")
             
     def warning(self, message):
         """Always show warnings (unless SILENT)"""
-        if self.level != LogLevel.SILENT:
-            indent = '  ' * self.indent_level
-            print(f"{indent}⚠️  WARNING: {message}")
+        if self._level_int != _SILENT:
+            indent = self._indent
+            self._emit(f"{indent}⚠️  WARNING: {message}")
             
     def error(self, message):
         """Always show errors"""
-        indent = '  ' * self.indent_level
+        sys.stdout.flush()  # Redirected stdout is block-buffered; keep it ahead of stderr
+        indent = self._indent
         print(f"{indent}❌ ERROR: {message}", file=sys.stderr)
         
     def progress(self, current, total, label="Progress"):
         """Show progress bar (always shown unless SILENT)"""
-        if self.level == LogLevel.SILENT:
+        if self._level_int == _SILENT:
             return
+        
+        # Tenths of a percent: skip redraws until the bar actually moves
+        percent_tenths = int(current * 1000 / total)
+        done = current == total
+        if percent_tenths == self._last_progress_pct and not done:
+            return
+        self._last_progress_pct = percent_tenths
             
-        percent = (current / total) * 100
-        bar_length = 40
-        filled = int(bar_length * current / total)
-        bar = '█' * filled + '░' * (bar_length - filled)
+        bar = _BARS[min(max(int(_BAR_LENGTH * current / total), 0), _BAR_LENGTH)]
         
-        indent = '  ' * self.indent_level
-        # Carriage return to overwrite line
-        sys.stdout.write(f'\r{indent}{label}: |{bar}| {percent:.1f}%')
-        sys.stdout.flush()
+        indent = self._indent
+        # Carriage return to overwrite line (single write per tick)
+        line = f'\r{indent}{label}: |{bar}| {percent_tenths / 10:.1f}%'
+        if done:
+            line += '\n'  # Newline when complete
+        sys.stdout.write(line)
         
-        if current == total:
-            print()  # Newline when complete
+        # Throttle flushes to ~20/s, always flush on completion
+        now = time.monotonic()
+        if done or now - self._last_flush_ts > 0.05:
+            sys.stdout.flush()
+            self._last_flush_ts = now
+        if done:
+            self._last_progress_pct = None
             
     def table_header(self, columns):
         """Print formatted table header"""
-        if self.level.value >= LogLevel.DEBUG.value:
-            indent = '  ' * self.indent_level
-            header = " | ".join([f"{col:^15}" for col in columns])
+        if self._level_int >= _DEBUG:
+            indent = self._indent
+            header = " | ".join(f"{col:^15}" for col in columns)
+            # Reused by table_row for tables of the same width
+            self._row_cols = len(columns)
+            self._row_fmt = " | ".join(["{:^15}"] * self._row_cols)
             separator = "-" * len(header)
-            print(f"\n{indent}{header}")
-            print(f"{indent}{separator}")
+            self._emit(f"\n{indent}{header}")
+            self._emit(f"{indent}{separator}")
             
     def table_row(self, values):
         """Print formatted table row"""
-        if self.level.value >= LogLevel.DEBUG.value:
-            indent = '  ' * self.indent_level
-            row = " | ".join([f"{str(val):^15}" for val in values])
-            print(f"{indent}{row}")
+        if self._level_int >= _DEBUG:
+            indent = self._indent
+            values = list(map(str, values))
+            if self._row_fmt is not None and len(values) == self._row_cols:
+                row = self._row_fmt.format(*values)
+            else:
+                row = " | ".join(f"{val:^15}" for val in values)
+            self._emit(f"{indent}{row}")
             
     def summary(self, title, data_dict):
         """Print a summary box"""
-        if self.level.value >= LogLevel.NORMAL.value:
-            indent = '  ' * self.indent_level
-            print(f"\n{indent}{'─'*50}")
-            print(f"{indent}📋 {title}")
-            print(f"{indent}{'─'*50}")
+        if self._level_int >= _NORMAL:
+            indent = self._indent
+            self._emit(f"\n{indent}{'─'*50}")
+            self._emit(f"{indent}📋 {title}")
+            self._emit(f"{indent}{'─'*50}")
             for key, value in data_dict.items():
-                print(f"{indent}  {key}: {value}")
-            print(f"{indent}{'─'*50}\n")
+                self._emit(f"{indent}  {key}: {value}")
+            self._emit(f"{indent}{'─'*50}\n")
 
 
 # Convenience function for quick logger creation
-def create_logger(level_string='normal'):
+def create_logger(level_string='normal', sink=None):
     """
     Create logger from string level.
     
     Args:
         level_string: 'silent', 'minimal', 'normal', 'debug', or 'verbose'
+        sink: Optional log file path (lines written by a background thread)
     """
     mapping = {
         'silent': LogLevel.SILENT,
@@ -142,4 +265,4 @@ def create_logger(level_string='normal'):
         'debug': LogLevel.DEBUG,
         'verbose': LogLevel.VERBOSE
     }
-    return DebugLogger(mapping.get(level_string.lower(), LogLevel.NORMAL))
\ No newline at end of file
+    return DebugLogger(mapping.get(level_string.lower(), LogLevel.NORMAL), sink=sink)
\ No newline at end of file
@@ -6,79 +6,164 @@ UPDATED: Fixed Transparency, Pro Transitions, and Anchored Positioning.
 """
 
 import os
+import re
 import random
+from functools import lru_cache
+import numpy as np
+from PIL import Image
 from moviepy.editor import ImageClip, CompositeVideoClip, vfx
 
+# Sticker anchor: Bottom Right Corner (Professional UI look)
+# Screen width 1080. Sticker width ~250. Padding 50.
+# Y = 1350 (Above the CTA area, below the main content)
+STICKER_X = 750
+STICKER_Y = 1350
+# Slide Up: starts 200px lower and slides up to STICKER_Y
+SLIDE_OFFSET = 200
+SLIDE_TIME = 0.5
+
+@lru_cache(maxsize=8)
+def _slide_y_table(fps):
+    """
+    Per-frame Y positions for the sticker slide-in at the given fps.
+    Computed once per fps and shared by every sticker; the last entry is the hold position.
+    """
+    n_frames = max(1, int(np.ceil(SLIDE_TIME * fps)))
+    progress = np.clip(np.arange(n_frames + 1) / fps / SLIDE_TIME, 0.0, 1.0)
+    return tuple((STICKER_Y + SLIDE_OFFSET * (1 - progress)).tolist())
+
+STICKER_HEIGHT = 250
+
+# image_path -> RGBA array already resized to STICKER_HEIGHT (decoded once per process)
+_STICKER_ARR_CACHE = {}
+
+def _load_sticker_rgba(image_path):
+    arr = _STICKER_ARR_CACHE.get(image_path)
+    if arr is None:
+        with Image.open(image_path) as img:
+            img = img.convert('RGBA')
+            width = max(1, round(STICKER_HEIGHT * img.width / img.height))
+            arr = np.asarray(img.resize((width, STICKER_HEIGHT), Image.LANCZOS))
+        _STICKER_ARR_CACHE[image_path] = arr
+    return arr
+
+# Sticker file -> trigger keywords (lowercase substrings)
+_KEYWORD_MAP = {
+    "brain.png": ["think", "know", "mind", "remember", "logic", "smart", "brain", "idea"],
+    "science.png": ["science", "experiment", "lab", "study", "research"],
+    "dna.png": ["gene", "dna", "code", "life", "genetic", "inherit"],
+    "test_tube.png": ["chem", "reaction", "mix", "liquid", "solution"],
+    "magnet.png": ["attract", "pole", "force", "magnetic", "field"],
+    "telescope.png": ["space", "star", "planet", "sky", "universe"],
+    "microbe.png": ["bacteria", "virus", "small", "germ", "disease", "sick"],
+    "books.png": ["book", "read", "study", "chapter", "lesson", "syllabus"],
+    "graduation.png": ["pass", "exam", "college", "school", "degree", "topper"],
+    "pencil.png": ["write", "note", "draw", "sketch", "mark"],
+    "calculator.png": ["math", "count", "number", "calculate", "solve", "hard"],
+    "ruler.png": ["measure", "size", "long", "short", "distance"],
+    "muscle.png": ["strong", "power", "lift", "body", "fit"],
+    "heart.png": ["love", "life", "blood", "beat", "core"],
+    "bone.png": ["skeleton", "structure", "frame", "calcium"],
+    "tooth.png": ["teeth", "bite", "chew", "white", "calcium"],
+    "eye.png": ["see", "look", "watch", "vision", "sight"],
+    "leaf.png": ["plant", "nature", "grow", "green", "photosynthesis"],
+    "drop.png": ["water", "liquid", "rain", "fluid", "aqua"],
+    "shock.png": ["wow", "shock", "scary", "wait", "what", "danger"],
+    "happy.png": ["fun", "good", "great", "easy", "smile", "happy"],
+    "cool.png": ["trick", "hack", "pro", "easy", "cool", "style"],
+    "angry.png": ["bad", "wrong", "hate", "fail", "stupid"],
+    "mind_blown.png": ["amazing", "unbelievable", "crazy", "impossible", "magic"],
+    "star_struck.png": ["famous", "star", "shine", "beautiful", "wow"],
+    "nerd.png": ["geek", "fact", "detail", "complex", "tech"],
+    "sick.png": ["ill", "bad", "gross", "yuck", "vomit"],
+    "sleepy.png": ["boring", "tired", "sleep", "rest", "night"],
+    "party.png": ["celebrate", "win", "yay", "party", "fun"],
+    "fire.png": ["energy", "hot", "fast", "power", "burn", "heat"],
+    "idea.png": ["idea", "tip", "solution", "light", "bright"],
+    "trophy.png": ["win", "best", "top", "champion", "first", "score"],
+    "target.png": ["focus", "goal", "aim", "point", "spot", "here"],
+    "warning.png": ["stop", "caution", "wrong", "mistake", "fail", "alert"],
+    "check.png": ["correct", "right", "yes", "true", "done"],
+    "cross.png": ["wrong", "no", "false", "bad", "error"],
+    "money.png": ["cost", "price", "rich", "value", "rupee", "lakh"],
+    "time.png": ["time", "late", "fast", "slow", "clock", "hour"],
+    "battery.png": ["charge", "energy", "power", "full", "empty"],
+    "search.png": ["find", "search", "look", "detect", "clue"],
+    "lock.png": ["secret", "hidden", "safe", "secure"],
+    "key.png": ["answer", "key", "unlock", "solution"]
+}
+
+def _build_keyword_scanner(keyword_map):
+    """
+    Compiles every keyword into one regex so a text is scanned in a single pass
+    instead of one substring probe per keyword.
+    The zero-width lookahead reports a match at every position (overlaps included);
+    keywords sharing a start position are covered by mapping each keyword to all
+    keywords that are prefixes of it.
+    """
+    keywords = sorted({kw for kws in keyword_map.values() for kw in kws}, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+    prefixes = {kw: tuple(k for k in keywords if kw.startswith(k)) for kw in keywords}
+    return pattern, prefixes
+
+def _invert_keyword_map(keyword_map):
+    """keyword -> sticker files listing it"""
+    kw_to_stickers = {}
+    for filename, keywords in keyword_map.items():
+        for kw in keywords:
+            kw_to_stickers.setdefault(kw, []).append(filename)
+    return kw_to_stickers
+
+# Built once per process and shared by every EffectsManager
+_KEYWORD_PATTERN, _KEYWORD_PREFIXES = _build_keyword_scanner(_KEYWORD_MAP)
+_KW_TO_STICKERS = _invert_keyword_map(_KEYWORD_MAP)
+
 class EffectsManager:
     def __init__(self, assets_dir="config/stickers"):
         self.assets_dir = assets_dir
         self.keyword_map = self._load_keyword_map()
+        # One directory read at startup instead of a stat() per sticker lookup
+        try:
+            self._available_files = frozenset(os.listdir(self.assets_dir))
+        except OSError:
+            self._available_files = frozenset()
+        self._keyword_pattern, self._keyword_prefixes = _KEYWORD_PATTERN, _KEYWORD_PREFIXES
+        self._kw_to_stickers = _KW_TO_STICKERS
+        # Scripts repeat chunks across renders; memoize the scan, not the random pick
+        self._scan_candidates = lru_cache(maxsize=256)(self._scan_candidates)
         
         # Verify assets
         #if not os.path.exists(self.assets_dir):
             #print(f"❌ [FX ERROR] Sticker directory not found: {self.assets_dir}")
 
     def _load_keyword_map(self):
-        return {
-            "brain.png": ["think", "know", "mind", "remember", "logic", "smart", "brain", "idea"],
-            "science.png": ["science", "experiment", "lab", "study", "research"],
-            "dna.png": ["gene", "dna", "code", "life", "genetic", "inherit"],
-            "test_tube.png": ["chem", "reaction", "mix", "liquid", "solution"],
-            "magnet.png": ["attract", "pole", "force", "magnetic", "field"],
-            "telescope.png": ["space", "star", "planet", "sky", "universe"],
-            "microbe.png": ["bacteria", "virus", "small", "germ", "disease", "sick"],
-            "books.png": ["book", "read", "study", "chapter", "lesson", "syllabus"],
-            "graduation.png": ["pass", "exam", "college", "school", "degree", "topper"],
-            "pencil.png": ["write", "note", "draw", "sketch", "mark"],
-            "calculator.png": ["math", "count", "number", "calculate", "solve", "hard"],
-            "ruler.png": ["measure", "size", "long", "short", "distance"],
-            "muscle.png": ["strong", "power", "lift", "body", "fit"],
-            "heart.png": ["love", "life", "blood", "beat", "core"],
-            "bone.png": ["skeleton", "structure", "frame", "calcium"],
-            "tooth.png": ["teeth", "bite", "chew", "white", "calcium"],
-            "eye.png": ["see", "look", "watch", "vision", "sight"],
-            "leaf.png": ["plant", "nature", "grow", "green", "photosynthesis"],
-            "drop.png": ["water", "liquid", "rain", "fluid", "aqua"],
-            "shock.png": ["wow", "shock", "scary", "wait", "what", "danger"],
-            "happy.png": ["fun", "good", "great", "easy", "smile", "happy"],
-            "cool.png": ["trick", "hack", "pro", "easy", "cool", "style"],
-            "angry.png": ["bad", "wrong", "hate", "fail", "stupid"],
-            "mind_blown.png": ["amazing", "unbelievable", "crazy", "impossible", "magic"],
-            "star_struck.png": ["famous", "star", "shine", "beautiful", "wow"],
-            "nerd.png": ["geek", "fact", "detail", "complex", "tech"],
-            "sick.png": ["ill", "bad", "gross", "yuck", "vomit"],
-            "sleepy.png": ["boring", "tired", "sleep", "rest", "night"],
-            "party.png": ["celebrate", "win", "yay", "party", "fun"],
-            "fire.png": ["energy", "hot", "fast", "power", "burn", "heat"],
-            "idea.png": ["idea", "tip", "solution", "light", "bright"],
-            "trophy.png": ["win", "best", "top", "champion", "first", "score"],
-            "target.png": ["focus", "goal", "aim", "point", "spot", "here"],
-            "warning.png": ["stop", "caution", "wrong", "mistake", "fail", "alert"],
-            "check.png": ["correct", "right", "yes", "true", "done"],
-            "cross.png": ["wrong", "no", "false", "bad", "error"],
-            "money.png": ["cost", "price", "rich", "value", "rupee", "lakh"],
-            "time.png": ["time", "late", "fast", "slow", "clock", "hour"],
-            "battery.png": ["charge", "energy", "power", "full", "empty"],
-            "search.png": ["find", "search", "look", "detect", "clue"],
-            "lock.png": ["secret", "hidden", "safe", "secure"],
-            "key.png": ["answer", "key", "unlock", "solution"]
-        }
+        return _KEYWORD_MAP
+
+    def _scan_candidates(self, text):
+        """Returns the available sticker filenames whose keywords appear in (lowercased) text."""
+        # A dict, not a set: keeps finditer order, so the pick below is stable for a given seed
+        matched = {}
+        for m in self._keyword_pattern.finditer(text):
+            matched.update(dict.fromkeys(self._keyword_prefixes[m.group(1)]))
+        
+        # Deduplicated (insertion-ordered) so a sticker matching several keywords
+        # isn't weighted more heavily in the random pick
+        candidates = {}
+        for kw in matched:
+            for f in self._kw_to_stickers[kw]:
+                if f in self._available_files:
+                    candidates[f] = None
+        return tuple(candidates)
 
     def get_relevant_sticker(self, text):
-        text = text.lower()
-        candidates = []
-        for filename, keywords in self.keyword_map.items():
-            for kw in keywords:
-                if kw in text: candidates.append(filename)
+        candidates = self._scan_candidates(text.lower())
         
         if candidates:
             choice = random.choice(candidates)
-            full_path = os.path.join(self.assets_dir, choice)
-            if os.path.exists(full_path):
-                return full_path
+            return os.path.join(self.assets_dir, choice)
         return None
 
-    def create_sliding_sticker(self, image_path, duration, start_time):
+    def create_sliding_sticker(self, image_path, duration, start_time, fps=24):
         """
         Creates a Pro 'Slide In' Sticker.
         - Fixes Transparency (Black box issue)
@@ -87,29 +172,17 @@ class EffectsManager:
         """
         try:
             # 1. Load with Alpha Channel (Transparent=True is key)
-            # Resize immediately to 250px (smaller/cleaner)
-            clip = ImageClip(image_path, transparent=True).resize(height=250)
-            
-            # 2. Define Position: Bottom Right Corner (Professional UI look)
-            # Screen width 1080. Sticker width ~250. Padding 50.
-            # X = 1080 - 250 - 50 = 780
-            # Y = 1350 (Above the CTA area, below the main content)
-            TARGET_X = 750
-            TARGET_Y = 1350
+            # Resized to 250px (smaller/cleaner); decode + resize is cached per path
+            clip = ImageClip(_load_sticker_rgba(image_path), transparent=True)
             
-            # 3. Slide Up Animation
-            # It starts 200px lower (off-screen or lower) and slides up to TARGET_Y
-            TRANSITION_TIME = 0.5
+            # 2. Position: anchored Bottom Right (STICKER_X/STICKER_Y)
+            # 3. Slide Up Animation, precomputed per frame
+            slide_ys = _slide_y_table(fps)
+            last_frame = len(slide_ys) - 1
             
             def slide_position(t):
-                if t < TRANSITION_TIME:
-                    # Smooth ease-out slide
-                    progress = t / TRANSITION_TIME
-                    offset = 200 * (1 - progress) # Starts at 200, goes to 0
-                    return (TARGET_X, TARGET_Y + offset)
-                else:
-                    # Hold position
-                    return (TARGET_X, TARGET_Y)
+                # Round to nearest frame so n/fps never lands on frame n-1
+                return (STICKER_X, slide_ys[min(int(t * fps + 0.5), last_frame)])
 
             clip = clip.set_position(slide_position).set_start(start_time).set_duration(duration)
             
@@ -124,7 +197,6 @@ class EffectsManager:
 
     def apply_visual_effects(self, base_video, script_text):
         print(f"🔍 [FX SCANNING] Script length: {len(script_text)} chars")
-        layers = [base_video]
         
         total_dur = base_video.duration
         
@@ -136,19 +208,19 @@ class EffectsManager:
         interval = total_dur / (num_stickers + 1)
         words = script_text.split()
         chunk_size = len(words) // num_stickers
+        # Context Search text per sticker slot, built in one pass
+        text_chunks = [" ".join(words[i * chunk_size:(i + 1) * chunk_size]) for i in range(num_stickers)]
         
+        # Preallocated: base video + at most one sticker per slot
+        layers = [None] * (num_stickers + 1)
+        layers[0] = base_video
         added_count = 0
         
         for i in range(num_stickers):
             # Timing: precise intervals, less randomness
             t_start = (i + 1) * interval
             
-            # Context Search
-            start_idx = i * chunk_size
-            end_idx = min(len(words), (i+1) * chunk_size)
-            text_chunk = " ".join(words[start_idx:end_idx])
-            
-            sticker_path = self.get_relevant_sticker(text_chunk)
+            sticker_path = self.get_relevant_sticker(text_chunks[i])
             
             # Only add if we actually found a relevant keyword match
             # (Removed the random "generic" fallback to avoid childish feel)
@@ -157,8 +229,8 @@ class EffectsManager:
                 # Show for 3.5 seconds (Long enough to read)
                 sticker_clip = self.create_sliding_sticker(sticker_path, 3.5, t_start)
                 if sticker_clip: 
-                    layers.append(sticker_clip)
                     added_count += 1
+                    layers[added_count] = sticker_clip
 
         print(f"✅ [FX DONE] Added {added_count} stickers.")
-        return CompositeVideoClip(layers)
\ No newline at end of file
+        return CompositeVideoClip(layers[:added_count + 1])
\ No newline at end of file
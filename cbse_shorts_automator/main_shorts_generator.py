@@ -17,6 +17,7 @@ import requests
 import fitz
 import random
 import gc 
+import concurrent.futures
 
 #from google.auth.transport.requests import Request
 import google.auth.transport.requests
@@ -389,6 +390,62 @@ def process_row(engine, gemini, row, row_idx):
                 if os.path.exists(p): os.remove(p)
         gc.collect()
 
+# === PARALLEL BATCH RENDERING ===
+# Each worker process owns its own engine (voice/whisper/MoviePy state is not picklable)
+_WORKER = {}
+
+def _init_render_worker(render_threads):
+    engine = ShortsEngine(CONFIG_FILE)
+    # Per-worker TEMP so concurrent shorts never collide on MoviePy temp files.
+    # engine.textcache_dir keeps pointing at the shared temp/textcache: its PNGs are
+    # content-addressed and written tmp + os.replace, so workers reuse each other's text.
+    # Voice quota is shared too: VoiceUsageTracker.save() merges under a file lock.
+    worker_temp = os.path.join(engine.config['DIRS']['TEMP'], f"w{os.getpid()}")
+    os.makedirs(worker_temp, exist_ok=True)
+    engine.config['DIRS']['TEMP'] = worker_temp
+    import moviepy.config as mpconf
+    mpconf.TEMP_DIR = worker_temp
+    engine.render_threads = render_threads
+    _WORKER['engine'] = engine
+    _WORKER['gemini'] = GeminiManager()
+
+def _render_one(job):
+    row_number, row = job
+    return process_row(_WORKER['engine'], _WORKER['gemini'], row, row_number)
+
+def update_sheet_row(sheets, row_number, success, meta_data):
+    # 1. Update Status (Column AN / 39)
+    status_cell = f"{CONFIG['SHEET_NAME']}!{get_col_letter(COL_IDX_STATUS)}{row_number}"
+    sheets.spreadsheets().values().update(
+        spreadsheetId=CONFIG['SPREADSHEET_ID'], range=status_cell,
+        valueInputOption='USER_ENTERED', body={'values': [[meta_data['status']]]}
+    ).execute()
+    
+   # 2. If Successful, Update Metadata Columns (AR, AS, AT, AX)
+    if success:
+        # Range AR:AT (43 to 45) - Filename, Template, Duration
+        start_col = get_col_letter(COL_IDX_FILENAME)
+        end_col = get_col_letter(COL_IDX_DURATION)
+        meta_range = f"{CONFIG['SHEET_NAME']}!{start_col}{row_number}:{end_col}{row_number}"
+        
+        meta_values = [[
+            meta_data['filename'],
+            meta_data['template'],
+            meta_data['duration']
+        ]]
+        
+        sheets.spreadsheets().values().update(
+            spreadsheetId=CONFIG['SPREADSHEET_ID'], range=meta_range,
+            valueInputOption='USER_ENTERED', body={'values': meta_values}
+        ).execute()
+        
+        # 3. Update Voice System Used (Column AX / 49)
+        voice_cell = f"{CONFIG['SHEET_NAME']}!{get_col_letter(COL_IDX_VOICE)}{row_number}"
+        sheets.spreadsheets().values().update(
+            spreadsheetId=CONFIG['SPREADSHEET_ID'], range=voice_cell,
+            valueInputOption='USER_ENTERED', body={'values': [[meta_data['voice_system']]]}
+        ).execute()
+
 def main():
     for d in DIRS.values(): os.makedirs(d, exist_ok=True)
     os.makedirs("temp", exist_ok=True)
@@ -404,8 +461,6 @@ def main():
     
     # Build the service object using the credentials
     sheets = build('sheets', 'v4', credentials=sheets_creds)
-    gemini = GeminiManager()
-    engine = ShortsEngine(CONFIG_FILE)
     
     last_col = get_col_letter(COL_IDX_DURATION) # Ensure we read enough columns if needed
     range_n = f"{CONFIG['SHEET_NAME']}!A:{last_col}"
@@ -414,51 +469,48 @@ def main():
         spreadsheetId=CONFIG['SPREADSHEET_ID'], range=range_n
     ).execute().get('values', [])
     
-    processed = 0
+    # Collect the rows to render first (sheet row number, row)
+    jobs = []
     for i, row in enumerate(rows):
         if i == 0: continue
-        if processed >= CONFIG['MAX_ROWS_TO_PROCESS']: break
+        if len(jobs) >= CONFIG['MAX_ROWS_TO_PROCESS']: break
         
         def val(idx): return row[idx].strip() if len(row) > idx else ""
         
         if val(COL_IDX_STATUS).lower() != CONFIG['STATUS_TO_PROCESS'].lower(): continue
         if not val(COL_IDX_FILTER) or not val(COL_IDX_ID) or not val(COL_IDX_VIDEO): continue
         
-        success, meta_data = process_row(engine, gemini, row, i+1)
-        
-        # 1. Update Status (Column AN / 39)
-        status_cell = f"{CONFIG['SHEET_NAME']}!{get_col_letter(COL_IDX_STATUS)}{i+1}"
-        sheets.spreadsheets().values().update(
-            spreadsheetId=CONFIG['SPREADSHEET_ID'], range=status_cell,
-            valueInputOption='USER_ENTERED', body={'values': [[meta_data['status']]]}
-        ).execute()
-        
-       # 2. If Successful, Update Metadata Columns (AR, AS, AT, AX)
-        if success:
-            # Range AR:AT (43 to 45) - Filename, Template, Duration
-            start_col = get_col_letter(COL_IDX_FILENAME)
-            end_col = get_col_letter(COL_IDX_DURATION)
-            meta_range = f"{CONFIG['SHEET_NAME']}!{start_col}{i+1}:{end_col}{i+1}"
-            
-            meta_values = [[
-                meta_data['filename'],
-                meta_data['template'],
-                meta_data['duration']
-            ]]
-            
-            sheets.spreadsheets().values().update(
-                spreadsheetId=CONFIG['SPREADSHEET_ID'], range=meta_range,
-                valueInputOption='USER_ENTERED', body={'values': meta_values}
-            ).execute()
-            
-            # 3. Update Voice System Used (Column AX / 49)
-            voice_cell = f"{CONFIG['SHEET_NAME']}!{get_col_letter(COL_IDX_VOICE)}{i+1}"
-            sheets.spreadsheets().values().update(
-                spreadsheetId=CONFIG['SPREADSHEET_ID'], range=voice_cell,
-                valueInputOption='USER_ENTERED', body={'values': [[meta_data['voice_system']]]}
-            ).execute()
-        
-        processed += 1
+        jobs.append((i+1, row))
+    
+    # RENDER_WORKERS > 1 renders shorts concurrently, one FFmpeg pipeline per process
+    workers = min(int(CONFIG.get('RENDER_WORKERS', 1)), len(jobs))
+    processed = 0
+    if workers > 1:
+        # Keep total encoder threads ~= core count
+        render_threads = max(1, (os.cpu_count() or 1) // workers)
+        print(f"⚙️  Rendering {len(jobs)} shorts on {workers} workers ({render_threads} threads each)")
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_render_worker, initargs=(render_threads,)
+        ) as ex:
+            futures = {ex.submit(_render_one, job): job[0] for job in jobs}
+            # Each row is written as soon as it finishes; if a worker dies (BrokenProcessPool),
+            # only the rows it took down are marked failed and the finished ones are kept
+            for future in concurrent.futures.as_completed(futures):
+                row_number = futures[future]
+                try:
+                    success, meta_data = future.result()
+                except Exception as e:
+                    print(f"❌ Row {row_number} failed in its worker: {e}")
+                    success, meta_data = False, {"status": f"{CONFIG['STATUS_FAILURE_PREFIX']} {str(e)}"}
+                update_sheet_row(sheets, row_number, success, meta_data)
+                processed += 1
+    else:
+        gemini = GeminiManager()
+        engine = ShortsEngine(CONFIG_FILE)
+        for row_number, row in jobs:
+            success, meta_data = process_row(engine, gemini, row, row_number)
+            update_sheet_row(sheets, row_number, success, meta_data)
+            processed += 1
     
     print(f"\n✨ Processed {processed} videos!")
 
@@ -1,4 +1,5 @@
 import os
+import sys
 import subprocess
 import json
 
@@ -173,9 +174,7 @@ export const remap = (value: number, inputMin: number, inputMax: number, outputM
 """
 
 def get_src_components_3d_tunnel():
-    return """import React, { useMemo, useRef } from 'react';
-import { Instance, Instances } from '@react-three/drei';
-import { useFrame } from '@react-three/fiber';
+    return """import React, { useLayoutEffect, useMemo, useRef } from 'react';
 import * as THREE from 'three';
 import { Theme } from '../../theme/palettes';
 import { SCENE_1_CONFIG } from '../../constants';
@@ -183,26 +182,52 @@ import { SCENE_1_CONFIG } from '../../constants';
 // The Environment: Infinite Library
 export const InfiniteTunnel: React.FC<{ theme: Theme }> = ({ theme }) => {
     const { CUBE_COUNT, TUNNEL_LENGTH } = SCENE_1_CONFIG;
+    const meshRef = useRef<THREE.InstancedMesh>(null);
 
-    // Procedural generation of cube positions
+    // Procedural generation of cube transforms (SoA typed arrays, single pass)
     const particles = useMemo(() => {
-        const temp = [];
+        const xs = new Float32Array(CUBE_COUNT);
+        const ys = new Float32Array(CUBE_COUNT);
+        const zs = new Float32Array(CUBE_COUNT);
+        const scales = new Float32Array(CUBE_COUNT);
+        const rotX = new Float32Array(CUBE_COUNT);
+        const rotY = new Float32Array(CUBE_COUNT);
         for (let i = 0; i < CUBE_COUNT; i++) {
-            const x = (Math.random() - 0.5) * 100;
-            const y = (Math.random() - 0.5) * 100;
-            const z = -Math.random() * TUNNEL_LENGTH;
-            const scale = Math.random() * 2 + 0.5;
-            temp.push({ x, y, z, scale });
+            xs[i] = (Math.random() - 0.5) * 100;
+            ys[i] = (Math.random() - 0.5) * 100;
+            zs[i] = -Math.random() * TUNNEL_LENGTH;
+            scales[i] = Math.random() * 2 + 0.5;
+            rotX[i] = Math.random() * Math.PI;
+            rotY[i] = Math.random() * Math.PI;
         }
-        return temp;
+        return { xs, ys, zs, scales, rotX, rotY };
     }, [CUBE_COUNT, TUNNEL_LENGTH]);
 
+    // Write every instance matrix once (no per-instance React components)
+    useLayoutEffect(() => {
+        const mesh = meshRef.current;
+        if (!mesh) return;
+        const { xs, ys, zs, scales, rotX, rotY } = particles;
+        const matrix = new THREE.Matrix4();
+        const pos = new THREE.Vector3();
+        const quat = new THREE.Quaternion();
+        const euler = new THREE.Euler();
+        const scale = new THREE.Vector3();
+        for (let i = 0; i < CUBE_COUNT; i++) {
+            pos.set(xs[i], ys[i], zs[i]);
+            quat.setFromEuler(euler.set(rotX[i], rotY[i], 0));
+            scale.setScalar(scales[i]);
+            mesh.setMatrixAt(i, matrix.compose(pos, quat, scale));
+        }
+        mesh.instanceMatrix.needsUpdate = true;
+    }, [particles, CUBE_COUNT]);
+
     return (
         <group>
             {/* Volumetric Fog matching BG */}
             <fog attach="fog" args={[theme.bg_gradient[0], 10, 500]} />
             
-            <Instances range={CUBE_COUNT}>
+            <instancedMesh ref={meshRef} args={[undefined, undefined, CUBE_COUNT]}>
                 <boxGeometry args={[1, 1, 1]} />
                 <meshStandardMaterial 
                     color={theme.accent_secondary} 
@@ -210,15 +235,7 @@ export const InfiniteTunnel: React.FC<{ theme: Theme }> = ({ theme }) => {
                     emissiveIntensity={0.5}
                     roughness={0.1}
                 />
-                {particles.map((data, i) => (
-                    <Instance
-                        key={i}
-                        position={[data.x, data.y, data.z]}
-                        scale={[data.scale, data.scale, data.scale]}
-                        rotation={[Math.random() * Math.PI, Math.random() * Math.PI, 0]}
-                    />
-                ))}
-            </Instances>
+            </instancedMesh>
         </group>
     );
 };
@@ -277,7 +294,7 @@ export const KnowledgeSlate: React.FC<Props> = ({ theme, position, isPlaying })
 """
 
 def get_src_components_scene1():
-    return """import React, { useMemo, useRef } from 'react';
+    return """import React, { useLayoutEffect, useMemo, useRef } from 'react';
 import { AbsoluteFill, useCurrentFrame, useVideoConfig, interpolate } from 'remotion';
 import { ThreeCanvas } from '@remotion/three';
 import { Text3D, Billboard, CatmullRomLine, PerspectiveCamera } from '@react-three/drei';
@@ -315,13 +332,21 @@ export const Scene1_Hook: React.FC<SceneProps> = ({ theme, hookText }) => {
         ]);
     }, [TARGET_COORDINATE]);
 
-    // Animate Camera along path
-    const cameraProgress = interpolate(frame, [0, DURATION_SEARCH], [0, 1], {
-        extrapolateRight: "clamp",
-        easing: easings.searchPath // [cite: 150] Non-Linear Speed Ramp
-    });
+    // Animate Camera along path: spline sampled once per frame of the search
+    // (SoA xyz Float32Array), then looked up per render instead of getPoint()
+    const camPositions = useMemo(() => {
+        const frames = Math.ceil(DURATION_SEARCH) + 1;
+        const arr = new Float32Array(frames * 3);
+        for (let f = 0; f < frames; f++) {
+            // [cite: 150] Non-Linear Speed Ramp, clamped at the end of the path
+            const p = curve.getPoint(easings.searchPath(Math.min(f / DURATION_SEARCH, 1)));
+            arr[f * 3] = p.x; arr[f * 3 + 1] = p.y; arr[f * 3 + 2] = p.z;
+        }
+        return arr;
+    }, [curve, DURATION_SEARCH]);
     
-    const camPos = curve.getPoint(cameraProgress);
+    const camIndex = Math.min(Math.max(Math.round(frame), 0), camPositions.length / 3 - 1);
+    const camPos = new THREE.Vector3(camPositions[camIndex * 3], camPositions[camIndex * 3 + 1], camPositions[camIndex * 3 + 2]);
     const camLookAt = new THREE.Vector3(TARGET_COORDINATE.x, TARGET_COORDINATE.y, TARGET_COORDINATE.z);
 
     // 1.3 HOOK TEXT ANIMATION 
@@ -414,27 +439,52 @@ export const Scene1_Hook: React.FC<SceneProps> = ({ theme, hookText }) => {
 };
 
 // Simple Particle Explosion Helper
+const EXPLOSION_COUNT = 50;
+
 const Explosion = ({ origin, theme, startTime }: any) => {
     const frame = useCurrentFrame();
     const progress = (frame - startTime) * 0.5;
+    const meshRef = useRef<THREE.InstancedMesh>(null);
     
-    // Create 50 random debris chunks
+    // Create 50 random debris chunks (SoA typed arrays: unit dir xyz, speed, scale)
     const particles = useMemo(() => {
-        return new Array(50).fill(0).map(() => ({
-            dir: new THREE.Vector3(Math.random()-0.5, Math.random()-0.5, Math.random()-0.5).normalize(),
-            speed: Math.random() * 2 + 1,
-            scale: Math.random() * 0.5
-        }));
+        const dirs = new Float32Array(EXPLOSION_COUNT * 3);
+        const speeds = new Float32Array(EXPLOSION_COUNT);
+        const scales = new Float32Array(EXPLOSION_COUNT);
+        const v = new THREE.Vector3();
+        for (let i = 0; i < EXPLOSION_COUNT; i++) {
+            v.set(Math.random()-0.5, Math.random()-0.5, Math.random()-0.5).normalize();
+            dirs[i*3] = v.x; dirs[i*3+1] = v.y; dirs[i*3+2] = v.z;
+            speeds[i] = Math.random() * 2 + 1;
+            scales[i] = Math.random() * 0.5;
+        }
+        return { dirs, speeds, scales };
     }, []);
 
+    // One instanced mesh; matrices rewritten per frame in a single loop
+    useLayoutEffect(() => {
+        const mesh = meshRef.current;
+        if (!mesh) return;
+        const { dirs, speeds, scales } = particles;
+        const matrix = new THREE.Matrix4();
+        const pos = new THREE.Vector3();
+        const quat = new THREE.Quaternion().setFromEuler(new THREE.Euler(progress, progress, 0));
+        const scale = new THREE.Vector3();
+        for (let i = 0; i < EXPLOSION_COUNT; i++) {
+            const dist = progress * speeds[i] * 5;
+            pos.set(dirs[i*3] * dist, dirs[i*3+1] * dist, dirs[i*3+2] * dist);
+            scale.setScalar(scales[i]);
+            mesh.setMatrixAt(i, matrix.compose(pos, quat, scale));
+        }
+        mesh.instanceMatrix.needsUpdate = true;
+    }, [particles, progress]);
+
     return (
         <group position={[origin.x, origin.y, origin.z]}>
-            {particles.map((p, i) => (
-                <mesh key={i} position={p.dir.clone().multiplyScalar(progress * p.speed * 5)} rotation={[progress, progress, 0]}>
-                    <boxGeometry args={[p.scale, p.scale, p.scale]} />
-                    <meshBasicMaterial color={theme.accent_secondary} transparent opacity={1 - (progress/10)} />
-                </mesh>
-            ))}
+            <instancedMesh ref={meshRef} args={[undefined, undefined, EXPLOSION_COUNT]}>
+                <boxGeometry args={[1, 1, 1]} />
+                <meshBasicMaterial color={theme.accent_secondary} transparent opacity={1 - (progress/10)} />
+            </instancedMesh>
         </group>
     );
 };
@@ -481,12 +531,17 @@ def get_public_scenario():
 # EXECUTION
 # ==========================================
 
+def create_files(files):
+    """Writes (path, content) pairs; each parent dir is created once, bytes written in binary mode."""
+    for d in {os.path.dirname(os.path.join(ROOT_DIR, p)) for p, _ in files}:
+        os.makedirs(d, exist_ok=True)
+    for path, content in files:
+        with open(os.path.join(ROOT_DIR, path), "wb", buffering=1 << 20) as f:
+            f.write(content.encode("utf-8"))
+    sys.stdout.write("".join(f"Created: {path}\n" for path, _ in files))
+
 def create_file(path, content):
-    full_path = os.path.join(ROOT_DIR, path)
-    os.makedirs(os.path.dirname(full_path), exist_ok=True)
-    with open(full_path, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"Created: {path}")
+    create_files([(path, content)])
 
 def run_command(command, cwd):
     print(f"Running: {command}")
@@ -499,24 +554,27 @@ def main():
     os.makedirs(ROOT_DIR, exist_ok=True)
     
     # 2. Write Config Files
-    create_file("package.json", get_package_json())
-    create_file("tsconfig.json", get_tsconfig())
-    create_file("remotion.config.ts", get_remotion_config())
-    
-    # 3. Write Source Code
-    create_file("src/index.ts", get_src_index())
-    create_file("src/Root.tsx", get_src_root())
-    create_file("src/constants.ts", get_src_constants())
-    create_file("src/theme/palettes.ts", get_src_theme_palettes())
-    create_file("src/utils/animation.ts", get_src_utils_animation())
-    
-    # 4. Write Components
-    create_file("src/components/3d/InfiniteTunnel.tsx", get_src_components_3d_tunnel())
-    create_file("src/components/3d/KnowledgeSlate.tsx", get_src_components_3d_slate())
-    create_file("src/components/scenes/Scene1_Hook.tsx", get_src_components_scene1())
-    
-    # 5. Write Public Assets (Mock)
-    create_file("public/scenario.json", get_public_scenario())
+    files = [
+        ("package.json", get_package_json()),
+        ("tsconfig.json", get_tsconfig()),
+        ("remotion.config.ts", get_remotion_config()),
+        
+        # 3. Write Source Code
+        ("src/index.ts", get_src_index()),
+        ("src/Root.tsx", get_src_root()),
+        ("src/constants.ts", get_src_constants()),
+        ("src/theme/palettes.ts", get_src_theme_palettes()),
+        ("src/utils/animation.ts", get_src_utils_animation()),
+        
+        # 4. Write Components
+        ("src/components/3d/InfiniteTunnel.tsx", get_src_components_3d_tunnel()),
+        ("src/components/3d/KnowledgeSlate.tsx", get_src_components_3d_slate()),
+        ("src/components/scenes/Scene1_Hook.tsx", get_src_components_scene1()),
+        
+        # 5. Write Public Assets (Mock)
+        ("public/scenario.json", get_public_scenario()),
+    ]
+    create_files(files)
     
     # 6. Create Asset Folders
     os.makedirs(os.path.join(ROOT_DIR, "public/assets/fonts"), exist_ok=True)
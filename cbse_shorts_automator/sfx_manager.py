@@ -4,9 +4,40 @@ Handles the mixing and timing of sound effects.
 """
 import os
 import random  # <--- NEW
+import numpy as np
 from moviepy.editor import AudioFileClip
+from moviepy.audio.AudioClip import AudioArrayClip
 from moviepy.audio.fx.all import audio_normalize # <--- NEW
 
+# Relative levels applied on top of peak normalization (see get_clip)
+MIX_LEVELS = {
+    'whoosh': 0.15, 'swish_low': 0.25, 'flip': 0.15,
+    'glitch': 0.12, 'shutter': 0.15, 'notification': 0.15,
+    'zip': 0.2, 'keyboard': 0.25, 'marker': 0.2,
+}
+
+# path -> peak-normalized float32 stereo samples (decoded once per process)
+_SAMPLE_CACHE = {}
+
+def _normalized_samples(path, fps):
+    key = (path, fps)
+    arr = _SAMPLE_CACHE.get(key)
+    if arr is None:
+        clip = AudioFileClip(path)
+        try:
+            arr = clip.to_soundarray(fps=fps).astype(np.float32)
+        finally:
+            clip.close()
+        if arr.ndim == 1:
+            arr = arr[:, None]
+        if arr.shape[1] == 1:
+            arr = np.repeat(arr, 2, axis=1)
+        peak = float(np.abs(arr).max()) if arr.size else 0.0
+        if peak > 0:
+            arr /= peak
+        _SAMPLE_CACHE[key] = arr
+    return arr
+
 class SFXManager:
     def __init__(self, config_dir='config/sfx'):
         self.config_dir = config_dir
@@ -36,16 +67,8 @@ class SFXManager:
         Loads an audio clip, sets its start time and volume.
         Handles list randomization and audio normalization.
         """
-        asset = self.assets.get(name)
-        if not asset: return None
-        
-        # Handle Randomization
-        filename = random.choice(asset) if isinstance(asset, list) else asset
-        
-        path = os.path.join(self.config_dir, filename)
-        if not os.path.exists(path):
-            if name == 'pop': path = path.replace('.mp3', '.wav')
-            if not os.path.exists(path): return None
+        path = self._resolve_path(name)
+        if path is None: return None
 
         try:
             clip = AudioFileClip(path)
@@ -56,42 +79,41 @@ class SFXManager:
             except Exception: pass # Fallback if normalization fails
 
             # 2. APPLY MIXING RULES (Adjust relative to normalized 0dB)
-            if name == 'whoosh': volume *= 0.15      # Reduced for normalized audio
-            if name == 'swish_low': volume *= 0.25
-            if name == 'flip': volume *= 0.15
-            
-            # New Categories
-            if name == 'glitch': volume *= 0.12      # High energy, keep low
-            if name == 'shutter': volume *= 0.15     # Sharp transient
-            if name == 'notification': volume *= 0.15
-            if name == 'zip': volume *= 0.2
-            if name == 'keyboard': volume *= 0.25
-            if name == 'marker': volume *= 0.2
+            volume *= MIX_LEVELS.get(name, 1.0)
             
             return clip.set_start(start_time).volumex(volume)
         except Exception as e:
             print(f"⚠️ SFX Load Error ({name}): {e}")
             return None
 
-    def generate_quiz_sfx(self, timings):
-        """
-        Generates the standard SFX layer for a Quiz.
-        timings: dict with keys 'q', 'a', 'b', 'c', 'd', 'think', 'ans'
-        """
-        sfx_layer = []
+    def _resolve_path(self, name):
+        """Picks the file for a logical SFX name (randomized pools), or None if missing."""
+        asset = self.assets.get(name)
+        if not asset: return None
+        
+        # Handle Randomization
+        filename = random.choice(asset) if isinstance(asset, list) else asset
+        
+        path = os.path.join(self.config_dir, filename)
+        if not os.path.exists(path):
+            if name == 'pop': path = path.replace('.mp3', '.wav')
+            if not os.path.exists(path): return None
+        return path
+
+    def _quiz_sfx_events(self, timings):
+        """(name, start_time, volume) for the standard quiz SFX layer."""
+        events = []
 
         # 1. Transition to Question (Whoosh)
         if 'q' in timings:
             # Trigger 0.2s before the text appears
-            clp = self.get_clip('whoosh', start_time=timings['q'] - 0.2, volume=0.5)
-            if clp: sfx_layer.append(clp)
+            events.append(('whoosh', timings['q'] - 0.2, 0.5))
 
         # 2. Options appearing (Pop)
         for key in ['a', 'b', 'c', 'd']:
             if key in timings:
                 # Volume reduced to 0.15 (15%) as requested (further reduction from 0.2)
-                clp = self.get_clip('pop', start_time=timings[key], volume=0.15)
-                if clp: sfx_layer.append(clp)
+                events.append(('pop', timings[key], 0.15))
 
         # 3. The Timer (Quad Speed Ticks)
         # We want 4 ticks per second for 3 seconds = 12 ticks total
@@ -99,26 +121,55 @@ class SFXManager:
             start = timings['think']
             # Create ticks at 0.0, 0.25, 0.50, 0.75...
             for i in range(12): 
-                offset = i * 0.25
-                clp = self.get_clip('tick', start_time=start + offset, volume=0.6)
-                if clp: sfx_layer.append(clp)
+                events.append(('tick', start + i * 0.25, 0.6))
 
         # 4. The Answer Reveal (Chime)
         if 'ans' in timings:
-            clp = self.get_clip('success', start_time=timings['ans'], volume=0.7)
-            if clp: sfx_layer.append(clp)
+            events.append(('success', timings['ans'], 0.7))
 
         # 5. The CTA (Paper Slide - Subtle Transition)
         if 'cta' in timings:
-            clp = self.get_clip('flip', start_time=timings['cta'], volume=1.0)
-            if clp: sfx_layer.append(clp)
+            events.append(('flip', timings['cta'], 1.0))
 
         # 6. The Outro (Deep Swish - Finality)
         if 'outro' in timings:
-            clp = self.get_clip('swish_low', start_time=timings['outro'], volume=0.6)
-            if clp: sfx_layer.append(clp)
+            events.append(('swish_low', timings['outro'], 0.6))
+
+        return events
 
+    def generate_quiz_sfx(self, timings):
+        """
+        Generates the standard SFX layer for a Quiz.
+        timings: dict with keys 'q', 'a', 'b', 'c', 'd', 'think', 'ans'
+        """
+        sfx_layer = []
+        for name, start, volume in self._quiz_sfx_events(timings):
+            clp = self.get_clip(name, start_time=start, volume=volume)
+            if clp: sfx_layer.append(clp)
         return sfx_layer
+
+    def generate_quiz_sfx_mixed(self, timings, total_dur, fps=44100):
+        """
+        Same layer as generate_quiz_sfx, pre-mixed into ONE stereo AudioArrayClip
+        (samples added at their offsets), so the final mix sees a single SFX stream.
+        """
+        n_total = int(total_dur * fps)
+        mix = np.zeros((n_total, 2), dtype=np.float32)
+        for name, start, volume in self._quiz_sfx_events(timings):
+            path = self._resolve_path(name)
+            if path is None: continue
+            try:
+                samples = _normalized_samples(path, fps)
+            except Exception as e:
+                print(f"⚠️ SFX Load Error ({name}): {e}")
+                continue
+            i0 = int(round(start * fps))
+            src = samples[max(0, -i0):]
+            i0 = max(0, i0)
+            n = min(len(src), n_total - i0)
+            if n > 0:
+                mix[i0:i0 + n] += src[:n] * (volume * MIX_LEVELS.get(name, 1.0))
+        return AudioArrayClip(mix, fps=fps)
     
     def generate_fact_sfx(self, timings):
         """
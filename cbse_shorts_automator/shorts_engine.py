@@ -8,20 +8,40 @@ UPDATED: Stickers SUSPENDED (Bypass Mode) for stability.
 import imagemagick_setup
 import os
 import json
+import math
 import random
 import textwrap
 import glob
+import copy
+import hashlib
+import importlib
+import subprocess
+from functools import lru_cache
+import numpy as np
+import moviepy.config as mpconf
+from moviepy.config import get_setting
+from moviepy.tools import find_extension
 from moviepy.editor import (
     VideoFileClip, TextClip, CompositeVideoClip, 
     AudioFileClip, ColorClip, CompositeAudioClip,
     ImageClip, vfx
 )
 
-from moviepy.audio.fx.all import audio_normalize
+from moviepy.audio.AudioClip import AudioArrayClip
 from voice_manager import VoiceManager
 from effects_manager import EffectsManager 
 from visual_effects_quiz import FPS
 
+# Template registry, imported once; a template that fails to import is just unavailable
+_TEMPLATES = {}
+for _t_type, _module, _cls in (('quiz', 'template_quiz_json_generator', 'QuizTemplate'),
+                               ('fact', 'template_fact', 'FactTemplate'),
+                               ('tip', 'template_tip', 'TipTemplate')):
+    try:
+        _TEMPLATES[_t_type] = getattr(importlib.import_module(_module), _cls)
+    except ImportError as e:
+        print(f"⚠️ Template '{_t_type}' unavailable: {e}")
+
 # Theme configurations
 THEMES = {
     'energetic_yellow': {
@@ -46,57 +66,248 @@ THEMES = {
     }
 }
 
+def _parse_hex(hex_str):
+    h = hex_str.lstrip('#')
+    return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16))
+
+# Parsed once at import so render paths read ints/hex strings instead of re-parsing
+for _t in THEMES.values():
+    _t['highlight_rgb'] = _parse_hex(_t['highlight'])
+    _t['correct_rgb'] = _parse_hex(_t['correct'])
+    _t['bg_hex'] = '#%02x%02x%02x' % _t['bg_color']
+
+_RGB2HEX = {}
+
+def to_hex(c):
+    """'#rrggbb' for an RGB tuple/list (memoized); strings and None pass through."""
+    if isinstance(c, (tuple, list)):
+        key = (int(c[0]), int(c[1]), int(c[2]))
+        hx = _RGB2HEX.get(key)
+        if hx is None:
+            hx = _RGB2HEX[key] = '#%02x%02x%02x' % key
+        return hx
+    return c
+
+# Contrast text color for every theme swatch, computed once in a single vectorized pass
+_PALETTE_HEX = sorted({c for t in THEMES.values() for c in (t['highlight'], t['correct'])})
+_PALETTE_RGB = np.array([_parse_hex(h) for h in _PALETTE_HEX], dtype=np.uint8)
+_PALETTE_LUM = (_PALETTE_RGB @ np.array([0.299, 0.587, 0.114], dtype=np.float32)) / 255.0
+_CONTRAST_BY_HEX = dict(zip(_PALETTE_HEX, np.where(_PALETTE_LUM > 0.5, 'black', 'white').tolist()))
+
+def contrast_for_hex(hex_str):
+    """'black' or 'white' text for a '#RRGGBB' background (table lookup for theme colors)."""
+    cached = _CONTRAST_BY_HEX.get(hex_str)
+    if cached is not None:
+        return cached
+    r, g, b = _parse_hex(hex_str)
+    # Calculate luminance (Human eye perception)
+    luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
+    
+    # CHANGED: Threshold lowered from 0.6 to 0.5
+    # This means "Black Text" triggers earlier (on medium colors), avoiding white-on-light-green.
+    return 'black' if luminance > 0.5 else 'white'
+
 FONT_REGULAR = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
 FONT_BOLD = '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf'
 WIDTH = 1080
 HEIGHT = 1920
 
+# Outro logo pulse (1s period) sampled once per frame of the cycle
+_PULSE_LUT = (1.0 + 0.05 * (1 - np.abs((np.arange(FPS) / FPS) - 0.5) * 2)).tolist()
+
+BGM_FPS = 44100
+# track path -> decoded float32 stereo samples at BGM_FPS (shared across shorts). Loads
+# from disk are memory-mapped, so a process only pages in the tracks it actually mixes.
+_BGM_CACHE = {}
+# track path -> peak |sample| over the whole decoded track (what audio_normalize used)
+_BGM_PEAK = {}
+# Decoded tracks cost ~60 MB per 3 minutes; the least recently used .npy files beyond
+# this total are deleted after each new decode
+_BGM_DISK_CAP = 1 << 30
+
+def _prune_bgm_cache(cache_dir, keep):
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith('.npy') and entry.path != keep:
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, entry.path))
+    total = sum(size for _, size, _ in entries) + os.path.getsize(keep)
+    for _, size, path in sorted(entries):
+        if total <= _BGM_DISK_CAP:
+            break
+        try:
+            os.remove(path)  # A worker that already mapped it keeps its (unlinked) copy
+        except OSError:
+            pass
+        total -= size
+
+def _load_bgm_array(path, cache_dir):
+    """
+    Decodes a music track once per process; the samples are also persisted as .npy
+    (keyed by path/size/mtime) so later runs skip the FFmpeg decode entirely.
+    """
+    arr = _BGM_CACHE.get(path)
+    if arr is not None:
+        return arr
+    st = os.stat(path)
+    key = hashlib.blake2b(f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}".encode('utf-8'), digest_size=16).hexdigest()
+    npy_path = os.path.join(cache_dir, f"{key}.npy")
+    if os.path.exists(npy_path):
+        arr = np.load(npy_path, mmap_mode='r')
+        try:
+            os.utime(npy_path)  # Recency for _prune_bgm_cache
+        except OSError:
+            pass
+    else:
+        clip = AudioFileClip(path)
+        try:
+            arr = clip.to_soundarray(fps=BGM_FPS).astype(np.float32)
+        finally:
+            clip.close()
+        os.makedirs(cache_dir, exist_ok=True)
+        # Saved beside the final name so another worker or a later run never loads a partial .npy
+        tmp = f"{npy_path[:-4]}.{os.getpid()}.npy"
+        np.save(tmp, arr)
+        os.replace(tmp, npy_path)
+        _prune_bgm_cache(cache_dir, npy_path)
+    _BGM_CACHE[path] = arr
+    _BGM_PEAK[path] = max(float(arr.max()), -float(arr.min()))
+    return arr
+
+@lru_cache(maxsize=1024)
+def _wrap(text, width):
+    # Same text is re-styled many times (options, highlights); wrap it once
+    return "\n".join(textwrap.wrap(text, width=width))
+
+@lru_cache(maxsize=512)
+def _load_text_png(png_path):
+    """Decoded RGBA text rasterization; MoviePy's set_* return copies so sharing is safe."""
+    return ImageClip(png_path, transparent=True)
+
+# Directories already created in this process (engines are built once per short/worker)
+_DIRS_READY = set()
+
+def _ensure_dirs(paths):
+    """
+    Creates any missing directories in `paths`. One scandir per distinct parent
+    replaces an exists()+makedirs() pair per path; results are remembered per process.
+    """
+    by_parent = {}
+    for p in paths:
+        if p not in _DIRS_READY:
+            p = os.path.normpath(p)
+            by_parent.setdefault(os.path.dirname(p) or '.', []).append(p)
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                present = {os.path.normpath(e.path) for e in it if e.is_dir()}
+        except FileNotFoundError:
+            present = set()
+        for d in children:
+            if d not in present:
+                os.makedirs(d, exist_ok=True)
+    _DIRS_READY.update(paths)
+
+@lru_cache(maxsize=4)
+def _load_cfg(config_path):
+    """Parsed generator config; written with defaults on first use if missing."""
+    _ensure_dirs([os.path.dirname(config_path) or '.'])
+    if not os.path.exists(config_path):
+        with open(config_path, 'w') as f:
+            json.dump({
+                "MAX_ROWS_TO_PROCESS": 10, 
+                "DELETE_TEMP_FILES": True, 
+                "CHANNEL_NAME": "NCERT QuickPrep",
+                "DIRS": {"TEMP": "temp", "OUTPUT": "shorts", "DOWNLOADS": "downloads"}
+            }, f)
+    with open(config_path, 'rb') as f:
+        return json.loads(f.read())
+
 class ShortsEngine:
     def __init__(self, config_path='config/generator_config.json'):
-        if not os.path.exists('config'): os.makedirs('config')
-        if not os.path.exists(config_path):
-            with open(config_path, 'w') as f:
-                json.dump({
-                    "MAX_ROWS_TO_PROCESS": 10, 
-                    "DELETE_TEMP_FILES": True, 
-                    "CHANNEL_NAME": "NCERT QuickPrep",
-                    "DIRS": {"TEMP": "temp", "OUTPUT": "shorts", "DOWNLOADS": "downloads"}
-                }, f)
-        
-        with open(config_path, 'r') as f: self.config = json.load(f)
+        # Deep copy: callers mutate nested keys (e.g. DIRS.TEMP per worker)
+        self.config = copy.deepcopy(_load_cfg(config_path))
         
         self.channel_name = self.config.get('CHANNEL_NAME', 'SUBSCRIBE NOW')
+        # x264 threads per render (lowered by parallel batch workers)
+        self.render_threads = 4
+        self.x264_preset = 'veryfast'
+        self.x264_crf = 23
+        self.audio_codec = 'aac'
         self.logo_path = 'config/logo.png'
+        # Decoded (and downscaled) once; create_outro only sets duration per short
+        self._logo_base = None
+        if os.path.exists(self.logo_path):
+            try:
+                lg = ImageClip(self.logo_path)
+                if lg.w > 450 or lg.h > 450: lg = lg.resize(height=450)
+                self._logo_base = lg
+            except Exception as e:
+                print(f"⚠️ Logo error: {e}")
         
         self.music_dir = 'config/music'
-        if not os.path.exists(self.music_dir):
-            os.makedirs(self.music_dir)
-            for mood in ['energetic', 'calm', 'funky']:
-                os.makedirs(os.path.join(self.music_dir, mood), exist_ok=True)
+        temp_dir = self.config['DIRS']['TEMP']
+        # Rasterized TextClips, reused across shorts (see create_text_clip)
+        self.textcache_dir = os.path.join(temp_dir, 'textcache')
+        _ensure_dirs([self.music_dir] + [os.path.join(self.music_dir, m) for m in ('energetic', 'calm', 'funky')]
+                     + [temp_dir, self.textcache_dir])
+        self.refresh_music_index()
         
         # Initialize Visual FX Manager (Loaded but not used in bypass mode)
         self.fx_manager = EffectsManager()
 
         self.voice_manager = VoiceManager()
+        # Template helpers, built on first use and shared by every short this engine renders
+        self._sfx_mgr = None
+        self._video_proc = None
+        self._karaoke_mgr = None
 
-        import moviepy.config as mpconf
-        temp_dir = self.config['DIRS']['TEMP']
-        os.makedirs(temp_dir, exist_ok=True)
         mpconf.TEMP_DIR = temp_dir 
 
+    # --- Shared template helpers (temp_dir follows config['DIRS']['TEMP'], which batch workers override) ---
+    @property
+    def sfx_mgr(self):
+        if self._sfx_mgr is None:
+            from sfx_manager import SFXManager
+            self._sfx_mgr = SFXManager()
+        return self._sfx_mgr
+
+    @property
+    def video_proc(self):
+        temp_dir = self.config['DIRS']['TEMP']
+        if self._video_proc is None:
+            from video_processor import VideoProcessor
+            self._video_proc = VideoProcessor(temp_dir=temp_dir)
+        self._video_proc.temp_dir = temp_dir
+        return self._video_proc
+
+    @property
+    def karaoke_mgr(self):
+        temp_dir = self.config['DIRS']['TEMP']
+        if self._karaoke_mgr is None:
+            from karaoke_manager import KaraokeManager
+            self._karaoke_mgr = KaraokeManager(self.voice_manager, temp_dir)
+        self._karaoke_mgr.temp_dir = temp_dir
+        return self._karaoke_mgr
+
+    def refresh_music_index(self):
+        """Re-scans config/music (call after adding tracks in a long-running process)."""
+        fallback = glob.glob(os.path.join(self.music_dir, "*.mp3"))
+        moods = {t['music_mood'] for t in THEMES.values()} | {'energetic', 'calm', 'funky'}
+        self._music_index = {
+            m: glob.glob(os.path.join(self.music_dir, m, "*.mp3")) or fallback for m in moods
+        }
+        self._music_fallback = fallback
+
     def get_theme(self, theme_name='energetic_yellow'):
         return THEMES.get(theme_name, THEMES['energetic_yellow'])
 
     def get_contrast_color(self, bg_color_hex):
         if not bg_color_hex or not isinstance(bg_color_hex, str): return 'white'
-        hex_color = bg_color_hex.lstrip('#')
-        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        # Calculate luminance (Human eye perception)
-        luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
-        
-        # CHANGED: Threshold lowered from 0.6 to 0.5
-        # This means "Black Text" triggers earlier (on medium colors), avoiding white-on-light-green.
-        return 'black' if luminance > 0.5 else 'white'
+        return contrast_for_hex(bg_color_hex)
 
     # === BYPASS MODE: SKIPS STICKERS ===
     def render_with_effects(self, video_clip, script_data, output_path):
@@ -110,52 +321,131 @@ class ShortsEngine:
         # and just render the raw clip directly.
         
         print(f"🎬 Rendering final video to: {output_path}")
+        # Falls back only when the pipe could not be set up; a failure mid-stream is raised
+        if self.write_yuv420p(video_clip, output_path):
+            return
+        print("   ↪ Using write_videofile...")
         video_clip.write_videofile(
             output_path,
             fps=FPS,
             codec='libx264',
-            audio_codec='aac',
-            threads=4,
-            preset='ultrafast' # Keeps the speed gain
+            audio_codec=self.audio_codec,
+            threads=self.render_threads,
+            preset=self.x264_preset,
+            ffmpeg_params=['-crf', str(self.x264_crf)]
         )
 
-    def create_outro(self, duration, cta_text="SUBSCRIBE FOR MORE!"):
-        bg_color = (255, 255, 255) 
-        bg = ColorClip(size=(WIDTH, HEIGHT), color=bg_color, duration=duration)
-        clips = [bg]
-        center_y = HEIGHT / 2
-        
-        if os.path.exists(self.logo_path):
+    def moviepy_temp_audio_path(self, output_path):
+        """
+        The temp audio write_videofile leaves in the CWD if a render is interrupted:
+        <output stem>TEMP_MPY_wvf_snd.<ext>, with ext picked by MoviePy for self.audio_codec.
+        """
+        stem = os.path.splitext(os.path.basename(output_path))[0]
+        return f"{stem}TEMP_MPY_wvf_snd.{find_extension(self.audio_codec)}"
+
+    def write_yuv420p(self, video_clip, output_path):
+        """
+        Encodes a MoviePy clip by piping I420 frames (1.5 B/px vs 3 B/px RGB24) to ffmpeg,
+        so x264 gets its native format and no swscale conversion runs in the encoder.
+        Returns False, having written nothing, if the pipe cannot be set up (no cv2, odd
+        frame size, ffmpeg not spawnable). Once frames are streaming, errors are raised
+        and the partial output_path is removed.
+        """
+        try:
+            import cv2
+        except ImportError:
+            print("⚠️ YUV pipe unavailable: cv2 is not installed")
+            return False
+        w, h = video_clip.size
+        if w % 2 or h % 2:
+            print(f"⚠️ YUV pipe unavailable: odd frame size {w}x{h}")
+            return False
+        stem = os.path.splitext(os.path.basename(output_path))[0]
+        audio_path = None
+        try:
+            if video_clip.audio is not None:
+                audio_path = os.path.join(self.config['DIRS']['TEMP'], f"{stem}_audio.m4a")
+                video_clip.audio.write_audiofile(audio_path, fps=44100, codec='aac', logger=None)
+            cmd = [get_setting("FFMPEG_BINARY"), '-y', '-loglevel', 'error',
+                   '-f', 'rawvideo', '-pix_fmt', 'yuv420p', '-s', f"{w}x{h}", '-r', str(FPS), '-i', '-']
+            if audio_path:
+                cmd += ['-i', audio_path, '-map', '0:v', '-map', '1:a', '-c:a', 'copy']
+            cmd += ['-c:v', 'libx264', '-preset', self.x264_preset, '-crf', str(self.x264_crf),
+                    '-threads', str(self.render_threads), '-pix_fmt', 'yuv420p', output_path]
             try:
-                logo = ImageClip(self.logo_path).set_duration(duration)
-                if logo.w > 450 or logo.h > 450: logo = logo.resize(height=450)
-                
-                def pulse(t): return 1.0 + 0.05 * (1 - abs((t % 1.0) - 0.5) * 2)
-                logo = logo.resize(pulse).set_position(('center', center_y - 200))
-                clips.append(logo)
-                
-                name_clip = TextClip(
-                    self.channel_name.upper(),
-                    fontsize=60, color='black', font=FONT_BOLD,
-                    stroke_color='black', stroke_width=2
-                ).set_position(('center', center_y + 300)).set_duration(duration)
-                clips.append(name_clip)
-            except Exception as e:
-                print(f"⚠️ Logo error: {e}")
-                txt = TextClip(self.channel_name, fontsize=80, color='black', font=FONT_BOLD).set_position('center').set_duration(duration)
-                clips.append(txt)
+                proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+            except OSError as e:
+                print(f"⚠️ YUV pipe unavailable: could not start ffmpeg ({e})")
+                return False
+            try:
+                for frame in video_clip.iter_frames(fps=FPS, dtype='uint8'):
+                    proc.stdin.write(cv2.cvtColor(frame[:, :, :3], cv2.COLOR_RGB2YUV_I420).tobytes())
+                proc.stdin.close()
+                if proc.wait() != 0:
+                    raise RuntimeError(f"ffmpeg exited with {proc.returncode}")
+            except BaseException:
+                proc.kill()
+                proc.wait()
+                try: os.remove(output_path)
+                except OSError: pass
+                raise
+            return True
+        finally:
+            if audio_path:
+                try: os.remove(audio_path)
+                except OSError: pass
+
+    def _outro_base_png(self, layout, cta_text):
+        """
+        Static outro layers (white bg + text) flattened once to a PNG; the key includes
+        channel_name/cta_text so a rename produces a fresh image.
+        layout: 'logo' (name under the logo), 'fallback' (logo failed) or 'text' (no logo file).
+        """
+        key = hashlib.blake2b(repr(('outro', layout, self.channel_name, cta_text)).encode('utf-8'), digest_size=16).hexdigest()
+        png_path = os.path.join(self.textcache_dir, f"outro_{key}.png")
+        if os.path.exists(png_path):
+            return png_path
+        
+        clips = [ColorClip(size=(WIDTH, HEIGHT), color=(255, 255, 255), duration=1)]
+        center_y = HEIGHT / 2
+        if layout == 'logo':
+            clips.append(TextClip(
+                self.channel_name.upper(),
+                fontsize=60, color='black', font=FONT_BOLD,
+                stroke_color='black', stroke_width=2
+            ).set_position(('center', center_y + 300)))
+        elif layout == 'fallback':
+            clips.append(TextClip(self.channel_name, fontsize=80, color='black', font=FONT_BOLD).set_position('center'))
         else:
-            name_clip = TextClip(
+            clips.append(TextClip(
                 self.channel_name.upper(),
                 fontsize=85, color='black', font=FONT_BOLD
-            ).set_position(('center', center_y - 50)).set_duration(duration)
-            
-            cta_clip = TextClip(
+            ).set_position(('center', center_y - 50)))
+            clips.append(TextClip(
                 cta_text,
                 fontsize=50, color='black', font=FONT_BOLD
-            ).set_position(('center', center_y + 100)).set_duration(duration)
-            
-            clips.extend([name_clip, cta_clip])
+            ).set_position(('center', center_y + 100)))
+        # Written beside the final name so a crash or a parallel worker never leaves a partial PNG
+        tmp = f"{png_path[:-4]}.{os.getpid()}.png"
+        CompositeVideoClip([c.set_duration(1) for c in clips], size=(WIDTH, HEIGHT)).save_frame(tmp, t=0)
+        os.replace(tmp, png_path)
+        return png_path
+
+    def create_outro(self, duration, cta_text="SUBSCRIBE FOR MORE!"):
+        center_y = HEIGHT / 2
+        
+        # Only the pulsing logo is animated; everything else is one pre-rendered frame
+        layout = 'text'
+        if os.path.exists(self.logo_path):
+            layout = 'logo' if self._logo_base is not None else 'fallback'
+            if layout == 'fallback':
+                print("⚠️ Logo error: logo could not be decoded")
+        
+        clips = [ImageClip(self._outro_base_png(layout, cta_text)).set_duration(duration)]
+        if layout == 'logo':
+            logo = self._logo_base.set_duration(duration)
+            logo = logo.resize(lambda t: _PULSE_LUT[int(t * FPS + 0.5) % FPS]).set_position(('center', center_y - 200))
+            clips.append(logo)
 
         return CompositeVideoClip(clips, size=(WIDTH, HEIGHT)).crossfadein(0.5)
 
@@ -167,8 +457,7 @@ class ShortsEngine:
         # Handle different color formats
         if isinstance(bg_color, str):
             if bg_color.startswith('#'):
-                hex_color = bg_color.lstrip('#')
-                r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+                r, g, b = _parse_hex(bg_color)
             else:
                 return 'white'  # Fallback
         elif isinstance(bg_color, (tuple, list)):
@@ -195,9 +484,8 @@ class ShortsEngine:
         Returns:
             CompositeVideoClip with animated outro
         """
-        from visual_effects_quiz import res_scale, WIDTH, HEIGHT
+        from visual_effects_quiz import res_scale, WIDTH, HEIGHT, _blend_rect
         from usp_content_variations import USPContent
-        import math
         
         clips = []
         
@@ -207,36 +495,31 @@ class ShortsEngine:
         
         # Main background (theme's bg_color)
         bg_color = theme.get('bg_color', (15, 23, 42))
-        bg = ColorClip(size=(WIDTH, HEIGHT), color=bg_color, duration=duration)
-        clips.append(bg)
         
         # Radial gradient overlay (theme's highlight color)
         highlight_color = theme.get('highlight', '#FACC15')
-        if isinstance(highlight_color, str) and highlight_color.startswith('#'):
-            hex_color = highlight_color.lstrip('#')
-            highlight_rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        else:
-            highlight_rgb = highlight_color
-        
-        # Create 3-layer radial gradient (centered)
+        highlight_rgb = theme.get('highlight_rgb')
+        if highlight_rgb is None:
+            if isinstance(highlight_color, str) and highlight_color.startswith('#'):
+                highlight_rgb = _parse_hex(highlight_color)
+            else:
+                highlight_rgb = highlight_color
+        
+        # Create 3-layer radial gradient (centered), baked with the background
+        # into one static frame: a single layer instead of 1 + num_grd_layers
+        # full-frame composites on every outro frame
+        bg_frame = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        bg_frame[:] = bg_color[:3]
+        highlight = np.array(highlight_rgb[:3], dtype=np.uint16)
 
         num_grd_layers=1
-            #for i in range(num_grd_layers):  # 3 gradient layers
-                #radius = res_scale(50) + (i * res_scale())v
         for i in range(num_grd_layers):
             radius = res_scale(30) + (i * (HEIGHT//2//num_grd_layers))
             opacity = 0.12 - (i//num_grd_layers * 0.03)
-            
-            gradient_circle = ColorClip(
-                size=(radius*2, radius*2),
-                color=highlight_rgb
-            ).set_opacity(opacity)
-            
-            gradient_circle = gradient_circle.set_position(
-                (WIDTH//2 - radius, HEIGHT//2 - radius)
-            ).set_duration(duration)
-            
-            clips.append(gradient_circle)
+            _blend_rect(bg_frame, WIDTH//2 - radius, HEIGHT//2 - radius, radius*2, radius*2, highlight, opacity)
+        
+        bg = ImageClip(bg_frame).set_duration(duration)
+        clips.append(bg)
         
         # ============================================================
         # LOGO - Elastic entrance animation
@@ -246,8 +529,6 @@ class ShortsEngine:
         
         if os.path.exists(self.logo_path):
             try:
-                from moviepy.editor import ImageClip
-                
                 logo = ImageClip(self.logo_path).set_duration(duration)
                 
                 # Resize logo to reasonable size
@@ -298,8 +579,6 @@ class ShortsEngine:
         # ============================================================
         
         try:
-            from moviepy.editor import TextClip
-            
             channel_name_y = center_y + res_scale(50) if logo_present else center_y - res_scale(80)
             # Calculate contrast color for theme background
             text_color = self._get_contrast_text_color(bg_color)
@@ -443,8 +722,7 @@ class ShortsEngine:
     
     def add_background_music(self, voice_track, total_duration, theme_name='energetic_yellow'):
         mood = self.get_theme(theme_name).get('music_mood', 'energetic')
-        search_path = os.path.join(self.music_dir, mood, "*.mp3")
-        tracks = glob.glob(search_path) or glob.glob(os.path.join(self.music_dir, "*.mp3"))
+        tracks = self._music_index.get(mood, self._music_fallback)
         
         if not tracks:
             legacy = 'config/music.mp3'
@@ -455,63 +733,76 @@ class ShortsEngine:
         print(f"🎵 Adding Music: {os.path.basename(chosen)} (Mood: {mood})")
         
         try:
-            bgm = AudioFileClip(chosen)
+            bgm_arr = _load_bgm_array(chosen, os.path.join(self.music_dir, '.cache'))
+            peak = _BGM_PEAK[chosen]  # Whole track, so the gain does not depend on the short's length
+            n_samples = int(total_duration * BGM_FPS)
+            if len(bgm_arr) < n_samples:
+                # One contiguous buffer instead of MoviePy's concatenated loop clips
+                reps = -(-n_samples // len(bgm_arr))
+                bgm_arr = np.tile(bgm_arr, (reps, 1))
+            bgm_arr = bgm_arr[:n_samples]
             
-            # ATTEMPT NORMALIZATION (Handle failure gracefully)
+            # Peak normalization and the 0.12 mix level fused into a single multiply
+            # (was bgm.fx(audio_normalize).volumex(vol_level): two passes per frame)
             vol_level = 0.12
-            try:
-                # FIXED: Removed 'vfx.' prefix, using imported audio_normalize directly
-                bgm = bgm.fx(audio_normalize)
-                vol_level = 0.12 # Boost volume if normalized (0.12 is too quiet for normalized peaks)
-            except Exception as e:
-                print(f"⚠️ Normalization skipped (Error: {e})")
+            scale = vol_level / peak if peak > 0 else vol_level
+            bgm = AudioArrayClip(bgm_arr * np.float32(scale), fps=BGM_FPS)
             
-            if bgm.duration < total_duration:
-                bgm = bgm.loop(n=int(total_duration/bgm.duration)+1)
-                
-            return CompositeAudioClip([voice_track, bgm.subclip(0, total_duration).volumex(vol_level)])
+            return CompositeAudioClip([voice_track, bgm])
         except Exception as e:
             print(f"❌ Background Music Failed: {e}")
             return voice_track
 
     def create_text_clip(self, text, fontsize, color='white', bg_color=None, bold=False, stroke_color=None, stroke_width=0, wrap_width=25, align='center'):
-        def to_hex(c): return '#%02x%02x%02x' % (int(c[0]), int(c[1]), int(c[2])) if isinstance(c, (tuple, list)) else c
         color, bg_color, stroke_color = to_hex(color), to_hex(bg_color), to_hex(stroke_color)
         
         if color == 'white' and stroke_width == 0 and bg_color is None:
              stroke_color, stroke_width = 'black', 2
 
-        wrapped = "\n".join(textwrap.wrap(text, width=wrap_width))
-        try:
-            return TextClip(wrapped, fontsize=int(fontsize), color=color, font=FONT_BOLD if bold else FONT_REGULAR, 
-                            bg_color=bg_color, stroke_color=stroke_color, stroke_width=stroke_width, 
-                            method='caption', size=(WIDTH - 100, None), align=align)
-        except Exception:
-            return TextClip(wrapped, fontsize=int(fontsize), color=color, font=FONT_BOLD if bold else FONT_REGULAR)
+        # Each ImageMagick rasterization is a fork+exec; cache the result as an RGBA PNG
+        key = hashlib.blake2b(repr((text, fontsize, color, bg_color, bold, stroke_color, stroke_width, wrap_width, align)).encode('utf-8'), digest_size=16).hexdigest()
+        png_path = os.path.join(self.textcache_dir, f"{key}.png")
+        if not os.path.exists(png_path):
+            wrapped = _wrap(text, wrap_width)
+            try:
+                clip = TextClip(wrapped, fontsize=int(fontsize), color=color, font=FONT_BOLD if bold else FONT_REGULAR, 
+                                bg_color=bg_color, stroke_color=stroke_color, stroke_width=stroke_width, 
+                                method='caption', size=(WIDTH - 100, None), align=align)
+            except Exception:
+                clip = TextClip(wrapped, fontsize=int(fontsize), color=color, font=FONT_BOLD if bold else FONT_REGULAR)
+            # Written beside the final name so a crash or a parallel worker never leaves a partial PNG
+            tmp = f"{png_path[:-4]}.{os.getpid()}.png"
+            clip.save_frame(tmp, withmask=True)
+            os.replace(tmp, png_path)
+        return _load_text_png(png_path)
 
     def create_background(self, theme_name, duration, video_clip=None):
         theme = self.get_theme(theme_name)
         if video_clip:
             try:
-                bg = video_clip.resize(height=HEIGHT)
-                x = bg.w / 2
-                bg = bg.crop(x1=x - WIDTH/2, y1=0, width=WIDTH, height=HEIGHT).resize(0.05).resize(height=HEIGHT).fx(vfx.colorx, 0.35)
+                # Crop the 9:16 window in source pixels first, so only the tiny and
+                # the final frame are resampled (was: full-height resize, crop, down, up)
+                crop_w = min(video_clip.w, video_clip.h * WIDTH / HEIGHT)
+                bg = video_clip.crop(x_center=video_clip.w / 2, width=crop_w, y1=0, height=video_clip.h)
+                bg = bg.resize(height=HEIGHT // 20).resize(height=HEIGHT).fx(vfx.colorx, 0.35)
                 return bg.set_duration(duration)
             except Exception: pass
         return ColorClip(size=(WIDTH, HEIGHT), color=theme['bg_color'], duration=duration)
 
     def apply_ken_burns(self, clip, zoom_factor=1.15):
         if not hasattr(clip, 'duration') or not clip.duration: return clip
-        return clip.resize(lambda t: 1.0 + (zoom_factor - 1.0) * (t / clip.duration))
+        # Zoom factor per output frame, precomputed; the resize callback is just an index
+        last = int(np.ceil(clip.duration * FPS))
+        lut = (1.0 + (zoom_factor - 1.0) * (np.arange(last + 1) / FPS / clip.duration)).tolist()
+        return clip.resize(lambda t: lut[min(int(t * FPS + 0.5), last)])
 
     def generate_short(self, video_path, pdf_path, script, config, output_path, class_level=None):
         try:
             t_type = config.get('template', 'quiz')
-            #if t_type == 'quiz': from template_quiz import QuizTemplate; template = QuizTemplate(self)
-            if t_type == 'quiz': from template_quiz_json_generator import QuizTemplate; template = QuizTemplate(self)
-            elif t_type == 'fact': from template_fact import FactTemplate; template = FactTemplate(self)
-            elif t_type == 'tip': from template_tip import TipTemplate; template = TipTemplate(self)
-            else: raise ValueError(f"Unknown template: {t_type}")
+            #'quiz' previously used template_quiz.QuizTemplate
+            template_cls = _TEMPLATES.get(t_type)
+            if template_cls is None: raise ValueError(f"Unknown template: {t_type}")
+            template = template_cls(self)
             
             result = template.generate(video_path, script, config, output_path)
             return {'success': True, 'output_path': output_path, 'duration': result.get('duration', 0)}
@@ -519,18 +810,17 @@ class ShortsEngine:
             import traceback; traceback.print_exc()
             return {'success': False, 'error': str(e)}
 
+# Style populations for generate_random_config, built once
+_CONFIG_POPULATIONS = (
+    ('template', ('quiz', 'fact', 'tip')),
+    ('theme', tuple(THEMES.keys())),
+    ('cta_style', ('persistent', 'bookend', 'both')),
+    ('opening_style', ('countdown', 'montage', 'mystery')),
+    ('retention_strategy', ('cliffhanger', 'teaser', 'curiosity')),
+)
+
 def generate_random_config(class_level=None):
-    templates = ['quiz', 'fact', 'tip']
-    themes = list(THEMES.keys())
-    opening_styles = ['countdown', 'montage', 'mystery']
-    
-    config = {
-        'template': random.choice(templates),
-        'voice': VoiceManager.get_random_voice_name(),
-        'theme': random.choice(themes),
-        'cta_style': random.choice(['persistent', 'bookend', 'both']),
-        'opening_style': random.choice(opening_styles),
-        'class_level': class_level or random.randint(6, 12),
-        'retention_strategy': random.choice(['cliffhanger', 'teaser', 'curiosity'])
-    }
+    config = {key: pop[int(random.random() * len(pop))] for key, pop in _CONFIG_POPULATIONS}
+    config['voice'] = VoiceManager.get_random_voice_name()
+    config['class_level'] = class_level or random.randint(6, 12)
     return config
\ No newline at end of file
@@ -10,9 +10,6 @@ import os
 import concurrent.futures
 from moviepy.editor import CompositeVideoClip, CompositeAudioClip, TextClip, AudioFileClip, vfx
 from voice_manager import VoiceManager
-from karaoke_manager import KaraokeManager
-from video_processor import VideoProcessor
-from sfx_manager import SFXManager  # <--- NEW IMPORT
 
 WIDTH = 1080
 HEIGHT = 1920
@@ -37,9 +34,9 @@ class FactTemplate:
         # Select ONE voice for entire video
         selected_voice_key = voice_name if voice_name else voice_mgr.get_random_voice_name()
         print(f"   🎤 Using voice: {selected_voice_key} (consistent across all segments)")        
-        video_proc = VideoProcessor(temp_dir=self.engine.config['DIRS']['TEMP'])
-        karaoke_mgr = KaraokeManager(voice_mgr, self.engine.config['DIRS']['TEMP'])
-        sfx_mgr = SFXManager() # <--- NEW INITIALIZATION
+        video_proc = self.engine.video_proc
+        karaoke_mgr = self.engine.karaoke_mgr
+        sfx_mgr = self.engine.sfx_mgr
         
         vid_id = os.path.basename(output_path).split('.')[0]
         temp_dir = self.engine.config['DIRS']['TEMP']
@@ -57,7 +54,7 @@ class FactTemplate:
 
         def generate_single_audio(key, text):
             path = f"{temp_dir}/{vid_id}_{key}.mp3"
-            voice_mgr.generate_audio_with_specific_voice(text, path, selected_voice_key, provider='google')
+            voice_mgr.generate_audio_with_specific_voice(text, path, selected_voice_key, provider='google', return_clip=False)
             return key, path
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
@@ -79,7 +76,7 @@ class FactTemplate:
         details_path = f"{temp_dir}/{vid_id}_details.mp3"
 
         # Use explicit spoken text (phonetic)
-        voice_mgr.generate_audio_with_specific_voice(script['fact_spoken'], details_path, selected_voice_key, provider='google')
+        voice_mgr.generate_audio_with_specific_voice(script['fact_spoken'], details_path, selected_voice_key, provider='google', return_clip=False)
         audio_files.append(details_path)
         
         aud_details = AudioFileClip(details_path)
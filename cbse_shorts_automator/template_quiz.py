@@ -11,17 +11,24 @@ UPDATED:
 import imagemagick_setup
 import os
 import math
+import random
+import bisect
 import concurrent.futures
+from functools import lru_cache
+from collections import namedtuple
+import numpy as np
 from moviepy.editor import VideoFileClip, CompositeVideoClip, CompositeAudioClip, ColorClip, AudioFileClip, TextClip, vfx
 from voice_manager import VoiceManager
-from karaoke_manager import KaraokeManager
-from video_processor import VideoProcessor
-from sfx_manager import SFXManager  # <--- NEW IMPORT
 from usp_content_variations import USPContent
 from visual_effects_quiz import QuizVisualEffects
 from visual_effects_quiz import res_scale, set_resolution, WIDTH, HEIGHT
 
 YOUTUBE_CONTROLS_ENABLED = True
+# Print success-path diagnostics (e.g. "Layout validation passed") only when YTA2_VERBOSE=1
+_VERBOSE = os.environ.get('YTA2_VERBOSE', '0') == '1'
+
+# Shared across videos in a batch; one slot per voiceover segment (9) with headroom
+_TTS_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=16)
 
 WIDTH = 1080
 HEIGHT = 1920
@@ -47,15 +54,32 @@ class LayoutGaps:
     @staticmethod
     def scale_all():
         """Apply res_scale to all gap values"""
-        LayoutGaps.PIP_TO_HOOK = res_scale(20)
-        LayoutGaps.HOOK_TO_QUESTION = res_scale(30)
-        LayoutGaps.QUESTION_TO_OPTIONS = res_scale(50)
-        LayoutGaps.OPTION_HEIGHT = res_scale(100)
-        LayoutGaps.OPTION_SPACING = res_scale(30)
-        LayoutGaps.OPTIONS_TO_TIMER = res_scale(40)
-        LayoutGaps.TIMER_LABEL_TO_BAR = res_scale(30)
-        LayoutGaps.TIMER_BAR_HEIGHT = res_scale(50)
-        LayoutGaps.OPTIONS_TO_EXPLANATION = res_scale(60)
+        for name, value in zip(_GAP_NAMES, _scaled_gaps(WIDTH, HEIGHT)):
+            setattr(LayoutGaps, name, value)
+
+# Base (1080x1920) gap values applied by LayoutGaps.scale_all
+_GAP_NAMES = ('PIP_TO_HOOK', 'HOOK_TO_QUESTION', 'QUESTION_TO_OPTIONS', 'OPTION_HEIGHT', 'OPTION_SPACING',
+              'OPTIONS_TO_TIMER', 'TIMER_LABEL_TO_BAR', 'TIMER_BAR_HEIGHT', 'OPTIONS_TO_EXPLANATION')
+_GAP_BASE = (20, 30, 50, 100, 30, 40, 30, 50, 60)
+
+_LAYOUT_SIZES_BASE = (130, 150, 80, 420)
+
+# Production resolution: res_scale is the identity here, so the base literals are used as-is
+_NATIVE_RES = (1080, 1920)
+
+@lru_cache(maxsize=8)
+def _scaled_gaps(width, height):
+    # Keyed by resolution: set_resolution() has already been applied for (width, height)
+    if (width, height) == _NATIVE_RES:
+        return _GAP_BASE
+    return tuple(res_scale(v) for v in _GAP_BASE)
+
+@lru_cache(maxsize=8)
+def _scaled_layout_sizes(width, height):
+    """(hook_height, question_height, timer_label_height, cta_from_bottom) at this resolution"""
+    if (width, height) == _NATIVE_RES:
+        return _LAYOUT_SIZES_BASE
+    return tuple(res_scale(v) for v in _LAYOUT_SIZES_BASE)
 
 class LayoutPositions:
     """Calculated Y positions for all elements"""
@@ -77,58 +101,114 @@ class LayoutPositions:
         Calculate all Y positions based on PIP.
         Call this after PIP dimensions are known.
         """
-        LayoutPositions.pip_y = pip_y
-        LayoutPositions.pip_height = pip_height
-        LayoutPositions.pip_bottom = pip_y + pip_height
-        
-        # Flow downward from PIP
-        LayoutPositions.hook_y = LayoutPositions.pip_bottom + LayoutGaps.PIP_TO_HOOK
-        
-        # Estimate hook height (fixed 130px box)
-        hook_height = res_scale(130)
-        LayoutPositions.question_y = LayoutPositions.hook_y + hook_height + LayoutGaps.HOOK_TO_QUESTION
-        
-        # Estimate question height (background card, typically ~150px)
-        question_height = res_scale(150)
-        LayoutPositions.options_start_y = LayoutPositions.question_y + question_height + LayoutGaps.QUESTION_TO_OPTIONS
-        
-        # Calculate position of 4th option bottom
-        option_4_bottom = (LayoutPositions.options_start_y + 
-                          (LayoutGaps.OPTION_HEIGHT * 4) + 
-                          (LayoutGaps.OPTION_SPACING * 3))
-        
-        # Timer starts below options
-        LayoutPositions.timer_label_y = option_4_bottom + LayoutGaps.OPTIONS_TO_TIMER
-        LayoutPositions.timer_bar_y = LayoutPositions.timer_label_y + res_scale(80) + LayoutGaps.TIMER_LABEL_TO_BAR
-        
-        # Explanation replaces options area during answer reveal
-        #LayoutPositions.explanation_y = LayoutPositions.options_start_y + LayoutGaps.OPTIONS_TO_EXPLANATION
-        LayoutPositions.explanation_y = option_4_bottom + LayoutGaps.OPTIONS_TO_EXPLANATION
-        
-        # CTA near bottom (fixed distance from bottom edge for safety)
-        LayoutPositions.cta_y = HEIGHT - res_scale(420)  # 420px from bottom = safe zone
+        gaps = tuple(getattr(LayoutGaps, name) for name in _GAP_NAMES)
+        positions = _compute_positions(pip_y, pip_height, HEIGHT, gaps, _scaled_layout_sizes(WIDTH, HEIGHT))
+        for name, value in zip(_Positions._fields, positions):
+            setattr(LayoutPositions, name, value)
+
+_Positions = namedtuple('_Positions', 'pip_y pip_height pip_bottom hook_y question_y options_start_y '
+                                      'timer_label_y timer_bar_y explanation_y cta_y')
+
+@lru_cache(maxsize=16)
+def _compute_positions(pip_y, pip_height, height, gaps, sizes):
+    """Pure layout math for LayoutPositions.calculate; keyed on the PIP, screen height, gaps and sizes."""
+    g = dict(zip(_GAP_NAMES, gaps))
+    hook_height, question_height, timer_label_height, cta_from_bottom = sizes
+    pip_bottom = pip_y + pip_height
+    
+    # Flow downward from PIP
+    hook_y = pip_bottom + g['PIP_TO_HOOK']
+    
+    # Estimate hook height (fixed 130px box)
+    question_y = hook_y + hook_height + g['HOOK_TO_QUESTION']
+    
+    # Estimate question height (background card, typically ~150px)
+    options_start_y = question_y + question_height + g['QUESTION_TO_OPTIONS']
+    
+    # Calculate position of 4th option bottom
+    option_4_bottom = (options_start_y + 
+                      (g['OPTION_HEIGHT'] * 4) + 
+                      (g['OPTION_SPACING'] * 3))
+    
+    # Timer starts below options
+    timer_label_y = option_4_bottom + g['OPTIONS_TO_TIMER']
+    timer_bar_y = timer_label_y + timer_label_height + g['TIMER_LABEL_TO_BAR']
+    
+    # Explanation replaces options area during answer reveal
+    #explanation_y = options_start_y + OPTIONS_TO_EXPLANATION
+    explanation_y = option_4_bottom + g['OPTIONS_TO_EXPLANATION']
+    
+    # CTA near bottom (fixed distance from bottom edge for safety)
+    cta_y = height - cta_from_bottom  # 420px from bottom = safe zone
+    
+    return _Positions(pip_y, pip_height, pip_bottom, hook_y, question_y, options_start_y,
+                      timer_label_y, timer_bar_y, explanation_y, cta_y)
+
+class _IntervalAudioClip(CompositeAudioClip):
+    """
+    CompositeAudioClip whose clips are sorted by start time: each audio chunk bisects
+    to the clips that can overlap it instead of probing is_playing() on every clip.
+    Mixing is otherwise identical to MoviePy's.
+    """
+    def __init__(self, clips):
+        clips = sorted(clips, key=lambda c: c.start)
+        super().__init__(clips)
+        starts = [c.start for c in clips]
+        ends = [c.end for c in clips]
+
+        def make_frame(t):
+            t_lo, t_hi = (t.min(), t.max()) if isinstance(t, np.ndarray) else (t, t)
+            hi = bisect.bisect_right(starts, t_hi)
+            active = [c for c, end in zip(clips[:hi], ends[:hi]) if end is None or end > t_lo]
+            played_parts = [c.is_playing(t) for c in active]
+            sounds = [c.get_frame(t - c.start) * np.array([part]).T
+                      for c, part in zip(active, played_parts)
+                      if (part is not False)]
+            if isinstance(t, np.ndarray):
+                zero = np.zeros((len(t), self.nchannels))
+            else:
+                zero = np.zeros(self.nchannels)
+            return zero + sum(sounds)
+
+        self.make_frame = make_frame
+
+@lru_cache(maxsize=64)
+def _label_clip(text, fontsize, color, font, stroke_color=None, stroke_width=1, bg_color='transparent', size=None):
+    """
+    ImageMagick-rasterized 'label' TextClip, shared across videos. Hooks and timer labels
+    come from the fixed USPContent pools, so the same few rasters repeat all batch long.
+    Callers only derive new clips (set_*/resize), never mutate the cached one.
+    """
+    return TextClip(text, fontsize=fontsize, color=color, font=font, stroke_color=stroke_color,
+                    stroke_width=stroke_width, bg_color=bg_color, size=size, method='label')
+
+@lru_cache(maxsize=8)
+def _shine_base(width, height):
+    """Semi-transparent white sweep bar for the answer reveal, allocated once per resolution."""
+    return ColorClip(size=(width + res_scale(200), res_scale(15)), color=(255, 255, 255)).set_opacity(0.4)
+
+def _maybe_rgb(clip):
+    """Promote a 2-D (grayscale) ImageClip to RGB; every other clip passes through."""
+    img = getattr(clip, 'img', None)
+    if img is not None and img.ndim == 2:
+        return clip.fx(vfx.to_RGB)
+    return clip
+
+def _lut_callback(values, fps):
+    """MoviePy t-callback over a per-frame table (nearest frame, clamped to the last entry)."""
+    last = len(values) - 1
+    # Captures bound as defaults: read as locals on every frame, not closure cells
+    return lambda t, _v=values, _fps=fps, _last=last, _min=min, _int=int: _v[_min(_int(t * _fps + 0.5), _last)]
 
 def validate_layout():
     """
     Validate that all positions fit within screen bounds.
     Raises warning if elements overlap or go off-screen.
     """
-    checks = {
-        'PIP top': (LayoutPositions.pip_y, 0, 'Too close to top edge'),
-        'Hook': (LayoutPositions.hook_y, LayoutPositions.pip_bottom, 'Hook overlaps PIP'),
-        'Question': (LayoutPositions.question_y, LayoutPositions.hook_y + res_scale(130), 'Question overlaps hook'),
-        'Options': (LayoutPositions.options_start_y, LayoutPositions.question_y + res_scale(150), 'Options overlap question'),
-        'Timer': (LayoutPositions.timer_bar_y, LayoutPositions.options_start_y + res_scale(500), 'Timer overlaps options'),
-        'CTA': (LayoutPositions.cta_y, HEIGHT - res_scale(500), 'CTA too close to bottom'),
-        'Bottom safe': (LayoutPositions.timer_bar_y + res_scale(50), HEIGHT - res_scale(400), 'Timer in YouTube UI zone')
-    }
-    
-    warnings = []
-    for name, (pos, min_pos, error_msg) in checks.items():
-        if pos < min_pos:
-            warnings.append(f"⚠️ {name}: {error_msg} (Y={pos}, min={min_pos})")
-        if pos > HEIGHT:
-            warnings.append(f"⚠️ {name}: Off-screen! (Y={pos} > HEIGHT={HEIGHT})")
+    positions = _Positions(*(getattr(LayoutPositions, name) for name in _Positions._fields))
+    warnings = _layout_warnings(positions, WIDTH, HEIGHT)
+    if not warnings and not _VERBOSE:
+        return True
     
     if warnings:
         print("\n⚠️ LAYOUT WARNINGS:")
@@ -139,6 +219,48 @@ def validate_layout():
     
     return len(warnings) == 0
 
+# (name, message) per bounds check, in the order _layout_warnings evaluates them
+_VALIDATE_SPEC = (
+    ('PIP top', 'Too close to top edge'),
+    ('Hook', 'Hook overlaps PIP'),
+    ('Question', 'Question overlaps hook'),
+    ('Options', 'Options overlap question'),
+    ('Timer', 'Timer overlaps options'),
+    ('CTA', 'CTA too close to bottom'),
+    ('Bottom safe', 'Timer in YouTube UI zone'),
+)
+
+_VALIDATE_OFFSETS_BASE = (130, 150, 500, 50, 500, 400)
+
+@lru_cache(maxsize=8)
+def _validate_offsets(width, height):
+    """Scaled (hook, question, options block, timer bar, CTA zone, UI zone) sizes"""
+    if (width, height) == _NATIVE_RES:
+        return _VALIDATE_OFFSETS_BASE
+    return tuple(res_scale(v) for v in _VALIDATE_OFFSETS_BASE)
+
+@lru_cache(maxsize=16)
+def _layout_warnings(positions, width, height):
+    """Bounds/overlap checks for one layout at one resolution (same geometry -> same result)."""
+    p = positions
+    hook_h, question_h, options_h, bar_h, cta_zone, ui_zone = _validate_offsets(width, height)
+    pos = np.array([p.pip_y, p.hook_y, p.question_y, p.options_start_y,
+                    p.timer_bar_y, p.cta_y, p.timer_bar_y + bar_h])
+    mins = np.array([0, p.pip_bottom, p.hook_y + hook_h, p.question_y + question_h,
+                     p.options_start_y + options_h, height - cta_zone, height - ui_zone])
+    too_high = pos < mins
+    off_screen = pos > height
+    if not (too_high.any() or off_screen.any()):
+        return ()
+    
+    warnings = []
+    for idx, (name, error_msg) in enumerate(_VALIDATE_SPEC):
+        if too_high[idx]:
+            warnings.append(f"⚠️ {name}: {error_msg} (Y={pos[idx]}, min={mins[idx]})")
+        if off_screen[idx]:
+            warnings.append(f"⚠️ {name}: Off-screen! (Y={pos[idx]} > HEIGHT={height})")
+    return tuple(warnings)
+
 
 class QuizTemplate:
     def __init__(self, engine):
@@ -163,7 +285,6 @@ class QuizTemplate:
         FPS = target_fps
         print(f"   📐 Resolution: {target_width}x{target_height}")
         
-        import random
         theme = self.engine.get_theme(config.get('theme', 'energetic_yellow'))
         theme_options = ['energetic_yellow', 'calm_blue', 'vibrant_purple', 'fresh_green', 'classic_red']
         default_theme = config.get('theme', random.choice(theme_options))
@@ -180,9 +301,9 @@ class QuizTemplate:
         # Select ONE voice for entire video
         selected_voice_key = voice_name if voice_name else voice_mgr.get_random_voice_name()
         print(f"   🎤 Using voice: {selected_voice_key} (consistent across all segments)")
-        video_proc = VideoProcessor(temp_dir=self.engine.config['DIRS']['TEMP'])
-        karaoke_mgr = KaraokeManager(voice_mgr, self.engine.config['DIRS']['TEMP'])
-        sfx_mgr = SFXManager() # <--- NEW INITIALIZATION
+        video_proc = self.engine.video_proc
+        karaoke_mgr = self.engine.karaoke_mgr
+        sfx_mgr = self.engine.sfx_mgr
         
         vid_id = os.path.basename(output_path).split('.')[0]
         temp_dir = self.engine.config['DIRS']['TEMP']
@@ -205,31 +326,37 @@ class QuizTemplate:
         
         generated_audio_paths = {}
 
-        def generate_single_audio(key, text):
-            path = f"{temp_dir}/{vid_id}_{key}.mp3"
-            voice_mgr.generate_audio_with_specific_voice(text, path, selected_voice_key, provider='edge')
+        # Repeated segments ("Think fast!", stock CTAs) are served from VoiceManager's
+        # cache, keyed on provider/voice/text, so they are not re-synthesized per video
+        def generate_single_audio(key, text, path):
+            voice_mgr.generate_audio_with_specific_voice(text, path, selected_voice_key, provider='edge', return_clip=False)
             return key, path
 
-        #with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            #futures = [executor.submit(generate_single_audio, k, t) for k, t in audio_tasks.items()]
-            #for future in concurrent.futures.as_completed(futures):
-                #k, path = future.result()
-                #generated_audio_paths[k] = path
-                #audio_files.append(path)
-        
+        # TTS is network-bound: submit every segment at once to the shared pool.
+        # Paths are recorded up front so cleanup also catches a failed segment's partial file.
+        futures = {}
         for k, t in audio_tasks.items():
-            # 3. Execute the function directly (blocking until it returns)
+            path = f"{temp_dir}/{vid_id}_{k}.mp3"
+            audio_files.append(path)
+            futures[k] = _TTS_POOL.submit(generate_single_audio, k, t, path)
+
+        # Audio-independent visuals (ImageMagick rasters, source probe) run while TTS is in flight
+        hook_box = theme['highlight']
+        hook_txt = self.engine.get_contrast_color(hook_box)
+        hook_text = USPContent.get_random_hook()
+        timer_label_text = USPContent.get_random_timer_label()
+        hook_future = _TTS_POOL.submit(_label_clip, hook_text, res_scale(52), hook_txt, 'Arial-Bold',
+                                       bg_color=hook_box, size=(WIDTH - res_scale(100), res_scale(130)))
+        label_future = _TTS_POOL.submit(_label_clip, timer_label_text, res_scale(62), '#FFFF00', 'Impact',
+                                        stroke_color='black', stroke_width=res_scale(2))
+        src_future = _TTS_POOL.submit(VideoFileClip, video_path, audio=False)
+
+        for k, future in futures.items():
             try:
-                k_result, path = generate_single_audio(k, t)
-                
-                # 4. Collect the results
+                k_result, path = future.result()
                 generated_audio_paths[k_result] = path
-                audio_files.append(path)
-                
             except Exception as e:
-                # Handle exceptions from generate_single_audio if necessary
                 print(f"Error processing task for key {k}: {e}")
-                # Depending on your logic, you might want to break or continue here
 
         aud_hook = AudioFileClip(generated_audio_paths['hook'])
         aud_q = AudioFileClip(generated_audio_paths['question'])
@@ -270,7 +397,9 @@ class QuizTemplate:
         # NEW:
         print(f"   🧠 AI Watching video to find relevant clips ({int(total_dur)}s)...")
         #src_vid = video_proc.prepare_video_for_short(video_path, total_dur, script=script, width=WIDTH)
-        src_vid = VideoFileClip(video_path)
+        # Video only (final audio is set explicitly), limited to the span the PIP shows
+        src_vid = src_future.result()
+        src_vid = src_vid.subclip(0, min(t_outro, src_vid.duration))
 
         # Configure PIP size
         PIP_HEIGHT = res_scale(333)  # Adjust this value (225 = small, 400 = medium, 495 = large)
@@ -296,22 +425,11 @@ class QuizTemplate:
 
         clips = [backdrop, pip]
         
-        def force_rgb(clip):
-            try:
-                if hasattr(clip, 'img') and clip.img is not None and clip.img.ndim == 2:
-                    return clip.fx(vfx.to_RGB)
-            except: pass
-            return clip
-
         CARD_START_Y = res_scale(750) 
         
         # 4. Text Overlays
         # Watch Till End
-        hook_box = theme['highlight']
-        
-        hook_txt = self.engine.get_contrast_color(hook_box)
-        hook_text = USPContent.get_random_hook()
-        hook_clip = TextClip(hook_text, fontsize=res_scale(52), color=hook_txt, bg_color=hook_box, font='Arial-Bold', method='label', size=(WIDTH - res_scale(100), res_scale(130)))
+        hook_clip = hook_future.result()
 
         # Add pulsing animation
         def hook_pulse(t):
@@ -319,9 +437,12 @@ class QuizTemplate:
             offset = (1 - scale) * (WIDTH - res_scale(100)) / 2
             return ('center', CARD_START_Y)
 
-        hook_clip = hook_clip.resize(lambda t: 1.0 + 0.08 * abs(math.sin(t * 3 * math.pi)))
+        # Pulse sampled once per frame instead of sin() per rendered frame
+        hook_t = np.arange(int(aud_hook.duration * FPS) + 2) / FPS
+        hook_scales = (1.0 + 0.08 * np.abs(np.sin(hook_t * 3 * np.pi))).tolist()
+        hook_clip = hook_clip.resize(_lut_callback(hook_scales, FPS))
         hook_clip = hook_clip.set_position(('center', LayoutPositions.hook_y)).set_start(0).set_duration(aud_hook.duration)
-        clips.append(force_rgb(hook_clip))
+        clips.append(hook_clip)
         
         # Question
         QUESTION_Y = CARD_START_Y + res_scale(130) 
@@ -336,51 +457,27 @@ class QuizTemplate:
             y_offset=LayoutPositions.question_y
         )
         #q_clip = q_clip.set_position(('center', QUESTION_Y)).set_start(t_q).set_duration(total_dur - t_q)
-        clips.append(force_rgb(q_clip))
+        clips.append(q_clip)
         
         # Options
         OPT_START_Y = QUESTION_Y + res_scale(350)
         GAP = res_scale(130)
-        opt_bg = theme['bg_color']
-        
-        if isinstance(opt_bg, str):
-             if opt_bg.startswith('#'):
-                opt_bg = opt_bg.lstrip('#')
-                opt_bg = tuple(int(opt_bg[i:i+2], 16) for i in (0, 2, 4))
+        opt_bg = theme['bg_color']  # RGB tuple in THEMES
         
         options = [(f"A) {script['opt_a_visual']}", t_a), (f"B) {script['opt_b_visual']}", t_b), 
                    (f"C) {script['opt_c_visual']}", t_c), (f"D) {script['opt_d_visual']}", t_d)]
                     
-        # NEW: Pass relative Y positions
+        # NEW: Pass relative Y positions (one option box + gap per row)
+        stride = LayoutGaps.OPTION_HEIGHT + LayoutGaps.OPTION_SPACING
         options_data = [
             {
-                'text': f"A) {script['opt_a_visual']}", 
-                'start_time': t_a, 
-                'duration': t_outro - t_a, 
-                'is_correct': False,
-                'y_position': LayoutPositions.options_start_y  # Option A
-            },
-            {
-                'text': f"B) {script['opt_b_visual']}", 
-                'start_time': t_b, 
-                'duration': t_outro - t_b, 
-                'is_correct': False,
-                'y_position': LayoutPositions.options_start_y + LayoutGaps.OPTION_HEIGHT + LayoutGaps.OPTION_SPACING  # Option B
-            },
-            {
-                'text': f"C) {script['opt_c_visual']}", 
-                'start_time': t_c, 
-                'duration': t_outro - t_c, 
-                'is_correct': False,
-                'y_position': LayoutPositions.options_start_y + (LayoutGaps.OPTION_HEIGHT + LayoutGaps.OPTION_SPACING) * 2  # Option C
-            },
-            {
-                'text': f"D) {script['opt_d_visual']}", 
-                'start_time': t_d, 
-                'duration': t_outro - t_d, 
+                'text': text,
+                'start_time': start,
+                'duration': t_outro - start,
                 'is_correct': False,
-                'y_position': LayoutPositions.options_start_y + (LayoutGaps.OPTION_HEIGHT + LayoutGaps.OPTION_SPACING) * 3  # Option D
+                'y_position': LayoutPositions.options_start_y + stride * i
             }
+            for i, (text, start) in enumerate(options)
         ]
         option_clips = vfx_quiz.create_options_sequence(options_data, theme, use_relative_y=True)
         clips.extend(option_clips)
@@ -389,9 +486,7 @@ class QuizTemplate:
         # NEW:
         timer_label_y = LayoutPositions.timer_label_y
         timer_bar_y = LayoutPositions.timer_bar_y
-        bar_color = theme['correct']
-        if isinstance(bar_color, str) and bar_color.startswith('#'):
-             bar_color = tuple(int(bar_color.lstrip('#')[i:i+2], 16) for i in (0, 2, 4))
+        bar_color = theme['correct_rgb']  # parsed once when shorts_engine loads THEMES
              
         segments = 12
         timer_clips = vfx_quiz.create_timer_animation(
@@ -402,26 +497,17 @@ class QuizTemplate:
         clips.extend(timer_clips)
 
         # Add timer label
-        timer_label_text = USPContent.get_random_timer_label()
         timer_label_pulse_freq=4
 
-        # Create flashing effect (2 states alternating)
-        for i in range(int(THINK_TIME * timer_label_pulse_freq)):  # Flash twice per second
-            opacity = 1.0 if i % 2 == 0 else 0.5  # Alternate full/half
-            
-            label = TextClip(
-                timer_label_text,
-                fontsize=res_scale(62),
-                color='#FFFF00',  # Bright yellow
-                font='Impact',  # Bold, attention-grabbing font
-                stroke_color='black',
-                stroke_width=res_scale(2),
-                method='label'
-            ).set_opacity(opacity)
-            
-            label = label.set_position(('center', timer_label_y))
-            label = label.set_start(t_think + (i / timer_label_pulse_freq)).set_duration(1/timer_label_pulse_freq)
-            clips.append(label)
+        # Create flashing effect (2 states alternating): one rasterized label,
+        # opacity driven by time on its mask instead of one TextClip per flash
+        label = label_future.result()  # Bright yellow Impact, black stroke
+        label = label.set_mask(label.mask.fl(
+            lambda gf, t: gf(t) * (1.0 if int(t * timer_label_pulse_freq) % 2 == 0 else 0.5)  # Alternate full/half
+        ))
+        label = label.set_position(('center', timer_label_y))
+        label = label.set_start(t_think).set_duration(int(THINK_TIME * timer_label_pulse_freq) / timer_label_pulse_freq)
+        clips.append(label)
         # Answer
         ans_bg = theme['correct']
         ans_txt = self.engine.get_contrast_color(ans_bg)
@@ -449,14 +535,11 @@ class QuizTemplate:
             align='center'
         )
 
-        # Add entrance animation
-        def summary_entrance(t):
-            if t < 0.4:
-                scale = 0.8 + 0.2 * (t / 0.4)  # Scale from 0.8 to 1.0
-                return scale
-            return 1.0
+        # Add entrance animation: scale 0.8 -> 1.0 over 0.4s, tabulated per frame
+        summary_t = np.arange(int(aud_expl.duration * FPS) + 2) / FPS
+        summary_scales = np.minimum(1.0, 0.8 + 0.2 * (summary_t / 0.4)).tolist()
 
-        summary_clip = summary_clip.resize(summary_entrance)
+        summary_clip = summary_clip.resize(_lut_callback(summary_scales, FPS))
         #summary_clip = summary_clip.set_position(('center', OPT_START_Y)).set_start(t_ans).set_duration(aud_expl.duration)
         #clips.append(summary_clip)
 
@@ -475,21 +558,17 @@ class QuizTemplate:
         # Duration: Matches exactly the length of the spoken explanation audio.
         EXPLANATION_Y = OPT_START_Y + (GAP * 4) + res_scale(80)
         summary_clip = summary_clip.set_position(('center', LayoutPositions.explanation_y)).set_start(t_ans).set_duration(aud_expl.duration)
-        clips.append(force_rgb(summary_clip))
+        clips.append(summary_clip)
 
 
-        from moviepy.editor import ColorClip
-
         # Shine sweep effect
-        shine = ColorClip(size=(WIDTH + res_scale(200), res_scale(15)), color=(255, 255, 255))
-        shine = shine.set_opacity(0.4)
-
-        def shine_move(t):
-            progress = min(t / 0.5, 1.0)  # 0.5s sweep
-            x = -res_scale(100) + (WIDTH + res_scale(200)) * progress
-            return (x, LayoutPositions.explanation_y + res_scale(50))
+        shine = _shine_base(WIDTH, HEIGHT)
 
-        shine = shine.set_position(shine_move)
+        # 0.5s sweep, one (x, y) per frame
+        shine_y = LayoutPositions.explanation_y + res_scale(50)
+        shine_progress = np.minimum(np.arange(int(0.5 * FPS) + 2) / FPS / 0.5, 1.0)
+        shine_xs = (-res_scale(100) + (WIDTH + res_scale(200)) * shine_progress).tolist()
+        shine = shine.set_position(_lut_callback([(x, shine_y) for x in shine_xs], FPS))
         shine = shine.set_start(t_ans + 0.2).set_duration(0.5)  # Slight delay after text appears
         clips.append(shine)
 
@@ -517,9 +596,6 @@ class QuizTemplate:
         # Optional: Radial wipe transition to outro
         # This creates a circular mask that expands from center
         if True:  # Set to False to disable
-            from moviepy.editor import ColorClip
-            import numpy as np
-            
             # Create a quick flash before outro
             flash = ColorClip(
                 size=(WIDTH, HEIGHT),
@@ -553,8 +629,8 @@ class QuizTemplate:
             'outro': t_outro
         }
         
-        # Get professionally mixed SFX clips
-        sfx_clips = sfx_mgr.generate_quiz_sfx(sfx_timings)
+        # Get professionally mixed SFX, pre-mixed into one stem
+        sfx_stem = sfx_mgr.generate_quiz_sfx_mixed(sfx_timings, total_dur)
         
         # Combine: Voice + SFX
         audio_list = [aud_hook.set_start(t_hook), aud_q.set_start(t_q), aud_a.set_start(t_a),
@@ -562,10 +638,12 @@ class QuizTemplate:
                       aud_think.set_start(t_think), aud_expl.set_start(t_ans), aud_cta.set_start(t_cta)] # CHANGED: aud_ans -> aud_expl, added aud_cta
         
         # Flatten the list (Voice + SFX)
-        full_audio_stack = audio_list + sfx_clips
+        full_audio_stack = audio_list + [sfx_stem]
         
-        final_audio = self.engine.add_background_music(CompositeAudioClip(full_audio_stack), total_dur)
+        final_audio = self.engine.add_background_music(_IntervalAudioClip(full_audio_stack), total_dur)
         
+        # Grayscale ImageClips would break compositing; promote them in one pass
+        clips = [_maybe_rgb(c) for c in clips]
         final_raw = CompositeVideoClip(clips, size=(WIDTH, HEIGHT)).set_audio(final_audio)
 
         try:
@@ -573,12 +651,12 @@ class QuizTemplate:
             print(f"  Trying:")
         finally:
             if self.engine.config.get('DELETE_TEMP_FILES', True):
-                import glob
-                for f in audio_files:
-                    if os.path.exists(f): os.remove(f)
-                for pattern in [f'{temp_dir}/{vid_id}*', f'{vid_id}*TEMP_*']:
-                    for temp_file in glob.glob(pattern):
-                        try: os.remove(temp_file)
-                        except: pass
+                # Only what this video wrote: its voiceovers plus MoviePy's temp audio
+                # for write_videofile (no glob, so a parallel render's files are left alone)
+                temp_artifacts = set(audio_files)
+                temp_artifacts.add(self.engine.moviepy_temp_audio_path(output_path))
+                for temp_file in temp_artifacts:
+                    try: os.remove(temp_file)
+                    except OSError: pass
 
         return {'duration': total_dur}
\ No newline at end of file
@@ -15,8 +15,6 @@ import glob
 import random 
 from moviepy.editor import VideoFileClip, AudioFileClip, CompositeAudioClip
 from voice_manager import VoiceManager 
-from sfx_manager import SFXManager
-from video_processor import VideoProcessor
 from usp_content_variations import USPContent 
 from visual_effects_quiz import res_scale, set_resolution
 
@@ -48,11 +46,11 @@ class QuizTemplate:
         HEIGHT = target_height
         
         voice_mgr = self.engine.voice_manager
-        sfx_mgr = SFXManager()
+        sfx_mgr = self.engine.sfx_mgr
         
         voice_name = config.get('voice', 'NeeraNeural2')
         selected_voice_key = voice_name if voice_name else voice_mgr.get_random_voice_name()
-        video_proc = VideoProcessor(temp_dir=self.engine.config['DIRS']['TEMP'])
+        video_proc = self.engine.video_proc
         
         vid_id = os.path.basename(output_path).split('.')[0]
         temp_dir = self.engine.config['DIRS']['TEMP']
@@ -96,7 +94,7 @@ class QuizTemplate:
         
         def generate_single_audio(key, text):
             path = f"{temp_dir}/{vid_id}_{key}.mp3"
-            voice_mgr.generate_audio_with_specific_voice(text, path, selected_voice_key, provider='google')
+            voice_mgr.generate_audio_with_specific_voice(text, path, selected_voice_key, provider='google', return_clip=False)
             return key, path
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
@@ -163,14 +161,14 @@ class QuizTemplate:
             'q': t_q, 'a': t_a, 'b': t_b, 'c': t_c, 'd': t_d,
             'think': t_think, 'ans': t_ans, 'cta': t_cta, 'outro': t_outro
         }
-        sfx_clips = sfx_mgr.generate_quiz_sfx(sfx_timings)
+        sfx_stem = sfx_mgr.generate_quiz_sfx_mixed(sfx_timings, total_dur, fps=AUDIO_SAMPLE_RATE)
         
         audio_list = [
             aud_hook.set_start(t_hook), aud_q.set_start(t_q), aud_a.set_start(t_a),
             aud_b.set_start(t_b), aud_c.set_start(t_c), aud_d.set_start(t_d),
             aud_think.set_start(t_think), aud_expl.set_start(t_ans), aud_cta.set_start(t_cta)
         ]
-        full_audio_stack = audio_list + sfx_clips
+        full_audio_stack = audio_list + [sfx_stem]
         composite_audio = CompositeAudioClip(full_audio_stack)
         final_audio = self.engine.add_background_music(composite_audio, total_dur)
         
@@ -8,11 +8,25 @@ Supports rapid iteration with configurable quality/speed tradeoffs.
 import os
 import sys
 import argparse
-from moviepy.editor import VideoFileClip, CompositeVideoClip, AudioFileClip
-from visual_effects_quiz import QuizVisualEffects
-from debug_logger import create_logger, LogLevel
-# Add to imports:
-from visual_effects_quiz import QuizVisualEffects, res_scale, set_resolution
+import hashlib
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+import numpy as np
+from debug_logger import create_logger
+
+
+def _import_render_stack():
+    """
+    Import MoviePy and the effects module on first use rather than at startup,
+    so --help and argument errors return instantly. Binds the names globally.
+    """
+    global VideoFileClip, VideoClip, get_setting, QuizVisualEffects, res_scale, set_resolution
+    from moviepy.editor import VideoFileClip, VideoClip
+    from moviepy.config import get_setting
+    from visual_effects_quiz import QuizVisualEffects, res_scale, set_resolution
 
 # ============================================================================
 # CONFIGURATION PRESETS
@@ -30,6 +44,7 @@ class TestMode:
         'use_mock_timings': True,
         'particle_count': 10,
         'render_preset': 'ultrafast',
+        'crf': 30,
         'pip_height' : 225,
         'show_timing_markers': False
     }
@@ -89,6 +104,9 @@ MOCK_TIMINGS = {
     'explanation': {'start': 14.5, 'duration': 4.5},
     'cta': {'start': 19.0, 'duration': 2.5}
 }
+# Read-only from here on; the full mock timeline length is fixed too
+MOCK_TIMINGS = MappingProxyType({k: MappingProxyType(v) for k, v in MOCK_TIMINGS.items()})
+MOCK_TIMINGS_TOTAL = sum(t['duration'] for t in MOCK_TIMINGS.values())
 
 # Showcase of Source footage: One of the purposes of these shorts is to showcase  the original source video to coerce the viewers to watch the full video. So, throughout the duration  of the shorts, in any part  of the screen, the source video must be displayed without loss of aspect ratio and without any masking or blurring.
 MOCK_SCRIPT = {
@@ -123,125 +141,269 @@ ALL_THEMES = {
     }
 }
 
+def _hex_rgb(color):
+    h = color.lstrip('#')
+    return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
+
+# Frozen, with the hex colours pre-parsed once (create_outro_v2 reads highlight_rgb)
+ALL_THEMES = MappingProxyType({
+    name: MappingProxyType(dict(t, highlight_rgb=_hex_rgb(t['highlight']), correct_rgb=_hex_rgb(t['correct'])))
+    for name, t in ALL_THEMES.items()
+})
+
 # Use energetic_yellow as default mock
 MOCK_THEME = ALL_THEMES['energetic_yellow']
 
 
+# ============================================================================
+# RENDER HELPERS
+# ============================================================================
+
+@lru_cache(maxsize=None)
+def _nvenc_available():
+    """True if ffmpeg can actually encode with h264_nvenc (probed once per run)."""
+    cmd = [get_setting("FFMPEG_BINARY"), '-hide_banner', '-loglevel', 'error',
+           '-f', 'lavfi', '-i', 'color=s=256x256:d=0.1',
+           '-c:v', 'h264_nvenc', '-f', 'null', '-']
+    try:
+        return subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL, timeout=15).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def _encoder_args(config, content='animation'):
+    """
+    (codec, preset, extra ffmpeg params): NVENC when present, libx264 otherwise.
+    content picks the x264 tune: 'animation' for synthetic layers, 'film' once real
+    source footage is in frame; ultrafast (visual-dev) renders tune for speed instead.
+    """
+    params = ['-movflags', '+faststart', '-threads', str(config.get('encode_threads', 0)),
+              '-pix_fmt', 'yuv420p']
+    if _nvenc_available():
+        codec, preset = 'h264_nvenc', 'p1'
+        params += ['-rc', 'vbr', '-cq', '28']
+    else:
+        codec, preset = 'libx264', config['render_preset']
+        tune = 'fastdecode,zerolatency' if preset == 'ultrafast' else content
+        params += ['-tune', tune]
+        if config.get('crf') is not None:
+            params += ['-crf', str(config['crf'])]
+    return codec, preset, params
+
+
+def _write_video(clip, output_path, config, logger, content='animation'):
+    """
+    Encode a silent test clip. Modes without audio pipe RGB frames straight into
+    ffmpeg; the rest go through MoviePy's writer.
+    """
+    if not config.get('include_audio', True):
+        frames = clip.iter_frames(fps=config['fps'], dtype='uint8')
+        _pipe_frames(frames, output_path, config, logger, clip.size, 'rgb24', content)
+        return
+    
+    codec, preset, params = _encoder_args(config, content)
+    
+    logger.log(f"Rendering to {output_path} ({codec})")
+    clip.write_videofile(
+        output_path,
+        fps=config['fps'],
+        codec=codec,
+        preset=preset,
+        audio=False,
+        ffmpeg_params=params,
+        logger=logger.moviepy_bar
+    )
+
+
+def _pipe_frames(frames, output_path, config, logger, size, pix_fmt, content='animation'):
+    """Encode an iterable of raw frames (rgb24 arrays or yuv420p buffers) by piping them into ffmpeg."""
+    codec, preset, params = _encoder_args(config, content)
+    w, h = size
+    cmd = [get_setting("FFMPEG_BINARY"), '-y', '-loglevel', 'error',
+           '-f', 'rawvideo', '-pix_fmt', pix_fmt, '-s', f"{w}x{h}",
+           '-r', str(config['fps']), '-i', '-',
+           '-c:v', codec, '-preset', preset] + params + [output_path]
+    
+    logger.log(f"Rendering to {output_path} ({codec}, raw {pix_fmt} pipe)")
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+    try:
+        for frame in frames:
+            proc.stdin.write(frame)
+        proc.stdin.close()
+        if proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with {proc.returncode}")
+    except BaseException:
+        proc.kill()
+        raise
+
+
+@lru_cache(maxsize=4)
+def _load_source(video_path, max_height=1920):
+    """
+    Source clip no taller than max_height, shared by every segment in this process.
+    Taller sources are downscaled once by ffmpeg into temp/ (keyed on path, mtime
+    and size) so later runs reload the small copy instead of resizing per frame.
+    Cached clips stay open for the life of the process.
+    """
+    st = os.stat(video_path)
+    key = hashlib.sha1(repr((os.path.abspath(video_path), st.st_mtime_ns,
+                             st.st_size, max_height)).encode('utf-8')).hexdigest()[:16]
+    resized_path = os.path.join('temp', f"_resized_{key}.mp4")
+    if os.path.exists(resized_path):
+        return VideoFileClip(resized_path)
+    
+    clip = VideoFileClip(video_path)
+    if clip.h <= max_height:
+        return clip
+    clip.close()
+    
+    os.makedirs('temp', exist_ok=True)
+    part_path = f"{resized_path}.{os.getpid()}.part.mp4"  # Per process: --segment each runs workers in parallel
+    subprocess.run([get_setting("FFMPEG_BINARY"), '-y', '-loglevel', 'error', '-i', video_path,
+                    '-vf', f"scale=-2:{max_height}", '-c:v', 'libx264', '-preset', 'fast',
+                    '-crf', '18', '-an', part_path], check=True)
+    os.replace(part_path, resized_path)
+    return VideoFileClip(resized_path)
+
+
+_NAMED_POS = {'center': ['center', 'center'], 'left': ['left', 'center'], 'right': ['right', 'center'],
+              'top': ['center', 'top'], 'bottom': ['center', 'bottom']}
+
+
+def _layer_pos(clip, ct, fg_w, fg_h, W, H):
+    """Top-left pixel of clip at local time ct (same rules as MoviePy's blit_on)."""
+    pos = clip.pos(ct)
+    pos = list(_NAMED_POS[pos]) if isinstance(pos, str) else list(pos)
+    if clip.relative_pos:
+        pos = [dim * p if not isinstance(p, str) else p for p, dim in zip(pos, (W, H))]
+    if isinstance(pos[0], str):
+        pos[0] = {'left': 0, 'center': (W - fg_w) / 2, 'right': W - fg_w}[pos[0]]
+    if isinstance(pos[1], str):
+        pos[1] = {'top': 0, 'center': (H - fg_h) / 2, 'bottom': H - fg_h}[pos[1]]
+    return int(pos[0]), int(pos[1])
+
+
+# One output frame per resolution, shared by every _over() render in this process
+_FRAME_BUFS = {}
+
+
+def _over(layers, size):
+    """
+    Back-to-front "over" composite of an opaque full-frame bottom layer plus overlays.
+    Overlays (clips or lists of clips; None is skipped) are blended in place into a
+    single copy of the bottom frame with 8-bit integer alpha, instead of
+    CompositeVideoClip's zero canvas and full-frame copy per layer.
+    The returned frame is a reused buffer: valid until the next frame is requested,
+    which is all the encoders here need.
+    """
+    bg = layers[0]
+    overlays = []
+    for layer in layers[1:]:
+        if isinstance(layer, (list, tuple)):
+            overlays.extend(c for c in layer if c is not None)
+        elif layer is not None:
+            overlays.append(layer)
+    W, H = size
+    if (H, W) not in _FRAME_BUFS:
+        _FRAME_BUFS[(H, W)] = np.empty((H, W, 3), dtype=np.uint8)
+    out = _FRAME_BUFS[(H, W)]
+    
+    def make_frame(t):
+        np.copyto(out, bg.get_frame(t)[:, :, :3], casting='unsafe')
+        for clip in overlays:
+            if not clip.is_playing(t):
+                continue
+            ct = t - clip.start
+            fg = clip.get_frame(ct)
+            fg_h, fg_w = fg.shape[:2]
+            x, y = _layer_pos(clip, ct, fg_w, fg_h, W, H)
+            x0, y0, x1, y1 = max(x, 0), max(y, 0), min(x + fg_w, W), min(y + fg_h, H)
+            if x0 >= x1 or y0 >= y1:
+                continue
+            src = fg[y0 - y:y1 - y, x0 - x:x1 - x, :3].astype(np.uint16)
+            region = out[y0:y1, x0:x1]
+            if clip.mask is None:
+                region[:] = src
+                continue
+            a = (clip.mask.get_frame(ct)[y0 - y:y1 - y, x0 - x:x1 - x] * 256 + 0.5).astype(np.uint16)[:, :, None]
+            region[:] = (region * (256 - a) + src * a) >> 8
+        return out
+    
+    ends = [c.end for c in [bg] + overlays if c.end is not None]
+    return VideoClip(make_frame, duration=max(ends) if ends else None)
+
+
+@lru_cache(maxsize=8)
+def _get_backdrop(vfx, resolution, duration):
+    """Particle backdrop for one effects instance, built once per (resolution, duration)."""
+    return vfx.create_particle_backdrop(duration)
+
+
 # ============================================================================
 # MAIN TEST FUNCTIONS
 # ============================================================================
 
-def test_backdrop(config, logger, theme_str):
+def test_backdrop(config, logger, vfx):
     """Test particle backdrop animation"""
     logger.section_start("Testing Backdrop")
     # Set resolution for this test
     set_resolution(config['resolution'][0], config['resolution'][1],config['fps'])
     
-    theme=ALL_THEMES[theme_str]
     duration = config.get('segment_duration', 5)
     
-    vfx = QuizVisualEffects(
-        theme=theme,
-        config=config,
-        timing_data=MOCK_TIMINGS,
-        logger=logger
-    )
-    
-    backdrop = vfx.create_particle_backdrop(duration)
-    
     output_path = 'shorts/TEST_BACKDROP.mp4'
-    os.makedirs('shorts', exist_ok=True)
     
-    logger.log(f"Rendering to {output_path}")
-    backdrop.write_videofile(
-        output_path,
-        fps=config['fps'],
-        codec='libx264',
-        preset=config['render_preset'],
-        audio=False,
-        logger=None if logger.level == LogLevel.SILENT else 'bar'
-    )
+    # Backdrop alone needs no compositing: paint I420 planes and pipe them as-is
+    frames = vfx.iter_particle_backdrop_yuv(duration, config['fps'])
+    _pipe_frames(frames, output_path, config, logger, config['resolution'], 'yuv420p')
     
     logger.section_end("Testing Backdrop")
     return output_path
 
 
-def test_pip(config, logger, video_path):
+def test_pip(config, logger, vfx, video_path):
     """Test PIP source video positioning"""
     logger.section_start("Testing PIP")
     
     # Set resolution for this test
     set_resolution(config['resolution'][0], config['resolution'][1],config['fps'])
     
-    if not os.path.exists(video_path):
-        logger.error(f"Video not found: {video_path}")
-        return None
-    
-    theme=ALL_THEMES[config.get('theme', 'energetic_yellow')]
     duration = config.get('segment_duration', 5)
     
-    # Load source video
+    # Load source video, capped to screen height (will be cropped in PIP function)
     logger.log("Loading source video")
-    source_vid = VideoFileClip(video_path)
-    
-    # Resize to fit screen (will be cropped in PIP function)
-    if source_vid.h > 1920:
-        source_vid = source_vid.resize(height=1920)
-    
-    vfx = QuizVisualEffects(
-        theme=theme,
-        config=config,
-        timing_data=MOCK_TIMINGS,
-        logger=logger
-    )
+    source_vid = _load_source(video_path)
     
     # Create backdrop
-    backdrop = vfx.create_particle_backdrop(duration)
+    backdrop = _get_backdrop(vfx, config['resolution'], duration)
     
     # Create PIP
     pip = vfx.create_pip_source_video(source_vid.subclip(0, min(duration, source_vid.duration)), duration)
     
     # Composite
-    final = CompositeVideoClip([backdrop, pip], size=config['resolution'])
+    final = _over([backdrop, pip], config['resolution'])
     
     output_path = 'shorts/TEST_PIP.mp4'
-    logger.log(f"Rendering to {output_path}")
-    final.write_videofile(
-        output_path,
-        fps=config['fps'],
-        codec='libx264',
-        preset=config['render_preset'],
-        audio=False,
-        logger=None if logger.level == LogLevel.SILENT else 'bar'
-    )
-    
-    # Cleanup
-    source_vid.close()
+    _write_video(final, output_path, config, logger, content='film')
     
     logger.section_end("Testing PIP")
     return output_path
 
 
-def test_typewriter(config, logger, theme_str):
+def test_typewriter(config, logger, vfx):
     """Test typewriter text animation"""
     logger.section_start("Testing TypeWriter Effect")
     
     # Set resolution for this test
     set_resolution(config['resolution'][0], config['resolution'][1],config['fps'])
     
-    theme=ALL_THEMES[theme_str]
+    theme = vfx.theme
     duration = 8
     question_text = "What is the chemical formula for water?"
     question_audio_duration = 3.5  # Mock audio length
     
-    vfx = QuizVisualEffects(
-        theme=theme,
-        config=config,
-        timing_data=MOCK_TIMINGS,
-        logger=logger
-    )
-    
-    backdrop = vfx.create_particle_backdrop(duration)
+    backdrop = _get_backdrop(vfx, config['resolution'], duration)
     
     typewriter = vfx.create_typewriter_text(
         text=question_text,
@@ -252,28 +414,18 @@ def test_typewriter(config, logger, theme_str):
         y_offset=900
     )
     
-    if typewriter:
-        final = CompositeVideoClip([backdrop, typewriter], size=config['resolution'])
-    else:
+    if not typewriter:
         logger.warning("TypeWriter returned None")
-        final = backdrop
+    final = _over([backdrop, typewriter], config['resolution'])
     
     output_path = 'shorts/TEST_TYPEWRITER.mp4'
-    logger.log(f"Rendering to {output_path}")
-    final.write_videofile(
-        output_path,
-        fps=config['fps'],
-        codec='libx264',
-        preset=config['render_preset'],
-        audio=False,
-        logger=None if logger.level == LogLevel.SILENT else 'bar'
-    )
+    _write_video(final, output_path, config, logger)
     
     logger.section_end("Testing TypeWriter Effect")
     return output_path
 
 
-def test_options(config, logger):
+def test_options(config, logger, vfx):
     """Test options slide-in animation"""
     logger.section_start("Testing Options Sequence")
     
@@ -289,35 +441,19 @@ def test_options(config, logger):
         {'text': 'D) Carbon Dioxide', 'start_time': 2.9, 'duration': 9.1, 'is_correct': False}
     ]
     
-    vfx = QuizVisualEffects(
-        theme=MOCK_THEME,
-        config=config,
-        timing_data=MOCK_TIMINGS,
-        logger=logger
-    )
-    
-    backdrop = vfx.create_particle_backdrop(duration)
-    options_clips = vfx.create_options_sequence(options_data, MOCK_THEME)
+    backdrop = _get_backdrop(vfx, config['resolution'], duration)
+    options_clips = vfx.create_options_sequence(options_data, vfx.theme)
     
-    all_clips = [backdrop] + options_clips
-    final = CompositeVideoClip(all_clips, size=config['resolution'])
+    final = _over([backdrop, options_clips], config['resolution'])
     
     output_path = 'shorts/TEST_OPTIONS.mp4'
-    logger.log(f"Rendering to {output_path}")
-    final.write_videofile(
-        output_path,
-        fps=config['fps'],
-        codec='libx264',
-        preset=config['render_preset'],
-        audio=False,
-        logger=None if logger.level == LogLevel.SILENT else 'bar'
-    )
+    _write_video(final, output_path, config, logger)
     
     logger.section_end("Testing Options Sequence")
     return output_path
 
 
-def test_timer(config, logger):
+def test_timer(config, logger, vfx):
     """Test timer animation"""
     logger.section_start("Testing Timer Animation")
     
@@ -326,39 +462,23 @@ def test_timer(config, logger):
     
     duration = 6
     
-    vfx = QuizVisualEffects(
-        theme=MOCK_THEME,
-        config=config,
-        timing_data=MOCK_TIMINGS,
-        logger=logger
-    )
-    
-    backdrop = vfx.create_particle_backdrop(duration)
+    backdrop = _get_backdrop(vfx, config['resolution'], duration)
     timer_clips = vfx.create_timer_animation(
         start_time=1.0,
         duration=3.0,
         y_position=1550
     )
     
-    all_clips = [backdrop] + timer_clips
-    final = CompositeVideoClip(all_clips, size=config['resolution'])
+    final = _over([backdrop, timer_clips], config['resolution'])
     
     output_path = 'shorts/TEST_TIMER.mp4'
-    logger.log(f"Rendering to {output_path}")
-    final.write_videofile(
-        output_path,
-        fps=config['fps'],
-        codec='libx264',
-        preset=config['render_preset'],
-        audio=False,
-        logger=None if logger.level == LogLevel.SILENT else 'bar'
-    )
+    _write_video(final, output_path, config, logger)
     
     logger.section_end("Testing Timer Animation")
     return output_path
 
 
-def test_cta_banner(config, logger):
+def test_cta_banner(config, logger, vfx):
     """Test split-display CTA banner"""
     logger.section_start("Testing Split CTA Banner")
     
@@ -367,14 +487,7 @@ def test_cta_banner(config, logger):
     
     duration = 10
     
-    vfx = QuizVisualEffects(
-        theme=MOCK_THEME,
-        config=config,
-        timing_data=MOCK_TIMINGS,
-        logger=logger
-    )
-    
-    backdrop = vfx.create_particle_backdrop(duration)
+    backdrop = _get_backdrop(vfx, config['resolution'], duration)
     
     # Split CTA: Social action → Link directive
     cta = vfx.create_cta_banner(
@@ -387,27 +500,17 @@ def test_cta_banner(config, logger):
         style='full-banner'
     )
     
-    if cta:
-        final = CompositeVideoClip([backdrop, cta], size=config['resolution'])
-    else:
+    if not cta:
         logger.warning("CTA creation returned None")
-        final = backdrop
+    final = _over([backdrop, cta], config['resolution'])
     
     output_path = 'shorts/TEST_CTA_SPLIT.mp4'
-    logger.log(f"Rendering to {output_path}")
-    final.write_videofile(
-        output_path,
-        fps=config['fps'],
-        codec='libx264',
-        preset=config['render_preset'],
-        audio=False,
-        logger=None if logger.level == LogLevel.SILENT else 'bar'
-    )
+    _write_video(final, output_path, config, logger)
     
     logger.section_end("Testing Split CTA Banner")
     return output_path
 
-def test_outro(config, logger, theme_str):
+def test_outro(config, logger, vfx, theme_str):
     """Test outro animation and styling"""
     logger.section_start("Testing Outro")
     
@@ -433,104 +536,56 @@ def test_outro(config, logger, theme_str):
     )
     
     # Create simple backdrop for context
-    from visual_effects_quiz import QuizVisualEffects
-    vfx = QuizVisualEffects(
-        theme=theme,
-        config=config,
-        timing_data=None,
-        logger=logger
-    )
-    
-    backdrop = vfx.create_particle_backdrop(outro_duration)
+    backdrop = _get_backdrop(vfx, config['resolution'], outro_duration)
     
     # Composite backdrop + outro
-    final = CompositeVideoClip([backdrop, outro], size=config['resolution'])
+    final = _over([backdrop, outro], config['resolution'])
     
     output_path = f'shorts/TEST_OUTRO_{theme_str.upper()}.mp4'
-    os.makedirs('shorts', exist_ok=True)
     
-    logger.log(f"Rendering to {output_path}")
-    final.write_videofile(
-        output_path,
-        fps=config['fps'],
-        codec='libx264',
-        preset=config['render_preset'],
-        audio=False,
-        logger=None if logger.level == LogLevel.SILENT else 'bar'
-    )
+    _write_video(final, output_path, config, logger)
     
     logger.section_end("Testing Outro")
     return output_path
 
-def test_timing_markers(config, logger):
+def test_timing_markers(config, logger, vfx):
     """Test timing marker visualization"""
     logger.section_start("Testing Timing Markers")
     
     # Set resolution for this test
     set_resolution(config['resolution'][0], config['resolution'][1])
     
-    duration = sum(t['duration'] for t in MOCK_TIMINGS.values())
+    duration = MOCK_TIMINGS_TOTAL
     
-    vfx = QuizVisualEffects(
-        theme=MOCK_THEME,
-        config=config,
-        timing_data=MOCK_TIMINGS,
-        logger=logger
-    )
-    
-    backdrop = vfx.create_particle_backdrop(duration)
+    backdrop = _get_backdrop(vfx, config['resolution'], duration)
     markers = vfx.create_timing_markers(MOCK_TIMINGS, duration)
     
-    if markers:
-        final = CompositeVideoClip([backdrop, markers], size=config['resolution'])
-    else:
-        final = backdrop
+    final = _over([backdrop, markers], config['resolution'])
     
     output_path = 'shorts/TEST_TIMING_MARKERS.mp4'
-    logger.log(f"Rendering to {output_path}")
-    final.write_videofile(
-        output_path,
-        fps=config['fps'],
-        codec='libx264',
-        preset=config['render_preset'],
-        audio=False,
-        logger=None if logger.level == LogLevel.SILENT else 'bar'
-    )
+    _write_video(final, output_path, config, logger)
     
     logger.section_end("Testing Timing Markers")
     return output_path
 
 
-def test_full_base(config, logger, video_path, theme_str):
+def test_full_base(config, logger, vfx, video_path):
     """Test complete base layer (backdrop + PIP + markers)"""
     logger.section_start("Testing Full Base Layer")
     
     # Set resolution for this test
     set_resolution(config['resolution'][0], config['resolution'][1])
     
-    if not os.path.exists(video_path):
-        logger.error(f"Video not found: {video_path}")
-        return None
-    
     duration = config.get('segment_duration', 15)
     
     # Load source video
-    source_vid = VideoFileClip(video_path)
-    if source_vid.h > 1920:
-        source_vid = source_vid.resize(height=1920)
-    
-    vfx = QuizVisualEffects(
-        theme=ALL_THEMES[theme_str],
-        config=config,
-        timing_data=MOCK_TIMINGS,
-        logger=logger
-    )
+    source_vid = _load_source(video_path)
     
     clips = []
     
     # Layer 1: Backdrop
     logger.log("Creating backdrop")
-    backdrop = vfx.create_particle_backdrop(duration)
+    backdrop = _get_backdrop(vfx, config['resolution'], duration)
     clips.append(backdrop)
     
     # Layer 2: PIP
@@ -545,26 +600,161 @@ def test_full_base(config, logger, video_path, theme_str):
         if markers:
             clips.append(markers)
     
-    final = CompositeVideoClip(clips, size=config['resolution'])
+    final = _over(clips, config['resolution'])
     
     output_path = 'shorts/TEST_FULL_BASE.mp4'
-    logger.log(f"Rendering to {output_path}")
-    final.write_videofile(
-        output_path,
-        fps=config['fps'],
-        codec='libx264',
-        preset=config['render_preset'],
-        audio=False,
-        logger=None if logger.level == LogLevel.SILENT else 'bar'
+    _write_video(final, output_path, config, logger, content='film')
+    
+    logger.section_end("Testing Full Base Layer")
+    return output_path
+
+
+def test_all(config, logger, vfx, video_path):
+    """Test every segment in one pass: all layers over one backdrop, one encode"""
+    logger.section_start("Testing All Segments")
+    
+    # Set resolution for this test
+    set_resolution(config['resolution'][0], config['resolution'][1], config['fps'])
+    
+    # Lay the segments out on the mock quiz timeline
+    duration = MOCK_TIMINGS_TOTAL
+    q, think, cta = MOCK_TIMINGS['question'], MOCK_TIMINGS['think'], MOCK_TIMINGS['cta']
+    
+    clips = [_get_backdrop(vfx, config['resolution'], duration)]
+    
+    # PIP is optional here so the rest can be reviewed without source footage
+    if video_path:
+        logger.log("Creating PIP")
+        source_vid = _load_source(video_path)
+        clips.append(vfx.create_pip_source_video(
+            source_vid.subclip(0, min(duration, source_vid.duration)), duration))
+    else:
+        logger.warning("No source video, skipping PIP")
+    
+    typewriter = vfx.create_typewriter_text(
+        text="What is the chemical formula for water?",
+        audio_duration=q['duration'],
+        start_time=q['start'],
+        fontsize=55,
+        color=vfx.theme['highlight'],
+        y_offset=900
     )
+    if typewriter:
+        clips.append(typewriter)
     
-    # Cleanup
-    source_vid.close()
+    options_end = think['start'] + think['duration']
+    options_data = [
+        {'text': f"{letter}) {MOCK_SCRIPT[f'opt_{letter.lower()}_visual']}",
+         'start_time': MOCK_TIMINGS[f'opt_{letter.lower()}']['start'],
+         'duration': options_end - MOCK_TIMINGS[f'opt_{letter.lower()}']['start'],
+         'is_correct': letter == 'A'}
+        for letter in 'ABCD'
+    ]
+    clips.extend(vfx.create_options_sequence(options_data, vfx.theme))
     
-    logger.section_end("Testing Full Base Layer")
+    clips.extend(vfx.create_timer_animation(
+        start_time=think['start'],
+        duration=think['duration'],
+        y_position=1550
+    ))
+    
+    half = cta['duration'] / 2
+    banner = vfx.create_cta_banner(
+        social_text="🔔 SUBSCRIBE FOR MORE!",
+        link_text="📎 Full Video in Description",
+        social_start=cta['start'],
+        social_duration=half,
+        link_start=cta['start'] + half,
+        link_duration=half,
+        style=config.get('cta_style', 'full-banner')
+    )
+    if banner:
+        clips.append(banner)
+    
+    if config.get('show_timing_markers', False):
+        markers = vfx.create_timing_markers(MOCK_TIMINGS, duration)
+        if markers:
+            clips.append(markers)
+    
+    final = _over(clips, config['resolution']).set_duration(duration)
+    
+    output_path = 'shorts/TEST_ALL.mp4'
+    _write_video(final, output_path, config, logger, content='film' if video_path else 'animation')
+    
+    logger.section_end("Testing All Segments")
     return output_path
 
 
+def run_segment(segment, config, logger, theme_name, video_path):
+    """Run one segment test; returns its output path (None if the test failed)"""
+    _import_render_stack()
+    if segment == 'pip':
+        set_resolution(config['resolution'][0], config['resolution'][1])
+        PIP_HEIGHT = res_scale(225)  # Will scale based on resolution
+        config['pip_size'] = (int(PIP_HEIGHT * 16 / 9), PIP_HEIGHT)
+    elif segment in ('full', 'all'):
+        set_resolution(config['resolution'][0], config['resolution'][1])
+        PIP_HEIGHT = res_scale(495)  # Will scale based on resolution
+        config['pip_size'] = (int(PIP_HEIGHT * 16 / 9), PIP_HEIGHT)
+    
+    # One effects instance (and its cached backdrops) for everything this segment draws
+    vfx = QuizVisualEffects(
+        theme=ALL_THEMES[theme_name],
+        config=config,
+        timing_data=MOCK_TIMINGS,
+        logger=logger
+    )
+    
+    if segment == 'backdrop':
+        output = test_backdrop(config, logger, vfx)
+    elif segment == 'pip':
+        output = test_pip(config, logger, vfx, video_path)
+    elif segment == 'markers':
+        output = test_timing_markers(config, logger, vfx)
+    elif segment == 'cta':
+        output = test_cta_banner(config, logger, vfx)
+    elif segment == 'typewriter':
+        output = test_typewriter(config, logger, vfx)
+    elif segment == 'options':
+        output = test_options(config, logger, vfx)
+    elif segment == 'timer':
+        output = test_timer(config, logger, vfx)
+    elif segment == 'outro':
+        output = test_outro(config, logger, vfx, theme_name)
+    elif segment == 'full':
+        output = test_full_base(config, logger, vfx, video_path)
+    elif segment == 'all':
+        output = test_all(config, logger, vfx, video_path)
+    else:
+        raise ValueError(f"Unknown segment: {segment}")
+    return output
+
+
+# Every single-segment test, in the order 'each' submits them
+SEGMENTS = ('backdrop', 'pip', 'markers', 'cta', 'typewriter', 'options', 'timer', 'outro', 'full')
+# Segments that cannot run without source footage
+VIDEO_SEGMENTS = ('pip', 'full')
+
+
+def _segment_worker(segment, config, log_level, theme_name, video_path):
+    """Process-pool entry point: fresh logger/effects per process"""
+    logger = create_logger(log_level)
+    return run_segment(segment, dict(config), logger, theme_name, video_path)
+
+
+def run_segments_parallel(config, log_level, theme_name, video_path):
+    """Run every segment test in its own spawned process; returns {segment: output}"""
+    segments = SEGMENTS if video_path else tuple(s for s in SEGMENTS if s not in VIDEO_SEGMENTS)
+    # Each encode gets a fixed thread budget so N concurrent x264s don't oversubscribe
+    workers = max(1, (os.cpu_count() or 4) // 4)
+    config = dict(config, encode_threads=4)
+    ctx = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = {seg: pool.submit(_segment_worker, seg, config, log_level, theme_name, video_path)
+                   for seg in segments}
+        return {seg: f.result() for seg, f in futures.items()}
+
+
 # ============================================================================
 # CLI INTERFACE
 # ============================================================================
@@ -581,6 +771,12 @@ Examples:
   # Test sync with timing markers
   python test_quiz_visuals.py --mode sync-test --segment full --video temp/test_source.mp4
   
+  # Every segment over one backdrop in a single encode
+  python test_quiz_visuals.py --mode visual-dev --segment all --video temp/test_source.mp4
+  
+  # Every segment as its own file, rendered in parallel processes
+  python test_quiz_visuals.py --mode visual-dev --segment each --video temp/test_source.mp4
+  
   # Production preview
   python test_quiz_visuals.py --mode production-preview --segment full --video temp/test_source.mp4 --log-level minimal
         """
@@ -595,7 +791,7 @@ Examples:
 
     parser.add_argument(
         '--segment',
-        choices=['backdrop', 'pip', 'markers', 'cta', 'typewriter', 'options', 'timer', 'outro', 'full'],
+        choices=['backdrop', 'pip', 'markers', 'cta', 'typewriter', 'options', 'timer', 'outro', 'full', 'all', 'each'],
         default='backdrop',
         help='Which segment to test'
     )
@@ -668,7 +864,7 @@ Examples:
     if args.cta_style:
         config['cta_style'] = args.cta_style
 
-    if args.segment in ['pip', 'full']:
+    if args.segment in ['pip', 'full', 'all']:
         config['pip_size'] = (int(args.pip_height * 16 / 9), args.pip_height)
     # Select theme
     selected_theme = ALL_THEMES[args.theme]
@@ -689,35 +885,23 @@ Examples:
         "Render Preset": config['render_preset']
     })
     
+    # Filesystem checks happen once here rather than in every test
+    os.makedirs('shorts', exist_ok=True)
+    video_path = args.video if os.path.exists(args.video) else None
+    if video_path is None:
+        if args.segment in VIDEO_SEGMENTS:
+            logger.error(f"Video not found: {args.video}")
+            return 1
+        if args.segment == 'each':
+            logger.warning(f"Video not found, skipping {', '.join(VIDEO_SEGMENTS)}: {args.video}")
+    
     # Run test
     try:
-        if args.segment == 'backdrop':
-            output = test_backdrop(config, logger, args.theme)
-        elif args.segment == 'pip':
-            set_resolution(config['resolution'][0], config['resolution'][1])
-            PIP_HEIGHT = res_scale(225)  # Will scale based on resolution
-            config['pip_size'] = (int(PIP_HEIGHT * 16 / 9), PIP_HEIGHT)
-            output = test_pip(config, logger, args.video)
-        elif args.segment == 'markers':
-            output = test_timing_markers(config, logger)
-        elif args.segment == 'cta':
-            output = test_cta_banner(config, logger)
-        elif args.segment == 'typewriter':
-            output = test_typewriter(config, logger, args.theme)
-        elif args.segment == 'options':
-            output = test_options(config, logger)
-        elif args.segment == 'timer':
-            output = test_timer(config, logger)
-        elif args.segment == 'outro':
-            output = test_outro(config, logger, args.theme)
-        elif args.segment == 'full':
-            set_resolution(config['resolution'][0], config['resolution'][1])
-            PIP_HEIGHT = res_scale(495)  # Will scale based on resolution
-            config['pip_size'] = (int(PIP_HEIGHT * 16 / 9), PIP_HEIGHT)
-            output = test_full_base(config, logger, args.video, args.theme)
+        if args.segment == 'each':
+            outputs = run_segments_parallel(config, args.log_level, args.theme, video_path)
+            output = ", ".join(o for o in outputs.values() if o) if all(outputs.values()) else None
         else:
-            logger.error(f"Unknown segment: {args.segment}")
-            return 1
+            output = run_segment(args.segment, config, logger, args.theme, video_path)
         
         if output:
             logger.summary("Test Complete", {
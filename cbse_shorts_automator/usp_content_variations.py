@@ -20,7 +20,7 @@ class USPContent:
     # -------------------------------------------------------------------------
     # HOOK VARIATIONS (Opening attention grabber)
     # -------------------------------------------------------------------------
-    HOOKS = [
+    HOOKS = (
         "⚡ 7-MINUTE CHAPTER MASTERY ⚡",
         "🚀 FASTEST REVISION EVER 🚀",
         "⏱️ EXAM READY IN 60 SECONDS ⏱️",
@@ -31,12 +31,12 @@ class USPContent:
         "✨ SHORT, SWEET, SMART ✨",
         "💥 FAST TRACK TO SUCCESS 💥",
         "🚀 ZERO SLEEP, FULL PREP 🚀"
-    ]
+    )
     
     # -------------------------------------------------------------------------
     # QUESTION PREFIXES (Affectionate addressing)
     # -------------------------------------------------------------------------
-    QUESTION_PREFIXES = [
+    QUESTION_PREFIXES = (
         "Quick Brainiacs! ",      # Affectionate + Smart
         "Speed Stars! ",          # Trendy + Fast
         "Exam Warriors! ",        # Empowering + Target
@@ -47,12 +47,12 @@ class USPContent:
         "Smart Cookies! ",        # Playful + Affectionate
         "Knowledge Seekers! ",    # Respectful + Empowering
         "Bright Minds! "          # Positive + Encouraging
-    ]
+    )
     
     # -------------------------------------------------------------------------
     # TIMER LABELS (Speed emphasis during countdown)
     # -------------------------------------------------------------------------
-    TIMER_LABELS = [
+    TIMER_LABELS = (
         "⚡ THINK FAST",
         "🚀 QUICK THINKING",
         "⏱️ SPEED MODE",
@@ -60,12 +60,12 @@ class USPContent:
         "⚡ LIGHTNING ROUND",
         "🎯 FAST BRAIN",
         "💥 QUICK RECALL"
-    ]
+    )
     
     # -------------------------------------------------------------------------
     # ANSWER REVEAL PREFIXES (Celebration + Learning)
     # -------------------------------------------------------------------------
-    ANSWER_PREFIXES = [
+    ANSWER_PREFIXES = (
         "💯 NAILED IT! ",
         "🎯 PERFECT! ",
         "⚡ SUPER QUICK! ",
@@ -75,12 +75,12 @@ class USPContent:
         "🌟 BRILLIANT! ",
         "🔥 ON FIRE! ",
         "⚡ LIGHTNING FAST! "
-    ]
+    )
     
     # -------------------------------------------------------------------------
     # CTA VARIATIONS (Call-to-Action with USP reinforcement)
     # -------------------------------------------------------------------------
-    CTA_SOCIAL = [
+    CTA_SOCIAL = (
         "🔔 SUBSCRIBE FOR 7-MIN CHAPTERS",
         "💯 JOIN THE FAST LEARNERS CLUB",
         "⚡ SUBSCRIBE FOR QUICK CONCEPTS",
@@ -88,9 +88,9 @@ class USPContent:
         "✨ SUBSCRIBE FOR ZERO BORING STUFF",
         "🎯 SUBSCRIBE FOR RAPID MASTERY",
         "⏱️ SUBSCRIBE FOR QUICK PREP"
-    ]
+    )
     
-    CTA_LINKS = [
+    CTA_LINKS = (
         "📎 Full 7-Min Chapter Below",
         "🎯 Complete Fast Revision in Link",
         "⚡ Quick Full Chapter in Description",
@@ -98,13 +98,13 @@ class USPContent:
         "💯 Fast Complete Revision Below",
         "⏱️ Speed Through Full Chapter Below",
         "🔥 No-Boring Full Video in Link"
-    ]
+    )
     
     # -------------------------------------------------------------------------
     # OUTRO VARIATIONS (Brand promise reinforcement)
     # Format: (Line 1, Line 2)
     # -------------------------------------------------------------------------
-    OUTRO_MESSAGES = [
+    OUTRO_MESSAGES = (
         ("🚀 7-MINUTE CHAPTERS",  "📚 Every Concept, Zero Boredom"),
         ("⚡ FASTEST REVISIONS",   "🎯 Subscribe for Quick Mastery"),
         ("💯 EXAM READY FAST",    "⏱️ Full Chapters in 7 Minutes"),
@@ -112,44 +112,44 @@ class USPContent:
         ("🎯 QUICK CONCEPTS",     "💪 Big Scores, Short Videos"),
         ("⚡ SPEED LEARNING",      "🚀 Fast, Fun, Effective"),
         ("💥 RAPID MASTERY",      "📖 Subscribe for Quick Prep")
-    ]
+    )
     
     # -------------------------------------------------------------------------
     # HELPER METHODS
     # -------------------------------------------------------------------------
     
     @staticmethod
-    def get_random_hook():
-        """Returns random hook text"""
-        return random.choice(USPContent.HOOKS)
+    def get_random_hook(rng=random):
+        """Returns random hook text (pass a seeded random.Random for reproducible picks)"""
+        return rng.choice(USPContent.HOOKS)
     
     @staticmethod
-    def get_random_question_prefix():
+    def get_random_question_prefix(rng=random):
         """Returns random affectionate prefix for questions"""
-        return random.choice(USPContent.QUESTION_PREFIXES)
+        return rng.choice(USPContent.QUESTION_PREFIXES)
     
     @staticmethod
-    def get_random_timer_label():
+    def get_random_timer_label(rng=random):
         """Returns random timer label"""
-        return random.choice(USPContent.TIMER_LABELS)
+        return rng.choice(USPContent.TIMER_LABELS)
     
     @staticmethod
-    def get_random_answer_prefix():
+    def get_random_answer_prefix(rng=random):
         """Returns random celebration prefix"""
-        return random.choice(USPContent.ANSWER_PREFIXES)
+        return rng.choice(USPContent.ANSWER_PREFIXES)
     
     @staticmethod
-    def get_random_cta():
+    def get_random_cta(rng=random):
         """Returns tuple of (social_action, link_directive)"""
         return (
-            random.choice(USPContent.CTA_SOCIAL),
-            random.choice(USPContent.CTA_LINKS)
+            rng.choice(USPContent.CTA_SOCIAL),
+            rng.choice(USPContent.CTA_LINKS)
         )
     
     @staticmethod
-    def get_random_outro():
+    def get_random_outro(rng=random):
         """Returns tuple of (line1, line2)"""
-        return random.choice(USPContent.OUTRO_MESSAGES)
+        return rng.choice(USPContent.OUTRO_MESSAGES)
     
     @staticmethod
     def enhance_question(question_text):
@@ -5,11 +5,18 @@ Purpose: Timing-aware animation system for Quiz template.
 Provides Hollywood-grade visual effects synchronized to audio.
 """
 
+import os
 import math
 import random
+import hashlib
+import threading
+import concurrent.futures
+from functools import lru_cache
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont, ImageColor
 from moviepy.editor import (
     ColorClip, CompositeVideoClip, TextClip, 
-    ImageClip, vfx
+    ImageClip, VideoClip, vfx
 )
 from debug_logger import DebugLogger, LogLevel
 
@@ -21,6 +28,10 @@ WIDTH = 1080
 HEIGHT = 1920
 FPS =  24
 
+# Scale factors per dimension, refreshed by set_resolution()
+SCALE_H = SCALE_W = SCALE_BOTH = 1.0
+_SCALES = {'height': 1.0, 'width': 1.0, 'both': 1.0}
+
 def res_scale(value, dimension='height'):
     """
     Scale a value based on current resolution vs base resolution.
@@ -36,29 +47,26 @@ def res_scale(value, dimension='height'):
         fontsize=res_scale(55)  # Scales 55 based on height
         width=res_scale(400, 'width')  # Scales 400 based on width
     """
-    global WIDTH, HEIGHT
-    
-    if dimension == 'height':
-        scale_factor = HEIGHT / BASE_HEIGHT
-    elif dimension == 'width':
-        scale_factor = WIDTH / BASE_WIDTH
-    elif dimension == 'both':
-        # Use smaller scale to maintain aspect ratio
-        scale_factor = min(WIDTH / BASE_WIDTH, HEIGHT / BASE_HEIGHT)
-    else:
-        scale_factor = 1.0
-    
-    return int(value * scale_factor)
+    return int(value * _SCALES.get(dimension, 1.0))
+
+def res_scale_f(value):
+    """Height-scaled value as a float, for callers that keep doing float math"""
+    return value * SCALE_H
 
 def set_resolution(width, height, fps=24):
     """
     Set the current resolution for scaling calculations.
     Call this at the start of video generation.
     """
-    global WIDTH, HEIGHT, FPS
+    global WIDTH, HEIGHT, FPS, SCALE_H, SCALE_W, SCALE_BOTH
     WIDTH = width
     HEIGHT = height
     FPS = fps
+    SCALE_H = HEIGHT / BASE_HEIGHT
+    SCALE_W = WIDTH / BASE_WIDTH
+    # Use smaller scale to maintain aspect ratio
+    SCALE_BOTH = min(SCALE_W, SCALE_H)
+    _SCALES.update(height=SCALE_H, width=SCALE_W, both=SCALE_BOTH)
 
 # Font paths (same as shorts_engine.py)
 FONT_REGULAR = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
@@ -72,19 +80,275 @@ DEVICE_FRAMES = {
     'laptop': {'border': 10, 'corner_radius': 5, 'bezel_color': (40, 40, 45)}
 }
 
-class EasingFunctions:
-    """Collection of easing functions for smooth animations"""
+@lru_cache(maxsize=None)
+def _hex_to_rgb(color):
+    """'#RRGGBB' -> (r, g, b); themes reuse a handful of colours, so parse each once."""
+    v = int(color.lstrip('#')[:6], 16)
+    return ((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF)
+
+@lru_cache(maxsize=64)
+def _rgb_to_hex(color):
+    """(r, g, b) tuple -> '#rrggbb'."""
+    return '#%02x%02x%02x' % (int(color[0]), int(color[1]), int(color[2]))
+
+@lru_cache(maxsize=64)
+def _parse_color_cached(color):
+    """Hex string or (r, g, b) tuple -> (r, g, b); anything else is white."""
+    if isinstance(color, str) and color.startswith('#'):
+        return _hex_to_rgb(color)
+    elif isinstance(color, tuple):
+        return color
+    else:
+        return (255, 255, 255)  # Default white
+
+# Rasterized text shared across runs (same dir ShortsEngine uses by default)
+_TEXT_CACHE_DIR = os.path.join('temp', 'textcache')
+
+# Independent text rasterizations (options, typewriter steps) are submitted here
+# together; Pillow and numpy release the GIL for most of the work
+_TEXT_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+@lru_cache(maxsize=32)
+def _font(path, size):
+    """ImageFont.truetype(path, size), loaded once per (font file, size)."""
+    return ImageFont.truetype(path, size)
+
+def _wrap_line(paragraph, font, max_w, stroke):
+    """Greedy word wrap of one paragraph to max_w pixels (ImageMagick caption: semantics)."""
+    lines = []
+    for word in paragraph.split(' '):
+        trial = f"{lines[-1]} {word}" if lines else word
+        if lines and font.getlength(trial) + 2 * stroke > max_w:
+            lines.append(word)
+        else:
+            lines[-1:] = [trial]
+    return lines or ['']
+
+def _text_layout(text, fontsize, font, stroke_color, stroke_width, size, method):
+    """Line breaks and pixel extents of text as _render_text_pil lays it out, without drawing."""
+    pil_font = _font(font, int(fontsize))
+    stroke = int(stroke_width) if stroke_color and stroke_width else 0
+    box_w, box_h = size if size else (None, None)
     
-    @staticmethod
-    def ease_out_elastic(t, overshoot=1.1):
-        """
-        Elastic easing - overshoots then settles.
-        t: progress from 0 to 1
-        """
+    paragraphs = str(text).split('\n')
+    if method == 'caption' and box_w:
+        lines = [line for para in paragraphs for line in _wrap_line(para, pil_font, box_w, stroke)]
+    else:
+        lines = paragraphs
+    
+    ascent, descent = pil_font.getmetrics()
+    line_h = ascent + descent + 2 * stroke
+    widths = [int(math.ceil(pil_font.getlength(line))) + 2 * stroke for line in lines]
+    w = int(box_w) if box_w else max(widths)
+    h = int(box_h) if box_h else line_h * len(lines)
+    return pil_font, stroke, lines, widths, line_h, w, h
+
+def _render_text_pil(text, fontsize=30, color='black', font=FONT_REGULAR, stroke_color=None,
+                     stroke_width=0, size=None, method='label', align='center', bg_color=None, **_):
+    """
+    Pillow stand-in for TextClip's label/caption rendering: returns an RGBA uint8
+    array. Fill and stroke coverage are drawn as separate 'L' masks and combined
+    in numpy, so antialiased edges keep the true text colour.
+    """
+    pil_font, stroke, lines, widths, line_h, w, h = _text_layout(
+        text, fontsize, font, stroke_color, stroke_width, size, method)
+    
+    # ImageMagick gravity names plus plain left/right/center
+    align = str(align).lower()
+    halign = 'left' if ('west' in align or align == 'left') else 'right' if ('east' in align or align == 'right') else 'center'
+    valign = 'top' if align.startswith('north') else 'bottom' if align.startswith('south') else 'center'
+    y = {'top': 0, 'bottom': h - line_h * len(lines)}.get(valign, (h - line_h * len(lines)) // 2)
+    
+    fill_cov = Image.new('L', (w, h), 0)
+    outer_cov = Image.new('L', (w, h), 0)
+    fill_draw, outer_draw = ImageDraw.Draw(fill_cov), ImageDraw.Draw(outer_cov)
+    for line, line_w in zip(lines, widths):
+        x = {'left': 0, 'right': w - line_w}.get(halign, (w - line_w) // 2)
+        fill_draw.text((x + stroke, y + stroke), line, font=pil_font, fill=255)
+        outer_draw.text((x + stroke, y + stroke), line, font=pil_font, fill=255,
+                        stroke_width=stroke, stroke_fill=255)
+        y += line_h
+    
+    fill_a = np.asarray(fill_cov, dtype=np.float32)[:, :, None] / 255
+    text_a = np.maximum(np.asarray(outer_cov, dtype=np.float32), np.asarray(fill_cov, dtype=np.float32))[:, :, None] / 255
+    text_rgb = np.asarray(ImageColor.getrgb(color)[:3], dtype=np.float32)
+    if stroke:
+        # Fill coverage as a fraction of the outline coverage picks fill vs stroke colour
+        mix = np.divide(fill_a, text_a, out=np.zeros_like(fill_a), where=text_a > 0)
+        text_rgb = text_rgb * mix + np.asarray(ImageColor.getrgb(stroke_color)[:3], dtype=np.float32) * (1 - mix)
+    else:
+        text_rgb = np.broadcast_to(text_rgb, fill_a.shape[:2] + (3,))
+    
+    if bg_color and bg_color != 'transparent':
+        bg = np.asarray(ImageColor.getrgb(bg_color)[:3], dtype=np.float32)
+        rgb = bg * (1 - text_a) + text_rgb * text_a
+        alpha = np.full(text_a.shape, 255.0, dtype=np.float32)
+    else:
+        rgb, alpha = text_rgb, text_a * 255
+    return np.concatenate([rgb, alpha], axis=2).round().astype(np.uint8)
+
+@lru_cache(maxsize=512)
+def _measure_text(text, **style):
+    """
+    (w, h) that _text_clip(text, **style) would have. TrueType fonts are measured
+    from the Pillow layout alone; named fonts fall back to a full render.
+    """
+    font = style.get('font', FONT_REGULAR)
+    if os.path.isfile(font):
+        _, _, _, _, _, w, h = _text_layout(
+            text, style.get('fontsize', 30), font, style.get('stroke_color'),
+            style.get('stroke_width', 0), style.get('size'), style.get('method', 'label'))
+        return w, h
+    return tuple(_text_clip(text, **style).size)
+
+@lru_cache(maxsize=512)
+def _text_clip(text, **style):
+    """
+    Text rendered once per distinct (text, style): kept as an RGBA PNG on disk and
+    decoded once per process. Repeat calls in a process (countdown digits, option
+    letters) skip the hash and stat too; MoviePy's set_* return copies, so sharing
+    the clip is safe.
+    TrueType font files are drawn with Pillow; named fonts (e.g. 'Noto Color Emoji')
+    still go through TextClip/ImageMagick, which resolves them.
+    """
+    use_pil = os.path.isfile(style.get('font', FONT_REGULAR))
+    key = hashlib.blake2b(repr(('pil' if use_pil else 'im', text, sorted(style.items()))).encode('utf-8'),
+                          digest_size=16).hexdigest()
+    png_path = os.path.join(_TEXT_CACHE_DIR, f"vfx_{key}.png")
+    if not os.path.exists(png_path):
+        os.makedirs(_TEXT_CACHE_DIR, exist_ok=True)
+        # Written beside the final name so a parallel worker never reads a partial file;
+        # per thread too, since _TEXT_POOL threads can rasterize the same text at once
+        tmp = f"{png_path[:-4]}.{os.getpid()}.{threading.get_ident()}.png"
+        if use_pil:
+            Image.fromarray(_render_text_pil(text, **style), 'RGBA').save(tmp)
+        else:
+            TextClip(text, **style).save_frame(tmp, withmask=True)
+        os.replace(tmp, png_path)
+    return ImageClip(png_path, transparent=True)
+
+def _solid_clip(size, color, opacity=1.0):
+    """
+    Static solid rectangle: ColorClip(size, color).set_opacity(opacity) with the
+    opacity held in a constant ImageClip mask, so no per-frame mask scaling.
+    """
+    w, h = size
+    clip = ImageClip(np.full((h, w, 3), color, dtype=np.uint8))
+    if opacity < 1.0:
+        clip = clip.set_mask(ImageClip(np.full((h, w), float(opacity)), ismask=True))
+    return clip
+
+def _frame_times(duration):
+    """Frame timestamps at FPS covering [0, duration], plus one frame of slack."""
+    return np.arange(int(duration * FPS) + 2) / FPS
+
+def _lut_callback(values, fps=None):
+    """MoviePy t-callback over a per-frame table (nearest frame, clamped to the last entry)."""
+    fps = fps or FPS
+    last = len(values) - 1
+    # Captures bound as defaults: read as locals on every frame, not closure cells
+    return lambda t, _v=values, _fps=fps, _last=last, _min=min, _int=int: _v[_min(_int(t * _fps + 0.5), _last)]
+
+def ease_out_elastic(t, overshoot=1.1):
+    """
+    Elastic easing - overshoots then settles.
+    t: progress from 0 to 1, a float or a numpy array of per-frame progress values
+    """
+    if np.ndim(t) == 0:
         if t == 0 or t == 1:
             return t
         # Elastic effect with controlled overshoot
         return t * (2 - t) * overshoot
+    t = np.asarray(t, dtype=np.float64)
+    return np.where((t == 0) | (t == 1), t, t * (2 - t) * overshoot)
+
+def _pop_offsets(scale, w, h):
+    """(x, y) shifts that keep a w x h clip centred while it is drawn at `scale`."""
+    return (1 - scale) * w / 2, (1 - scale) * h / 2
+
+def _word_spans(alpha, min_gap):
+    """
+    Reading-order word extents of rendered text, read back from its alpha: one
+    (row0, row1, col) per word, where rows bound the word's line and col is the
+    cut after the word. Ink gaps wider than min_gap separate words.
+    """
+    rows = np.flatnonzero(alpha.max(axis=1) > 0.05)
+    if rows.size == 0:
+        return []
+    # Line bands are runs of inked rows; cut halfway through each gap between them
+    breaks = np.flatnonzero(np.diff(rows) > 1)
+    starts = np.r_[rows[0], rows[breaks + 1]]
+    ends = np.r_[rows[breaks], rows[-1]] + 1
+    cuts = [0] + ((ends[:-1] + starts[1:]) // 2).tolist() + [alpha.shape[0]]
+    spans = []
+    for k in range(len(starts)):
+        cols = np.flatnonzero(alpha[starts[k]:ends[k]].max(axis=0) > 0.05)
+        gaps = np.flatnonzero(np.diff(cols) > min_gap)
+        word_cuts = ((cols[gaps] + 1 + cols[gaps + 1]) // 2).tolist() + [alpha.shape[1]]
+        spans.extend((cuts[k], cuts[k + 1], c) for c in word_cuts)
+    return spans
+
+def _clip_rect(shape, x, y, w, h):
+    """(rows, cols) slices of a w x h rectangle clipped to a frame shape, or None if off-frame."""
+    x, y = int(x), int(y)
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, shape[1]), min(y + h, shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return slice(y0, y1), slice(x0, x1)
+
+def _blend_rect(frame, x, y, w, h, color, alpha):
+    """
+    Alpha-blend a solid w x h rectangle into a uint8 frame in place, clipped to bounds.
+    Alpha is quantized to 8.8 fixed point so the blend stays in uint16 integer math
+    (within 1 LSB of the float blend).
+    """
+    box = _clip_rect(frame.shape, x, y, w, h)
+    if box is None:
+        return
+    a = int(alpha * 256 + 0.5)
+    region = frame[box]
+    region[:] = (region.astype(np.uint16) * (256 - a) + np.asarray(color, dtype=np.uint16) * a) >> 8
+
+def _rgb_to_yuv601(rgb):
+    """RGB tuple -> (Y, U, V) in BT.601 limited range, integer math."""
+    r, g, b = (int(c) for c in rgb[:3])
+    return (((66*r + 129*g + 25*b + 128) >> 8) + 16,
+            ((-38*r - 74*g + 112*b + 128) >> 8) + 128,
+            ((112*r - 94*g - 18*b + 128) >> 8) + 128)
+
+def _chroma_box(x, y, w, h):
+    """The 2x2-subsampled chroma rectangle covering a luma rectangle."""
+    x, y = int(x), int(y)
+    cx, cy = x // 2, y // 2
+    return cx, cy, (x + w + 1) // 2 - cx, (y + h + 1) // 2 - cy
+
+def _blend_rect_yuv(planes, x, y, w, h, yuv, alpha):
+    """Blend a solid rectangle into [Y, U, V] I420 planes."""
+    _blend_rect(planes[0], x, y, w, h, yuv[0], alpha)
+    cx, cy, cw, ch = _chroma_box(x, y, w, h)
+    _blend_rect(planes[1], cx, cy, cw, ch, yuv[1], alpha)
+    _blend_rect(planes[2], cx, cy, cw, ch, yuv[2], alpha)
+
+def _restore_rect_yuv(planes, base, x, y, w, h):
+    """Copy a rectangle of the static base back over [Y, U, V] planes (erases last frame's particle)."""
+    boxes = ((x, y, w, h),) + (_chroma_box(x, y, w, h),) * 2
+    for plane, src, rect in zip(planes, base, boxes):
+        box = _clip_rect(plane.shape, *rect)
+        if box is not None:
+            plane[box] = src[box]
+
+def _i420_planes(buf, width, height):
+    """[Y, U, V] views into one contiguous I420 frame buffer."""
+    y_size, c_size = width * height, (width // 2) * (height // 2)
+    return [buf[:y_size].reshape(height, width),
+            buf[y_size:y_size + c_size].reshape(height // 2, width // 2),
+            buf[y_size + c_size:].reshape(height // 2, width // 2)]
+
+class EasingFunctions:
+    """Collection of easing functions for smooth animations"""
+    
+    ease_out_elastic = staticmethod(ease_out_elastic)
     
     @staticmethod
     def ease_in_out_cubic(t):
@@ -134,120 +398,188 @@ class QuizVisualEffects:
         self.pip_size = config.get('pip_size', (400, 225))
         self.pip_position = config.get('pip_position', 'top-left')
         
+        # One generator for every random layout choice. Seeded from config['seed']
+        # when given (reproducible renders), else from `random` so random.seed()
+        # still pins the layout
+        seed = config.get('seed')
+        self._rng = np.random.default_rng(random.getrandbits(64) if seed is None else seed)
+        
+        # Theme colours parsed once, reused by every effect
+        self._highlight_rgb = self._parse_color(theme['highlight'])
+        self._bg_rgb = self._parse_color(theme['bg_color'])
+        
     def _to_hex(self, color):
         """Convert color to hex format"""
         if isinstance(color, (tuple, list)):
-            return '#%02x%02x%02x' % (int(color[0]), int(color[1]), int(color[2]))
+            return _rgb_to_hex(tuple(color))
         return color
     
-    def create_particle_backdrop(self, duration):
+    def _particle_scene(self, duration, fps=None):
         """
-        Creates animated particle backdrop with drifting circles + energy bursts.
-        
-        Args:
-            duration: Total video duration
-            
-        Returns:
-            CompositeVideoClip with background + particles
+        Draws the random backdrop layout once and returns (bg_rgb, highlight_rgb,
+        static_rects, rects_at) where rects_at(t) gives the (x, y, w, h, alpha)
+        rectangles to blend over the static frame at time t.
+        Every trajectory is precomputed into a per-frame table at fps (default FPS),
+        so rects_at is a single nearest-frame lookup.
+        Shared by the RGB clip and the raw YUV420p renderer.
         """
-        self.logger.section_start("Particle Backdrop Generation")
         self.logger.data("Particle Count", self.particle_count)
         self.logger.data("Duration", f"{duration:.2f}s")
         
-        # Base background color
-        bg_color = self.theme['bg_color']
-        bg = ColorClip(size=(WIDTH, HEIGHT), color=bg_color, duration=duration)
+        bg_color = self._bg_rgb
+        highlight_color = self._highlight_rgb
         
-        clips = [bg]
+        # Static gradient overlay (subtle)
+        static_rects = []
+        num_grd_layers=1
+        for i in range(num_grd_layers):  # 3 gradient layers
+            radius = res_scale(50) + (i * res_scale(HEIGHT//2//num_grd_layers))
+            opacity = 0.05 - (i//num_grd_layers * 0.015)
+            static_rects.append((WIDTH//2 - radius, HEIGHT//2 - radius, radius*2, radius*2, opacity))
         
-        # Create gradient overlay (subtle)
-        try:
-            highlight_color = self._parse_color(self.theme['highlight'])
-            num_grd_layers=1
-            for i in range(num_grd_layers):  # 3 gradient layers
-                radius = res_scale(50) + (i * res_scale(HEIGHT//2//num_grd_layers))
-                opacity = 0.05 - (i//num_grd_layers * 0.015)
-                
-                gradient_circle = ColorClip(
-                    size=(radius*2, radius*2), 
-                    color=highlight_color
-                ).set_opacity(opacity)
-                
-                gradient_circle = gradient_circle.set_position(
-                    (WIDTH//2 - radius, HEIGHT//2 - radius)
-                ).set_duration(duration)
-                
-                clips.append(gradient_circle)
-                
-            self.logger.log("Gradient overlay created", LogLevel.DEBUG)
-        except Exception as e:
-            self.logger.warning(f"Gradient creation failed: {e}")
-        
-        # Create drifting particles
+        # Drifting particles as SoA arrays, one contiguous array per attribute
         self.logger.log(f"Generating {self.particle_count} particles", LogLevel.DEBUG)
         
-        highlight_color = self._parse_color(self.theme['highlight'])
-        
-        for i in range(self.particle_count):
-            self.logger.progress(i+1, self.particle_count, "Particles")
-            
-            x = random.randint(0, WIDTH)
-            y_start = HEIGHT + random.randint(0, res_scale(200))
-            drift_speed = random.uniform(40, 80)
-            size = random.choice([res_scale(6), res_scale(8), res_scale(10), res_scale(12)])
-            
-            particle = ColorClip(
-                size=(size, size), 
-                color=highlight_color
-            ).set_opacity(random.uniform(0.2, 0.4))
-            
-            def make_drift_func(x_pos, y_start, speed):
-                def drift(t):
-                    wobble = math.sin(t * 2) * res_scale(10)
-                    return (x_pos + wobble, y_start - (speed * t))
-                return drift
-            
-            particle = particle.set_position(
-                make_drift_func(x, y_start, drift_speed)
-            ).set_duration(duration)
-            
-            clips.append(particle)
+        # Drawn in whole-array batches
+        n = self.particle_count
+        rng = self._rng
+        sizes = np.array([res_scale(6), res_scale(8), res_scale(10), res_scale(12)], dtype=np.int32)
+        px = rng.integers(0, WIDTH, n, endpoint=True).astype(np.float32)
+        py = (HEIGHT + rng.integers(0, res_scale(200), n, endpoint=True)).astype(np.float32)
+        speed = rng.uniform(40, 80, n).astype(np.float32)
+        size = rng.choice(sizes, n)
+        alpha = rng.uniform(0.2, 0.4, n).astype(np.float32)
+        wobble = res_scale(10)
         
         # Add 5 "speed streak" particles (USP: Fast-paced energy)
         self.logger.log("Adding energy burst streaks", LogLevel.DEBUG)
         
-        for i in range(5):
-            # Random timing
-            burst_start = random.uniform(2, duration - 2)
-            burst_duration = 1.5
-            
-            # Diagonal streak
-            streak = ColorClip(size=(3, 50), color=highlight_color).set_opacity(0.6)
-            
-            # Diagonal motion (top-left to bottom-right or reverse)
-            direction = random.choice([-1, 1])
-            start_x = WIDTH if direction > 0 else 0
-            start_y = random.randint(300, 1000)
-            
-            def make_streak_func(start_x, start_y, direction):
-                def streak_motion(t):
-                    progress = t / 1.5  # 1.5s duration
+        burst_duration = 1.5
+        burst_starts = rng.uniform(2, duration - 2, 5)
+        # Diagonal motion (top-left to bottom-right or reverse)
+        directions = rng.choice((-1, 1), 5)
+        start_ys = rng.integers(300, 1000, 5, endpoint=True)
+        streaks = [(burst_start, WIDTH if direction > 0 else 0, start_y, direction)
+                   for burst_start, direction, start_y
+                   in zip(burst_starts.tolist(), directions.tolist(), start_ys.tolist())]
+        
+        # All trajectories for all frames in one broadcast: [frame, particle].
+        # float32 throughout so the [frame, particle] intermediates stay half size
+        fps = fps or FPS
+        n_frames = int(duration * fps) + 2
+        t_tab = (np.arange(n_frames) / fps).astype(np.float32)
+        xs_tab = (px[None, :] + (np.sin(t_tab * 2) * np.float32(wobble))[:, None]).astype(np.int32)
+        ys_tab = (py[None, :] - speed[None, :] * t_tab[:, None]).astype(np.int32)
+        vis_tab = (ys_tab < HEIGHT) & (ys_tab + size[None, :] > 0)
+        size_l, alpha_l = size.tolist(), alpha.tolist()
+        
+        frame_rects = []
+        for k, t in enumerate(t_tab.tolist()):
+            idx = np.flatnonzero(vis_tab[k])
+            rects = [(x, y, size_l[i], size_l[i], alpha_l[i])
+                     for i, x, y in zip(idx.tolist(), xs_tab[k, idx].tolist(), ys_tab[k, idx].tolist())]
+            
+            for burst_start, start_x, start_y, direction in streaks:
+                local_t = t - burst_start
+                if 0 <= local_t < burst_duration:
+                    progress = local_t / 1.5  # 1.5s duration
                     x = start_x + (direction * -WIDTH * progress)
                     y = start_y + (HEIGHT * 0.3 * progress)
-                    return (x, y)
-                return streak_motion
-            
-            streak = streak.set_position(
-                make_streak_func(start_x, start_y, direction)
-            ).set_start(burst_start).set_duration(burst_duration)
+                    rects.append((int(x), int(y), 3, 50, 0.6))
+            frame_rects.append(rects)
+        
+        last = n_frames - 1
+        def rects_at(t):
+            return frame_rects[min(int(t * fps + 0.5), last)]
+        
+        return bg_color, highlight_color, static_rects, rects_at
+    
+    def create_particle_backdrop(self, duration):
+        """
+        Creates animated particle backdrop with drifting circles + energy bursts.
+        
+        Particles are rasterized straight into one numpy frame per tick
+        instead of compositing ~35 ColorClip layers through MoviePy.
+        
+        Args:
+            duration: Total video duration
             
-            clips.append(streak)
+        Returns:
+            VideoClip with background + particles
+        """
+        self.logger.section_start("Particle Backdrop Generation")
         
-        backdrop = CompositeVideoClip(clips, size=(WIDTH, HEIGHT))
+        bg_color, highlight_color, static_rects, rects_at = self._particle_scene(duration)
+        highlight = np.array(highlight_color, dtype=np.uint16)
+        
+        base = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        base[:] = bg_color
+        for x, y, w, h, a in static_rects:
+            _blend_rect(base, x, y, w, h, highlight, a)
+        
+        # One reusable frame, as in the YUV path: each call restores only the
+        # previous call's particle rectangles from the base instead of copying the
+        # full frame. MoviePy's blit copies its destination, so handing out the
+        # same buffer is safe.
+        frame = base.copy()
+        dirty = []
+        
+        def make_frame(t):
+            for x, y, w, h in dirty:
+                box = _clip_rect(frame.shape, x, y, w, h)
+                if box is not None:
+                    frame[box] = base[box]
+            dirty.clear()
+            for x, y, w, h, a in rects_at(t):
+                _blend_rect(frame, x, y, w, h, highlight, a)
+                dirty.append((x, y, w, h))
+            return frame
+        
+        backdrop = VideoClip(make_frame, duration=duration)
         
         self.logger.section_end("Particle Backdrop Generation")
         return backdrop
     
+    def iter_particle_backdrop_yuv(self, duration, fps):
+        """
+        Same backdrop as create_particle_backdrop, painted straight into YUV420p
+        planes (BT.601 limited range, what x264 gets from rgb24 by default).
+        Yields the same contiguous I420 uint8 buffer every tick (overwritten by the
+        next one), ready to hand to an ffmpeg rawvideo pipe without a copy.
+        """
+        self.logger.section_start("Particle Backdrop Generation (YUV420p)")
+        
+        if WIDTH % 2 or HEIGHT % 2:
+            raise ValueError(f"odd frame size {WIDTH}x{HEIGHT}")
+        
+        bg_color, highlight_color, static_rects, rects_at = self._particle_scene(duration, fps)
+        bg_yuv = _rgb_to_yuv601(bg_color)
+        hl_yuv = _rgb_to_yuv601(highlight_color)
+        
+        base_buf = np.empty(WIDTH * HEIGHT * 3 // 2, dtype=np.uint8)
+        base = _i420_planes(base_buf, WIDTH, HEIGHT)
+        for plane, value in zip(base, bg_yuv):
+            plane[:] = value
+        for x, y, w, h, a in static_rects:
+            _blend_rect_yuv(base, x, y, w, h, hl_yuv, a)
+        
+        # One reusable frame: each tick only the previous tick's particle
+        # rectangles are restored from the base instead of copying the full frame.
+        buf = base_buf.copy()
+        planes = _i420_planes(buf, WIDTH, HEIGHT)
+        dirty = []
+        frames = int(duration * fps)
+        for n in range(frames):
+            for rect in dirty:
+                _restore_rect_yuv(planes, base, *rect)
+            dirty = []
+            for x, y, w, h, a in rects_at(n / fps):
+                _blend_rect_yuv(planes, x, y, w, h, hl_yuv, a)
+                dirty.append((x, y, w, h))
+            yield buf
+        
+        self.logger.section_end("Particle Backdrop Generation (YUV420p)")
+    
     def create_pip_source_video(self, source_video_clip, duration):
         """
         Creates Picture-in-Picture with wavy journey motion.
@@ -279,11 +611,11 @@ class QuizVisualEffects:
             pip = pip.set_duration(duration)
             
             # Determine journey path (random start side)
-            import random
-            start_side = random.choice(['left', 'right'])
+            start_side = ('left', 'right')[self._rng.integers(2)]
             
             # Random device frame
-            device = random.choice(list(DEVICE_FRAMES.keys()))
+            devices = list(DEVICE_FRAMES.keys())
+            device = devices[self._rng.integers(len(devices))]
             frame_config = DEVICE_FRAMES[device]
             border_thickness = res_scale(frame_config['border'])
             border_color = frame_config['bezel_color']
@@ -302,193 +634,144 @@ class QuizVisualEffects:
                 self.logger.data("Journey", "RIGHT → LEFT")
             
             y_base = res_scale(150)  # Safe zone top
-            # Complex 4-phase journey with final enlargement
+            # Scaled constants resolved once; the callbacks below run every frame
+            wave_amp = res_scale(15)
+            glow_pad = res_scale(40)
+            center_x = (WIDTH - self.pip_size[0]) / 2
+            inv_duration = 1.0 / duration
+            # Complex 4-phase journey with final enlargement, evaluated for every
+            # frame at once (numpy) instead of per callback in the interpreter
+            PHASE_1_END = 0.30  # 30% - reach opposite edge
+            PHASE_2_END = 0.55  # 55% - return to start
+            PHASE_3_END = 0.85  # 85% - reach center
+            # PHASE_4 = 0.85-1.0 (15%) - enlargement
+            
+            n_frames = int(duration * FPS) + 1
+            progress = np.minimum(np.arange(n_frames) / FPS * inv_duration, 1.0)
+            
+            # Horizontal: Start → Opposite → Start → Center, then hold at center
+            journey_x = np.interp(
+                progress,
+                (0.0, PHASE_1_END, PHASE_2_END, PHASE_3_END, 1.0),
+                (start_x, end_x, start_x, center_x, center_x)
+            )
+            # Vertical: wavy motion (6 complete cycles) during phases 1-3, then
+            # hold at the safe-zone top while it enlarges
+            journey_y = np.where(
+                progress < PHASE_3_END,
+                y_base + np.sin(progress * 6 * 2 * math.pi) * wave_amp,
+                y_base
+            )
+            journey_tab = list(zip(journey_x.tolist(), journey_y.tolist()))
+            journey_last = n_frames - 1
+            
+            # One t -> frame index conversion per frame, shared by every table
+            # lookup here (PIP scale, border frame, YouTube overlay)
+            frame_last = {'t': None, 'i': 0}
+            
+            def frame_index(t):
+                if t != frame_last['t']:
+                    frame_last['t'], frame_last['i'] = t, min(int(t * FPS + 0.5), journey_last)
+                return frame_last['i']
+            
             def wavy_journey(t):
-                progress = min(t / duration, 1.0)
-                
-                # Phase timings
-                PHASE_1_END = 0.30  # 30% - reach opposite edge
-                PHASE_2_END = 0.55  # 55% - return to start
-                PHASE_3_END = 0.85  # 85% - reach center
-                # PHASE_4 = 0.85-1.0 (15%) - enlargement
-                
-                center_x = (WIDTH - self.pip_size[0]) / 2
-                
-                # ========================================
-                # HORIZONTAL POSITION CALCULATION
-                # ========================================
-                
-                if progress < PHASE_1_END:
-                    # Phase 1: Start → Opposite
-                    phase_progress = progress / PHASE_1_END
-                    current_x = start_x + (end_x - start_x) * phase_progress
-                    
-                elif progress < PHASE_2_END:
-                    # Phase 2: Opposite → Start
-                    phase_progress = (progress - PHASE_1_END) / (PHASE_2_END - PHASE_1_END)
-                    current_x = end_x + (start_x - end_x) * phase_progress
-                    
-                elif progress < PHASE_3_END:
-                    # Phase 3: Start → Center
-                    phase_progress = (progress - PHASE_2_END) / (PHASE_3_END - PHASE_2_END)
-                    current_x = start_x + (center_x - start_x) * phase_progress
-                    
-                else:
-                    # Phase 4: Hold at center (for enlargement)
-                    current_x = center_x
-                
-                # ========================================
-                # VERTICAL POSITION CALCULATION
-                # ========================================
-                
-                if progress < PHASE_3_END:
-                    # Phases 1-3: Wavy motion (6 complete cycles)
-                    wave_progress = progress * 6 * 2 * math.pi
-                    wave_offset = math.sin(wave_progress) * res_scale(15)
-                    current_y = y_base + wave_offset
-                else:
-                    # Phase 4: Settle to vertical center as it enlarges
-                    phase_progress = (progress - PHASE_3_END) / (1.0 - PHASE_3_END)
-                    
-                    # Gradually move to vertical center
-                    target_y = (HEIGHT - self.pip_size[1]) / 2 *0 + y_base
-                    current_y = y_base + (target_y - y_base) * phase_progress
-                
-                return (current_x, current_y)
-            # Scale function for enlargement in Phase 4
-            def pip_scale(t):
-                progress = min(t / duration, 1.0)
-                                
-                # Skip enlargement if PIP already large
-                if self.pip_size[0] > res_scale(600):
-                    return 1.0  # No scaling needed
-                PHASE_3_END = 0.85
-                
-                if progress < PHASE_3_END:
-                    return 1.0  # Normal size during phases 1-3
-                else:
-                    # Phase 4: Enlarge
-                    phase_progress = (progress - PHASE_3_END) / (1.0 - PHASE_3_END)
-                    
-                    # Calculate target scale to fill width
-                    target_width = WIDTH - res_scale(100)  # 50px margin each side
-                    target_scale = target_width / self.pip_size[0]
-                    
-                    # Cap maximum scale (prevent going off-screen top)
-                    max_scale = 2.8  # Reasonable limit
-                    target_scale = min(target_scale, max_scale)
-                    
-                    # Smooth easing (ease-out)
-                    eased_progress = 1 - pow(1 - phase_progress, 3)  # Cubic ease-out
-                    
-                    current_scale = 1.0 + (target_scale - 1.0) * eased_progress
-                    return current_scale
-
-                # Cache scale values (calculate once, reuse)
-            scale_cache = {}
+                return journey_tab[frame_index(t)]
+            
+            # Skip enlargement if PIP already large
+            skip_enlarge = self.pip_size[0] > res_scale(600)
+            # Target scale to fill width (50px margin each side), capped so it
+            # can't go off-screen top
+            max_scale = 2.8  # Reasonable limit
+            target_scale = min((WIDTH - res_scale(100)) / self.pip_size[0], max_scale)
+            
+            # Scale for enlargement in Phase 4: cubic ease-out from 1.0
+            if skip_enlarge:
+                scale_tab = [1.0] * n_frames  # No scaling needed
+            else:
+                phase_progress = np.clip((progress - PHASE_3_END) / (1.0 - PHASE_3_END), 0.0, 1.0)
+                eased_progress = 1 - (1 - phase_progress) ** 3
+                scale_tab = (1.0 + (target_scale - 1.0) * eased_progress).tolist()
 
             def pip_scale_cached(t):
-                frame = int(t * FPS)  # Assuming 24 fps
-                if frame not in scale_cache:
-                    scale_cache[frame] = pip_scale(t)
-                return scale_cache[frame]
+                return scale_tab[frame_index(t)]
 
             pip = pip.resize(pip_scale_cached)
 
             # Apply scale to PIP
             #pip = pip.resize(pip_scale)
-            pip = pip.set_position(wavy_journey)
-            
-            self.logger.log("Wavy journey animation applied", LogLevel.DEBUG)
             
             # Border overlays (follow PIP motion)
             #border_color = (255, 255, 255)
             border_opacity = 0.1
+            glow_color = self._highlight_rgb
+            
+            # Glow + 4 borders pre-composited once into a single RGBA frame, so the
+            # PIP region costs one extra blend per frame instead of five
+            pip_w, pip_h = self.pip_size
+            bt = border_thickness
+            pad = max(glow_pad, bt)
+            frame_w, frame_h = pip_w + pad*2, pip_h + pad*2
+            
+            # Soft glow: Gaussian falloff with distance from the PIP edge
+            cols = np.arange(frame_w, dtype=np.float32)
+            rows = np.arange(frame_h, dtype=np.float32)
+            dx = np.maximum(np.maximum(pad - cols, cols - (pad + pip_w - 1)), 0)
+            dy = np.maximum(np.maximum(pad - rows, rows - (pad + pip_h - 1)), 0)
+            glow_sigma = glow_pad / 2
+            frame_alpha = 0.3 * np.exp(-(dy[:, None]**2 + dx[None, :]**2) / (2 * glow_sigma**2))
+            frame_rgb = frame_alpha[..., None] * np.asarray(glow_color[:3], dtype=np.float32)
+            
+            def paint(x, y, w, h, color, opacity):
+                # "Over" onto a premultiplied accumulator, coords relative to the PIP
+                rows, cols = slice(pad + y, pad + y + h), slice(pad + x, pad + x + w)
+                frame_rgb[rows, cols] = frame_rgb[rows, cols] * (1 - opacity) + np.asarray(color[:3], dtype=float) * opacity
+                frame_alpha[rows, cols] = frame_alpha[rows, cols] * (1 - opacity) + opacity
+            
+            paint(-bt, -bt, pip_w + bt*2, bt, border_color, border_opacity)  # Top
+            paint(-bt, pip_h, pip_w + bt*2, bt, border_color, border_opacity)  # Bottom
+            paint(-bt, 0, bt, pip_h, border_color, border_opacity)  # Left
+            paint(pip_w, 0, bt, pip_h, border_color, border_opacity)  # Right
+            
+            atlas_rgb = np.zeros((frame_h, frame_w, 3), dtype=np.uint8)
+            covered = frame_alpha > 0
+            atlas_rgb[covered] = np.round(frame_rgb[covered] / frame_alpha[covered, None])
+            atlas_mask = frame_alpha
+            self.logger.log("Border frame built", LogLevel.DEBUG)
+            
+            # Glow/Borders -> PIP fused into one masked clip: each frame the PIP is
+            # pasted straight into a copy of the border frame, so the caller
+            # composites one layer instead of a nested frame + PIP composite.
+            # Phase 4 enlarges the PIP past the frame; those frames get a bigger canvas.
+            rgb_buf = np.empty_like(atlas_rgb)
+            mask_buf = np.empty_like(atlas_mask)
+            fused_last = {'t': None, 'v': None}
+            
+            def fused_frame(t):
+                # RGB and mask frames are requested separately for the same t
+                if t != fused_last['t']:
+                    pip_img = pip.get_frame(t)
+                    ph, pw = pip_img.shape[:2]
+                    h, w = max(frame_h, pad + ph), max(frame_w, pad + pw)
+                    if (h, w) == (frame_h, frame_w):
+                        rgb, mask = rgb_buf, mask_buf
+                    else:
+                        rgb, mask = np.zeros((h, w, 3), dtype=np.uint8), np.zeros((h, w))
+                    rgb[:frame_h, :frame_w] = atlas_rgb
+                    mask[:frame_h, :frame_w] = atlas_mask
+                    rgb[pad:pad + ph, pad:pad + pw] = pip_img[:, :, :3]
+                    mask[pad:pad + ph, pad:pad + pw] = 1.0
+                    fused_last['t'], fused_last['v'] = t, (rgb, mask)
+                return fused_last['v']
+            
+            def frame_pos(t):
+                pip_x, pip_y = wavy_journey(t)
+                return (pip_x - pad, pip_y - pad)
+            
+            pip_mask = VideoClip(lambda t: fused_frame(t)[1], ismask=True, duration=duration)
+            pip_base = VideoClip(lambda t: fused_frame(t)[0], duration=duration)
+            pip_base = pip_base.set_mask(pip_mask).set_position(frame_pos)
             
-            # Top border
-            top_border = ColorClip(
-                size=(self.pip_size[0] + border_thickness*2, border_thickness),
-                color=border_color
-            ).set_opacity(border_opacity)
-            
-            def top_border_pos(t):
-                pip_pos = wavy_journey(t)
-                return (pip_pos[0] - border_thickness, pip_pos[1] - border_thickness)
-            
-            top_border = top_border.set_position(top_border_pos).set_duration(duration)
-            
-            # Bottom border
-            bottom_border = ColorClip(
-                size=(self.pip_size[0] + border_thickness*2, border_thickness),
-                color=border_color
-            ).set_opacity(border_opacity)
-            
-            def bottom_border_pos(t):
-                pip_pos = wavy_journey(t)
-                return (pip_pos[0] - border_thickness, pip_pos[1] + self.pip_size[1])
-            
-            bottom_border = bottom_border.set_position(bottom_border_pos).set_duration(duration)
-            
-            # Left border
-            left_border = ColorClip(
-                size=(border_thickness, self.pip_size[1]),
-                color=border_color
-            ).set_opacity(border_opacity)
-            
-            def left_border_pos(t):
-                pip_pos = wavy_journey(t)
-                return (pip_pos[0] - border_thickness, pip_pos[1])
-            
-            left_border = left_border.set_position(left_border_pos).set_duration(duration)
-            
-            # Right border
-            right_border = ColorClip(
-                size=(border_thickness, self.pip_size[1]),
-                color=border_color
-            ).set_opacity(border_opacity)
-            
-            def right_border_pos(t):
-                pip_pos = wavy_journey(t)
-                return (pip_pos[0] + self.pip_size[0], pip_pos[1])
-            
-            right_border = right_border.set_position(right_border_pos).set_duration(duration)
-            
-
-            # Top border - only visible when not enlarged
-            def top_border_visibility(t):
-                progress = min(t / duration, 1.0)
-                return 0.4 if progress < 0.85 else 0  # Fade out during phase 4
-
-            #top_border = top_border.set_opacity(top_border_visibility)
-
-            # Apply same to all borders (bottom, left, right)
-            #bottom_border = bottom_border.set_opacity(top_border_visibility)
-            #left_border = left_border.set_opacity(top_border_visibility)
-            #right_border = right_border.set_opacity(top_border_visibility)
-
-            # Subtle glow (pulsing)
-            # Subtle glow (pulsing) - FIXED
-            glow_size = (self.pip_size[0] + res_scale(80), self.pip_size[1] + res_scale(80))
-            glow_color = self._parse_color(self.theme['highlight'])
-
-            glow = ColorClip(size=glow_size, color=glow_color).set_duration(duration)
-
-            # FIXED: Inline lambda for opacity
-            self.logger.log("Before Glow  application", LogLevel.DEBUG)
-            #glow = glow.set_opacity(lambda t: 0.05 + 0.05 * abs(math.sin(t / 2.0 * math.pi)))
-            glow = glow.set_opacity(0.08)
-            self.logger.log("Glow  applied", LogLevel.DEBUG)
-
-            def glow_pos(t):
-                pip_pos = wavy_journey(t)
-                return (pip_pos[0] - res_scale(40), pip_pos[1] - res_scale(40))
-
-            glow = glow.set_position(glow_pos)
-            
-            # Composite: Glow -> Borders -> PIP
-            pip_base = CompositeVideoClip([
-                glow, top_border, bottom_border, left_border, right_border, pip
-            ], size=(WIDTH, HEIGHT))
+            self.logger.log("Wavy journey animation applied", LogLevel.DEBUG)
 
             # ADD YOUTUBE CONTROLS OVERLAY
             youtube_controls = self.create_youtube_overlay(
@@ -535,22 +818,31 @@ class QuizVisualEffects:
         Returns:
             CompositeVideoClip with control overlays
         """
-        import random
-        progress_percent = random.randint(35, 55)  # 35-55% progress
+        progress_percent = int(self._rng.integers(35, 55, endpoint=True))  # 35-55% progress
         self.logger.section_start("YouTube Player Overlay")
         self.logger.data("Progress", f"{progress_percent}%")
         
         clips = []
         
+        def follow(dx, dy):
+            # Rides along with the PIP at a constant offset from its top-left,
+            # resolved once instead of per frame (bound as defaults, read as locals)
+            def pos(t, pip_position_func=pip_position_func, dx=dx, dy=dy):
+                pip_x, pip_y = pip_position_func(t)
+                return (pip_x + dx, pip_y + dy)
+            return pos
+        
         # ============================================================
         # CONTROL BAR BACKGROUND (dark gray bar at bottom)
         # ============================================================
         
         control_bar_height = res_scale(40)
-        control_bg = ColorClip(
+        bar_top = pip_height - control_bar_height
+        control_bg = _solid_clip(
             size=(pip_width, control_bar_height),
-            color=(24, 24, 24)  # YouTube dark background
-        ).set_opacity(0.9)
+            color=(24, 24, 24),  # YouTube dark background
+            opacity=0.9
+        )
         
         def control_bg_pos(t):
             pip_x, pip_y = pip_position_func(t)
@@ -577,32 +869,25 @@ class QuizVisualEffects:
         progress_bar_y_offset = res_scale(10)  # From top of control bar
         
         # Background track (unfilled)
-        progress_bg = ColorClip(
+        progress_bg = _solid_clip(
             size=(pip_width - res_scale(20), progress_bar_height),
-            color=(77, 77, 77)  # Medium gray
-        ).set_opacity(0.8)
-        
-        def progress_bg_pos(t):
-            pip_x, pip_y = pip_position_func(t)
-            return (pip_x + res_scale(10), 
-                    pip_y + pip_height - control_bar_height + progress_bar_y_offset)
+            color=(77, 77, 77),  # Medium gray
+            opacity=0.8
+        )
         
-        progress_bg = progress_bg.set_position(progress_bg_pos).set_duration(duration)
+        progress_pos = follow(res_scale(10), bar_top + progress_bar_y_offset)
+        progress_bg = progress_bg.set_position(progress_pos).set_duration(duration)
         clips.append(progress_bg)
         
         # Filled portion (red)
         filled_width = int((pip_width - res_scale(20)) * (progress_percent / 100))
-        progress_fill = ColorClip(
+        progress_fill = _solid_clip(
             size=(filled_width, progress_bar_height),
-            color=(255, 0, 0)  # YouTube red
-        ).set_opacity(1.0)
-        
-        def progress_fill_pos(t):
-            pip_x, pip_y = pip_position_func(t)
-            return (pip_x + res_scale(10), 
-                    pip_y + pip_height - control_bar_height + progress_bar_y_offset)
+            color=(255, 0, 0),  # YouTube red
+            opacity=1.0
+        )
         
-        progress_fill = progress_fill.set_position(progress_fill_pos).set_duration(duration)
+        progress_fill = progress_fill.set_position(progress_pos).set_duration(duration)
         clips.append(progress_fill)
         
         # ============================================================
@@ -618,7 +903,7 @@ class QuizVisualEffects:
         
         # Previous button (⏮)
         try:
-            prev_btn = TextClip(
+            prev_btn = _text_clip(
                 "◄",
                 fontsize=res_scale(18),
                 color='white',
@@ -626,19 +911,14 @@ class QuizVisualEffects:
                 method='label'
             )
             
-            def prev_btn_pos(t):
-                pip_x, pip_y = pip_position_func(t)
-                return (pip_x + button_start_x, 
-                        pip_y + pip_height - control_bar_height + button_y_offset)
-            
-            prev_btn = prev_btn.set_position(prev_btn_pos).set_duration(duration)
+            prev_btn = prev_btn.set_position(follow(button_start_x, bar_top + button_y_offset)).set_duration(duration)
             clips.append(prev_btn)
         except:
             self.logger.warning("Previous button creation failed (emoji font issue)")
         
         # Play/Pause button (⏸) - center of 3 buttons
         try:
-            play_btn = TextClip(
+            play_btn = _text_clip(
                 "| |",
                 fontsize=res_scale(18),
                 color='white',
@@ -646,19 +926,14 @@ class QuizVisualEffects:
                 method='label'
             )
             
-            def play_btn_pos(t):
-                pip_x, pip_y = pip_position_func(t)
-                return (pip_x + button_start_x + button_spacing, 
-                        pip_y + pip_height - control_bar_height + button_y_offset)
-            
-            play_btn = play_btn.set_position(play_btn_pos).set_duration(duration)
+            play_btn = play_btn.set_position(follow(button_start_x + button_spacing, bar_top + button_y_offset)).set_duration(duration)
             clips.append(play_btn)
         except:
             self.logger.warning("Play button creation failed (emoji font issue)")
         
         # Next button (⏭)
         try:
-            next_btn = TextClip(
+            next_btn = _text_clip(
                 "►►",
                 fontsize=res_scale(18),
                 color='white',
@@ -666,19 +941,14 @@ class QuizVisualEffects:
                 method='label'
             )
             
-            def next_btn_pos(t):
-                pip_x, pip_y = pip_position_func(t)
-                return (pip_x + button_start_x + (button_spacing * 1), 
-                        pip_y + pip_height - control_bar_height + button_y_offset)
-            
-            next_btn = next_btn.set_position(next_btn_pos).set_duration(duration)
+            next_btn = next_btn.set_position(follow(button_start_x + (button_spacing * 1), bar_top + button_y_offset)).set_duration(duration)
             clips.append(next_btn)
         except:
             self.logger.warning("Next button creation failed (emoji font issue)")
 
         # Volume icon (right side of control bar)
         try:
-            volume_icon = TextClip(
+            volume_icon = _text_clip(
                 "🔊",  # Or "VOL"
                 fontsize=res_scale(14),
                 color='white',
@@ -686,12 +956,7 @@ class QuizVisualEffects:
                 method='label'
             )
             
-            def volume_pos(t):
-                pip_x, pip_y = pip_position_func(t)
-                return (pip_x + pip_width - res_scale(100), 
-                        pip_y + pip_height - control_bar_height + res_scale(20))
-            
-            volume_icon = volume_icon.set_position(volume_pos).set_duration(duration)
+            volume_icon = volume_icon.set_position(follow(pip_width - res_scale(100), bar_top + res_scale(20))).set_duration(duration)
             clips.append(volume_icon)
         except:
             pass    
@@ -701,7 +966,7 @@ class QuizVisualEffects:
         # ============================================================
         
         try:
-            timestamp_clip = TextClip(
+            timestamp_clip = _text_clip(
                 timestamp,
                 fontsize=res_scale(14),
                 color='white',
@@ -711,12 +976,8 @@ class QuizVisualEffects:
             
             timestamp_width = timestamp_clip.w
             
-            def timestamp_pos(t):
-                pip_x, pip_y = pip_position_func(t)
-                return (pip_x + pip_width - timestamp_width - res_scale(15), 
-                        pip_y + pip_height - control_bar_height + res_scale(20))
-            
-            timestamp_clip = timestamp_clip.set_position(timestamp_pos).set_duration(duration)
+            timestamp_clip = timestamp_clip.set_position(
+                follow(pip_width - timestamp_width - res_scale(15), bar_top + res_scale(20))).set_duration(duration)
             clips.append(timestamp_clip)
             
         except Exception as e:
@@ -727,7 +988,7 @@ class QuizVisualEffects:
         # ============================================================
         
         try:
-            quality_badge = TextClip(
+            quality_badge = _text_clip(
                 "HD",
                 fontsize=res_scale(12),
                 color='white',
@@ -736,12 +997,8 @@ class QuizVisualEffects:
                 bg_color=self._to_hex((255, 0, 0)),  # Red background
             )
             
-            def quality_pos(t):
-                pip_x, pip_y = pip_position_func(t)
-                return (pip_x + pip_width - res_scale(35), 
-                        pip_y + res_scale(10))  # Top-right of video
-            
-            quality_badge = quality_badge.set_position(quality_pos).set_duration(duration)
+            quality_badge = quality_badge.set_position(
+                follow(pip_width - res_scale(35), res_scale(10)))  # Top-right of video.set_duration(duration)
             quality_badge = quality_badge.set_opacity(0.8)
             clips.append(quality_badge)
             
@@ -759,16 +1016,20 @@ class QuizVisualEffects:
         """
         Creates visual timing markers (red=start, green=end) for sync testing.
         
+        All markers are drawn into one masked clip that only paints the ones
+        active at t, instead of up to 27 mostly-idle composite layers.
+        
         Args:
             timing_manifest: Dict with timing data
             duration: Total video duration
             
         Returns:
-            CompositeVideoClip with marker lines
+            Masked VideoClip with marker lines and labels (None if no segments)
         """
         self.logger.section_start("Timing Markers")
         
-        markers = []
+        bars = []    # (x, y, start, end, color)
+        labels = []  # (x, y, start, end, rgb, mask)
         
         # Define marker positions for each audio segment
         segments = ['hook', 'question', 'opt_a', 'opt_b', 'opt_c', 'opt_d', 'think', 'explanation', 'cta']
@@ -784,32 +1045,57 @@ class QuizVisualEffects:
             # Vertical position (stagger markers)
             y_pos = 400 + (i * 50)
             
-            # Start marker (red)
-            start_marker = ColorClip(
-                size=(5, 60), 
-                color=(255, 0, 0)
-            ).set_position((100, y_pos)).set_start(start_time).set_duration(0.2)
+            # Start marker (red), end marker (green), 0.2s each
+            bars.append((100, y_pos, start_time, start_time + 0.2, (255, 0, 0)))
+            bars.append((200, y_pos, end_time, end_time + 0.2, (0, 255, 0)))
             
-            # End marker (green)
-            end_marker = ColorClip(
-                size=(5, 60), 
-                color=(0, 255, 0)
-            ).set_position((200, y_pos)).set_start(end_time).set_duration(0.2)
-            
-            # Label
-            label = TextClip(
+            # Label, rendered once
+            label = _text_clip(
                 seg.upper(),
                 fontsize=res_scale(20),
                 color='white',
                 font=FONT_REGULAR
-            ).set_position((210, y_pos + 20)).set_start(start_time).set_duration(timing['duration'])
-            
-            markers.extend([start_marker, end_marker, label])
+            )
+            label_rgb = label.get_frame(0)
+            label_mask = label.mask.get_frame(0) if label.mask is not None else np.ones(label_rgb.shape[:2])
+            labels.append((210, y_pos + 20, start_time, end_time, label_rgb, label_mask))
             
             self.logger.data(f"{seg}", f"{start_time:.2f}s -> {end_time:.2f}s", LogLevel.DEBUG)
         
         self.logger.section_end("Timing Markers")
-        return CompositeVideoClip(markers, size=(WIDTH, HEIGHT)) if markers else None
+        if not bars:
+            return None
+        
+        bar_w, bar_h = 5, 60
+        ox = min(x for x, *_ in bars)
+        oy = min(y for _, y, *_ in bars)
+        box_w = max([x + bar_w for x, *_ in bars] + [x + rgb.shape[1] for x, _, _, _, rgb, _ in labels]) - ox
+        box_h = max([y + bar_h for _, y, *_ in bars] + [y + rgb.shape[0] for _, y, _, _, rgb, _ in labels]) - oy
+        
+        rgb_buf = np.zeros((box_h, box_w, 3), dtype=np.uint8)
+        mask_buf = np.zeros((box_h, box_w))
+        marker_last = {'t': None}
+        
+        def marker_frame(t):
+            # RGB and mask frames are requested separately for the same t
+            if t != marker_last['t']:
+                rgb_buf.fill(0)
+                mask_buf.fill(0)
+                for x, y, t0, t1, color in bars:
+                    if t0 <= t < t1:
+                        rgb_buf[y - oy:y - oy + bar_h, x - ox:x - ox + bar_w] = color
+                        mask_buf[y - oy:y - oy + bar_h, x - ox:x - ox + bar_w] = 1.0
+                for x, y, t0, t1, rgb, mask in labels:
+                    if t0 <= t < t1:
+                        h, w = mask.shape
+                        rgb_buf[y - oy:y - oy + h, x - ox:x - ox + w] = rgb
+                        mask_buf[y - oy:y - oy + h, x - ox:x - ox + w] = mask
+                marker_last['t'] = t
+            return rgb_buf, mask_buf
+        
+        markers = VideoClip(lambda t: marker_frame(t)[0], duration=duration)
+        markers_mask = VideoClip(lambda t: marker_frame(t)[1], ismask=True, duration=duration)
+        return markers.set_mask(markers_mask).set_position((ox, oy))
     
     # NEW function signature:
     def create_cta_banner(self, social_text, link_text, social_start, social_duration, 
@@ -840,49 +1126,57 @@ class QuizVisualEffects:
             else:
                 banner_y = res_scale(1300)  # Fallback
             
-            bg_color = self._parse_color(self.theme['highlight'])
+            bg_color = self._highlight_rgb
             
             # Total duration (from social start to link end)
             total_duration = (link_start + link_duration) - social_start
             
             # Background banner (persists throughout)
-            banner_bg = ColorClip(
+            banner_bg = _solid_clip(
                 size=(banner_width, banner_height),
-                color=bg_color
-            ).set_opacity(0.92)
+                color=bg_color,
+                opacity=0.92
+            )
+            
+            # Scaled constants resolved once; the position callbacks run every frame
+            slide_dist = res_scale(100)
+            half_height = banner_height / 2
+            text_pad = res_scale(20)
+            
+            # Entrance animation with gentle pulse, precomputed for every frame
+            n_frames = int(total_duration * FPS) + 2
+            t_tab = np.arange(n_frames) / FPS
+            # Entrance: ease_out_elastic(progress, 1.05) over the first 0.5s
+            progress = np.minimum(t_tab / 0.5, 1.0)
+            eased = np.where(progress == 0, 0.0, progress * (2 - progress) * 1.05)
+            # Gentle pulse: 3-second cycle
+            scale = 1.0 + 0.015 * np.sin((t_tab - 0.5) / 3.0 * 2 * math.pi)
+            offset = np.where(t_tab < 0.5, (1 - eased) * slide_dist, (1 - scale) * half_height)
+            motion_tab = [(banner_x, y) for y in (banner_y + offset).tolist()]
+            motion_last = n_frames - 1
             
-            # Entrance animation with gentle pulse
             def banner_motion(t):
-                if t < 0.5:  # Entrance
-                    progress = t / 0.5
-                    eased = EasingFunctions.ease_out_elastic(progress, 1.05)
-                    offset = (1 - eased) * res_scale(100)
-                    return (banner_x, banner_y + offset)
-                else:  # Gentle pulse
-                    pulse_t = (t - 0.5) / 3.0  # 3-second cycle
-                    scale = 1.0 + 0.015 * math.sin(pulse_t * 2 * math.pi)
-                    offset = (1 - scale) * banner_height / 2
-                    return (banner_x, banner_y + offset)
+                return motion_tab[min(int(t * FPS + 0.5), motion_last)]
             
             banner_bg = banner_bg.set_position(banner_motion).set_start(social_start).set_duration(total_duration)
-            clips.append(banner_bg)
             
-            # White border
-            border = ColorClip(
+            # White border (behind background)
+            border = _solid_clip(
                 size=(banner_width + res_scale(8), banner_height + res_scale(8)),
-                color=(255, 255, 255)
-            ).set_opacity(0.7)
+                color=(255, 255, 255),
+                opacity=0.7
+            )
             
             def border_motion(t):
                 bg_pos = banner_motion(t)
                 return (bg_pos[0] - 4, bg_pos[1] - 4)
             
             border = border.set_position(border_motion).set_start(social_start).set_duration(total_duration)
-            clips.insert(0, border)
+            clips.extend([border, banner_bg])
             
             # PART A: Social Action Text
             try:
-                social_clip = TextClip(
+                social_clip = _text_clip(
                     social_text,
                     fontsize=res_scale(52),
                     color='black',
@@ -892,10 +1186,10 @@ class QuizVisualEffects:
                     size=(banner_width - res_scale(40), None)
                 )
                 
+                social_dy = (banner_height - social_clip.h) // 2
                 def social_text_pos(t):
                     bg_pos = banner_motion(t)
-                    text_y = bg_pos[1] + (banner_height - social_clip.h) // 2
-                    return (bg_pos[0] + res_scale(20), text_y)
+                    return (bg_pos[0] + text_pad, bg_pos[1] + social_dy)
                 
                 # Social text appears and stays until link starts
                 actual_social_duration = (link_start - social_start)  # Full duration until transition
@@ -912,7 +1206,7 @@ class QuizVisualEffects:
             
             # PART B: Link Directive Text
             try:
-                link_clip = TextClip(
+                link_clip = _text_clip(
                     link_text,
                     fontsize=res_scale(52),
                     color='black',
@@ -922,10 +1216,11 @@ class QuizVisualEffects:
                     size=(banner_width - res_scale(40), None)
                 )
                 
+                link_dy = (banner_height - link_clip.h) // 2
+                link_shift = link_start - social_start
                 def link_text_pos(t):
-                    bg_pos = banner_motion(t + (link_start - social_start))
-                    text_y = bg_pos[1] + (banner_height - link_clip.h) // 2
-                    return (bg_pos[0] + res_scale(20), text_y)
+                    bg_pos = banner_motion(t + link_shift)
+                    return (bg_pos[0] + text_pad, bg_pos[1] + link_dy)
                 
                 link_clip = link_clip.set_position(link_text_pos).set_start(link_start).set_duration(link_duration)
                 
@@ -970,11 +1265,12 @@ class QuizVisualEffects:
             banner_y = res_scale(1300)  # Safe zone (420px from bottom)
             
             # Background card
-            bg_color = self._parse_color(self.theme['highlight'])
-            banner_bg = ColorClip(
+            bg_color = self._highlight_rgb
+            banner_bg = _solid_clip(
                 size=(banner_width, banner_height),
-                color=bg_color
-            ).set_opacity(0.95)
+                color=bg_color,
+                opacity=0.95
+            )
             
             # Position with slide-up animation
             def banner_entrance(t):
@@ -990,20 +1286,20 @@ class QuizVisualEffects:
                     return (banner_x, banner_y + offset)
             
             banner_bg = banner_bg.set_position(banner_entrance).set_start(start_time).set_duration(duration)
-            clips.append(banner_bg)
             
             # Border overlay
-            border_clip = ColorClip(
+            border_clip = _solid_clip(
                 size=(banner_width + res_scale(6),banner_height + res_scale(6)),
-                color=(255, 255, 255)
-            ).set_opacity(0.8)
+                color=(255, 255, 255),
+                opacity=0.8
+            )
             
             def border_position(t):
                 bg_pos = banner_entrance(t)
                 return (bg_pos[0] - res_scale(3), bg_pos[1] - res_scale(3))
             
             border_clip = border_clip.set_position(border_position).set_start(start_time).set_duration(duration)
-            clips.insert(0, border_clip)  # Behind background
+            clips.extend([border_clip, banner_bg])  # Border behind background
             
             # Parse CTA text (handle two-line format)
             lines = cta_text.split('\n') if '\n' in cta_text else [cta_text]
@@ -1011,7 +1307,7 @@ class QuizVisualEffects:
             # Line 1: Main CTA (larger, bold)
             try:
                 main_text = lines[0]
-                text_clip_1 = TextClip(
+                text_clip_1 = _text_clip(
                     main_text,
                     fontsize=res_scale(52),
                     color='black',
@@ -1031,7 +1327,7 @@ class QuizVisualEffects:
                 
                 # Line 2: Secondary text (smaller)
                 if len(lines) > 1:
-                    text_clip_2 = TextClip(
+                    text_clip_2 = _text_clip(
                         lines[1],
                         fontsize=36,
                         color='black',
@@ -1058,16 +1354,17 @@ class QuizVisualEffects:
             badge_x = WIDTH - badge_width - 60
             badge_y = 1250
             
-            bg_color = self._parse_color(self.theme['highlight'])
-            badge_bg = ColorClip(
+            bg_color = self._highlight_rgb
+            badge_bg = _solid_clip(
                 size=(badge_width, badge_height),
-                color=bg_color
-            ).set_opacity(0.95).set_position((badge_x, badge_y)).set_start(start_time).set_duration(duration)
+                color=bg_color,
+                opacity=0.95
+            ).set_position((badge_x, badge_y)).set_start(start_time).set_duration(duration)
             clips.append(badge_bg)
             
             # Compact text
             try:
-                text_clip = TextClip(
+                text_clip = _text_clip(
                     cta_text,
                     fontsize=36,
                     color='black',
@@ -1106,7 +1403,8 @@ class QuizVisualEffects:
             y_offset: Vertical position (if position='center')
             
         Returns:
-            CompositeVideoClip with typewriter animation
+            CompositeVideoClip with typewriter animation, sized to the card area
+            and already positioned on the frame
         """
         self.logger.section_start("TypeWriter Text Effect")
         self.logger.data("Text", text)
@@ -1130,10 +1428,32 @@ class QuizVisualEffects:
         clips = []
         text_color = self._to_hex(color)
         
+        # Union of every on-screen extent, so the clips can be composited on a
+        # card-sized canvas instead of a full WIDTH x HEIGHT frame
+        bounds = [WIDTH, HEIGHT, 0, 0]
+        def grow(x0, y0, x1, y1):
+            bounds[:] = [min(bounds[0], x0), min(bounds[1], y0),
+                         max(bounds[2], x1), max(bounds[3], y1)]
+        
+        # Word-by-word reveal: the full text is rasterized once and uncovered by a
+        # mask that advances one word extent per word_delay (word extents are read
+        # back from the rendered alpha). Started now so it renders alongside the card.
+        text_style = dict(
+            fontsize=int(fontsize),
+            color=text_color,
+            font=FONT_BOLD,
+            stroke_color='black',
+            stroke_width=res_scale(3),
+            method='caption',
+            size=(WIDTH - res_scale(140), None),
+            align='center'
+        )
+        shown_job = _TEXT_POOL.submit(_text_clip, text, **text_style)
+        
         # Background card (appears immediately, stays throughout)
         try:
-            # Measure text dimensions
-            full_text_clip = TextClip(
+            # Measure text dimensions (layout only, nothing is rasterized)
+            full_w, full_h = _measure_text(
                 text,
                 fontsize=int(fontsize),
                 color=text_color,
@@ -1147,13 +1467,14 @@ class QuizVisualEffects:
             
             # Semi-transparent background card
             card_padding = res_scale(20)
-            card_width = min(full_text_clip.w + card_padding * 2, WIDTH - res_scale(100))
-            card_height = full_text_clip.h + card_padding * 2
+            card_width = min(full_w + card_padding * 2, WIDTH - res_scale(100))
+            card_height = full_h + card_padding * 2
             
-            bg_card = ColorClip(
+            bg_card = _solid_clip(
                 size=(card_width, card_height),
-                color=self.theme['bg_color']
-            ).set_opacity(0.8)
+                color=self._bg_rgb,
+                opacity=0.8
+            )
             
             # Position calculation
             if position == 'center':
@@ -1162,17 +1483,18 @@ class QuizVisualEffects:
             else:
                 card_x, card_y = position
             
-            # Entrance animation: scale up
-            def card_entrance(t):
-                if t < 0.3:
-                    scale = EasingFunctions.ease_out_elastic(t / 0.3, 1.05)
-                    offset_x = (1 - scale) * card_width / 2
-                    offset_y = (1 - scale) * card_height / 2
-                    return (card_x + offset_x, card_y + offset_y)
-                return (card_x, card_y)
+            # Entrance animation: scale up (0.3s, then settled)
+            ts = _frame_times(0.3)
+            scale = np.where(ts < 0.3, ease_out_elastic(ts / 0.3, 1.05), 1.0)
+            dx, dy = _pop_offsets(scale, card_width, card_height)
+            card_entrance = _lut_callback(list(zip((card_x + dx).tolist(), (card_y + dy).tolist())))
             
             bg_card = bg_card.set_position(card_entrance).set_start(start_time).set_duration(total_remaining_time)
             clips.append(bg_card)
+            card_rect = (card_x, card_y, card_width, card_height)
+            # Entrance slides in from +w/2 and overshoots by up to 2.5%
+            grow(card_x - 0.025 * card_width, card_y - 0.025 * card_height,
+                 card_x + 1.5 * card_width, card_y + 1.5 * card_height)
             
             self.logger.log("Background card created", LogLevel.DEBUG)
             
@@ -1180,67 +1502,141 @@ class QuizVisualEffects:
             self.logger.warning(f"Background card creation failed: {e}")
             card_x = (WIDTH - res_scale(800)) // 2
             card_y = y_offset
+            card_rect = None
         
-        # Create word-by-word reveal
-        for i in range(word_count):
-            self.logger.progress(i + 1, word_count, "Text Clips")
-            
-            # Progressive text (all words up to current)
-            progressive_text = " ".join(words[:i+1])
-            
-            try:
-                word_clip = TextClip(
-                    progressive_text,
-                    fontsize=int(fontsize),
-                    color=text_color,
-                    font=FONT_BOLD,
-                    stroke_color='black',
-                    stroke_width=res_scale(3),
-                    method='caption',
-                    size=(WIDTH - res_scale(140), None),
-                    align='center'
-                )
+        try:
+            shown = shown_job.result()
+            alpha = shown.mask.get_frame(0)
+            spans = _word_spans(alpha, max(2, int(fontsize * 0.18)))
+        except Exception as e:
+            self.logger.warning(f"Text clip creation failed: {e}")
+            shown, spans = None, []
+        
+        if shown is not None and len(spans) == word_count:
+            text_x = (WIDTH - shown.w) // 2
+            text_y = card_y + res_scale(20)  # Padding inside card
+            text_duration = total_remaining_time or audio_duration
+            last_word_t = (word_count - 1) * word_delay
+            reveal_last = {'i': None}
+            reveal_buf = np.empty_like(alpha)
+            
+            def reveal_mask(t):
+                i = min(int(t / word_delay), word_count - 1)
+                if i != reveal_last['i']:
+                    row0, row1, col = spans[i]
+                    reveal_buf[:] = alpha
+                    reveal_buf[row1:] = 0
+                    reveal_buf[row0:row1, col:] = 0
+                    reveal_last['i'] = i
+                return reveal_buf
+            
+            # Last word gets a subtle pop (0.2s once the last word is uncovered);
+            # offsets are truncated to whole pixels like MoviePy's blit
+            pop_t = _frame_times(text_duration) - last_word_t
+            scale = np.where((pop_t >= 0) & (pop_t < 0.2), 1.0 + 0.05 * np.sin(pop_t / 0.2 * math.pi), 1.0)
+            dx, dy = _pop_offsets(scale, shown.w, shown.h)
+            pop_x = (text_x + dx).astype(int).tolist()
+            pop_y = (text_y + dy).astype(int).tolist()
+            pop_last = len(pop_x) - 1
+            
+            # Once settled (t >= 0.3) the card is static, so it is baked into the
+            # text layer; only the entrance stays a separate clip
+            settle_t = 0.3
+            if card_rect is not None:
+                clips[-1] = clips[-1].set_duration(min(settle_t, text_duration))
+                bx, by = min(card_rect[0], min(pop_x)), min(card_rect[1], min(pop_y))
+                bx1 = max(card_rect[0] + card_rect[2], max(pop_x) + shown.w)
+                by1 = max(card_rect[1] + card_rect[3], max(pop_y) + shown.h)
+            else:
+                bx, by = min(pop_x), min(pop_y)
+                bx1, by1 = max(pop_x) + shown.w, max(pop_y) + shown.h
+            
+            text_rgb = shown.get_frame(0).astype(np.float64)
+            # Same arithmetic CompositeVideoClip applied to the separate card and
+            # text layers: the 0.8 card lands premultiplied on the black canvas
+            card_rgb = 0.8 * np.asarray(self._bg_rgb, dtype=np.float64)
+            # Buffers are redrawn in place whenever the visible state changes
+            baked = {'key': None, 'rgb': np.zeros((by1 - by, bx1 - bx, 3)), 'mask': np.zeros((by1 - by, bx1 - bx))}
+            
+            def baked_frame(t):
+                k = min(int(t * FPS + 0.5), pop_last)
+                key = (min(int(t / word_delay), word_count - 1), t >= settle_t, pop_x[k], pop_y[k])
+                if key != baked['key']:
+                    rgb, mask = baked['rgb'], baked['mask']
+                    rgb.fill(0)
+                    mask.fill(0)
+                    if card_rect is not None and key[1]:
+                        cx, cy, cw, ch = card_rect
+                        rgb[cy - by:cy - by + ch, cx - bx:cx - bx + cw] = card_rgb
+                        mask[cy - by:cy - by + ch, cx - bx:cx - bx + cw] = 0.8
+                    a = reveal_mask(t)
+                    box = (slice(key[3] - by, key[3] - by + shown.h), slice(key[2] - bx, key[2] - bx + shown.w))
+                    rgb[box] = a[:, :, None] * text_rgb + (1 - a[:, :, None]) * rgb[box]
+                    mask[box] = a + (1 - a) * mask[box]
+                    baked['key'] = key
+                return baked
+            
+            text_clip = VideoClip(lambda t: baked_frame(t)['rgb'], duration=text_duration)
+            text_mask = VideoClip(lambda t: baked_frame(t)['mask'], ismask=True, duration=text_duration)
+            text_clip = text_clip.set_mask(text_mask).set_position((bx, by))
+            clips.append(text_clip.set_start(start_time))
+            grow(bx, by, bx1, by1)
+        else:
+            # Word extents not recoverable from the raster (e.g. touching lines):
+            # one progressive rasterization per word, all submitted at once
+            word_jobs = [_TEXT_POOL.submit(_text_clip, " ".join(words[:i+1]), **text_style)
+                         for i in range(word_count)]
+            for i in range(word_count):
+                self.logger.progress(i + 1, word_count, "Text Clips")
+            
+                try:
+                    # Progressive text (all words up to current)
+                    word_clip = word_jobs[i].result()
                 
-                # Position relative to card
-                text_x = (WIDTH - word_clip.w) // 2
-                text_y = card_y + res_scale(20)  # Padding inside card
+                    # Position relative to card
+                    text_x = (WIDTH - word_clip.w) // 2
+                    text_y = card_y + res_scale(20)  # Padding inside card
                 
-                # Timing: each word appears sequentially
-                word_start = start_time + (i * word_delay)
+                    # Timing: each word appears sequentially
+                    word_start = start_time + (i * word_delay)
                 
-                # FIXED: Duration is only until next word appears (not until end)
-                if i < word_count - 1:
-                    word_duration = word_delay  # Show only until next word
-                else:
-                    if total_remaining_time:
-                        word_duration = total_remaining_time - (i * word_delay)
+                    # FIXED: Duration is only until next word appears (not until end)
+                    if i < word_count - 1:
+                        word_duration = word_delay  # Show only until next word
                     else:
-                        word_duration = audio_duration - (i * word_delay)
+                        if total_remaining_time:
+                            word_duration = total_remaining_time - (i * word_delay)
+                        else:
+                            word_duration = audio_duration - (i * word_delay)
                 
-                # Last word gets a subtle pop
-                if i == word_count - 1:
-                    def last_word_pop(t):
-                        if t < 0.2:
-                            scale = 1.0 + 0.05 * math.sin(t / 0.2 * math.pi)
-                            offset_x = (1 - scale) * word_clip.w / 2
-                            offset_y = (1 - scale) * word_clip.h / 2
-                            return (text_x + offset_x, text_y + offset_y)
-                        return (text_x, text_y)
-                    word_clip = word_clip.set_position(last_word_pop)
-                else:
-                    word_clip = word_clip.set_position((text_x, text_y))
+                    # Last word gets a subtle pop
+                    if i == word_count - 1:
+                        ts = _frame_times(0.2)
+                        scale = np.where(ts < 0.2, 1.0 + 0.05 * np.sin(ts / 0.2 * math.pi), 1.0)
+                        dx, dy = _pop_offsets(scale, word_clip.w, word_clip.h)
+                        word_clip = word_clip.set_position(
+                            _lut_callback(list(zip((text_x + dx).tolist(), (text_y + dy).tolist()))))
+                    else:
+                        word_clip = word_clip.set_position((text_x, text_y))
                 
-                word_clip = word_clip.set_start(word_start).set_duration(word_duration)
-                clips.append(word_clip)
+                    word_clip = word_clip.set_start(word_start).set_duration(word_duration)
+                    clips.append(word_clip)
+                    # Last-word pop overshoots by up to 2.5%
+                    grow(text_x - 0.025 * word_clip.w, text_y - 0.025 * word_clip.h,
+                         text_x + word_clip.w, text_y + word_clip.h)
                 
-            except Exception as e:
-                self.logger.warning(f"Word clip {i+1} creation failed: {e}")
-                continue
+                except Exception as e:
+                    self.logger.warning(f"Word clip {i+1} creation failed: {e}")
+                    continue
         
         self.logger.section_end("TypeWriter Text Effect")
         
         if len(clips) > 0:
-            return CompositeVideoClip(clips, size=(WIDTH, HEIGHT))
+            ox, oy = max(0, int(bounds[0])), max(0, int(bounds[1]))
+            box_w = min(WIDTH, int(math.ceil(bounds[2]))) - ox
+            box_h = min(HEIGHT, int(math.ceil(bounds[3]))) - oy
+            local = [c.set_position(lambda t, p=c.pos: (p(t)[0] - ox, p(t)[1] - oy)) for c in clips]
+            return CompositeVideoClip(local, size=(box_w, box_h)).set_position((ox, oy))
         return None
     
     # NEW function signature:
@@ -1248,6 +1644,10 @@ class QuizVisualEffects:
         """
         Creates staggered slide-in animation for quiz options.
         
+        Options share one elastic curve, so they are kept as parallel arrays
+        (start times, slide directions, final Ys, pre-rendered sprites) and drawn
+        into a single masked clip instead of one composite layer per option.
+        
         Args:
             options_data: List of dicts with format:
                 [
@@ -1264,12 +1664,16 @@ class QuizVisualEffects:
             use_relative_y: If True, use y_position from data; if False, calculate from OPT_START_Y
             
         Returns:
-            List of positioned TextClip objects
+            List holding the single masked options clip (empty if none rendered)
         """
         self.logger.section_start("Options Sequence")
         self.logger.data("Option Count", len(options_data))
         
-        clips = []
+        sprites = []      # (rgb, mask) per option
+        starts = []       # Slide-in start time per option
+        ends = []
+        from_lefts = []
+        final_ys = []
         
         # Layout constants
         OPT_START_Y = res_scale(1050)  # Below question
@@ -1277,11 +1681,29 @@ class QuizVisualEffects:
         OPT_WIDTH = WIDTH - res_scale(120)
         
         opt_bg_color = self._to_hex(theme.get('bg_color', (15, 23, 42)))
+        SLIDE_DURATION = 0.6  # Elastic slide-in, then settled
+        
+        def opt_sprite(text):
+            opt_clip = _text_clip(
+                text,
+                fontsize=res_scale(52),
+                color='white',
+                font=FONT_REGULAR,
+                bg_color=opt_bg_color,
+                method='caption',
+                size=(OPT_WIDTH, res_scale(100)),
+                align='West'
+            )
+            opt_rgb = opt_clip.get_frame(0)
+            opt_mask = opt_clip.mask.get_frame(0) if opt_clip.mask is not None else np.ones(opt_rgb.shape[:2])
+            return opt_rgb, opt_mask
+        
+        # Rasterize every option up front in parallel; results are collected in order
+        sprite_jobs = [_TEXT_POOL.submit(opt_sprite, opt['text']) for opt in options_data]
         
         for i, opt in enumerate(options_data):
             self.logger.progress(i + 1, len(options_data), "Options")
             
-            text = opt['text']
             start_time = opt['start_time']
             duration = opt['duration']
             
@@ -1289,17 +1711,7 @@ class QuizVisualEffects:
             from_left = (i % 2 == 0)
             
             try:
-                # Create text clip
-                opt_clip = TextClip(
-                    text,
-                    fontsize=res_scale(52),
-                    color='white',
-                    font=FONT_REGULAR,
-                    bg_color=opt_bg_color,
-                    method='caption',
-                    size=(OPT_WIDTH, res_scale(100)),
-                    align='West'
-                )
+                opt_rgb, opt_mask = sprite_jobs[i].result()
                 
                 # NEW:
                 if use_relative_y and 'y_position' in opt:
@@ -1309,35 +1721,12 @@ class QuizVisualEffects:
                     OPT_START_Y = res_scale(1050)
                     OPT_GAP = res_scale(130)
                     final_y = OPT_START_Y + (i * OPT_GAP)
-                # Elastic slide-in animation
-                def make_slide_func(from_left_dir, final_y_pos):
-                    def slide_position(t):
-                        if t < SLIDE_DURATION:  # 0.6s entrance
-                            progress = t / SLIDE_DURATION
-                            eased = EasingFunctions.ease_out_elastic(progress, 1.08)
-                            
-                            if from_left_dir:
-                                # Slide from left
-                                start_x = -OPT_WIDTH
-                                final_x = (WIDTH - OPT_WIDTH) // 2
-                            else:
-                                # Slide from right
-                                start_x = WIDTH
-                                final_x = (WIDTH - OPT_WIDTH) // 2
-                            
-                            current_x = start_x + (final_x - start_x) * eased
-                            return (current_x, final_y_pos)
-                        else:
-                            # Settled position
-                            return ((WIDTH - OPT_WIDTH) // 2, final_y_pos)
-                    return slide_position
-                
                 
-                SLIDE_DURATION = 0.6
-                opt_clip = opt_clip.set_position(
-                    make_slide_func(from_left, final_y)
-                ).set_start(start_time - SLIDE_DURATION).set_duration(duration + SLIDE_DURATION)
-                clips.append(opt_clip)
+                sprites.append((opt_rgb, opt_mask))
+                starts.append(start_time - SLIDE_DURATION)
+                ends.append(start_time + duration)
+                from_lefts.append(from_left)
+                final_ys.append(int(final_y))
                 
                 self.logger.data(f"Option {i+1}", f"Slide from {'LEFT' if from_left else 'RIGHT'}", LogLevel.DEBUG)
                 
@@ -1346,7 +1735,52 @@ class QuizVisualEffects:
                 continue
         
         self.logger.section_end("Options Sequence")
-        return clips
+        if not sprites:
+            return []
+        
+        # One eased curve for every option; each slides from its own side
+        ts = _frame_times(SLIDE_DURATION)
+        eased = np.where(ts < SLIDE_DURATION, ease_out_elastic(ts / SLIDE_DURATION, 1.08), 1.0)
+        last = len(eased) - 1
+        final_x = (WIDTH - OPT_WIDTH) // 2
+        start_xs = np.where(from_lefts, -OPT_WIDTH, WIDTH)
+        starts = np.array(starts)
+        ends = np.array(ends)
+        
+        t0 = starts.min()
+        oy = min(final_ys)
+        box_h = max(y + rgb.shape[0] for y, (rgb, _) in zip(final_ys, sprites)) - oy
+        rgb_buf = np.zeros((box_h, WIDTH, 3), dtype=np.uint8)
+        mask_buf = np.zeros((box_h, WIDTH))
+        opt_last = {'t': None}
+        
+        def options_frame(t):
+            # RGB and mask frames are requested separately for the same t
+            if t != opt_last['t']:
+                rgb_buf.fill(0)
+                mask_buf.fill(0)
+                local_t = t + t0 - starts
+                active = (local_t >= 0) & (t + t0 < ends)
+                idx = np.minimum((np.maximum(local_t, 0) * FPS + 0.5).astype(int), last)
+                xs = (start_xs + (final_x - start_xs) * eased[idx]).astype(int)
+                for i in np.flatnonzero(active):
+                    rgb, mask = sprites[i]
+                    h, w = mask.shape
+                    box = _clip_rect(rgb_buf.shape, xs[i], final_ys[i] - oy, w, h)
+                    if box is None:
+                        continue
+                    rows, cols = box
+                    src = (slice(rows.start - (final_ys[i] - oy), rows.stop - (final_ys[i] - oy)),
+                           slice(cols.start - xs[i], cols.stop - xs[i]))
+                    rgb_buf[box] = rgb[src]
+                    mask_buf[box] = mask[src]
+                opt_last['t'] = t
+            return rgb_buf, mask_buf
+        
+        duration = ends.max() - t0
+        options = VideoClip(lambda t: options_frame(t)[0], duration=duration)
+        options_mask = VideoClip(lambda t: options_frame(t)[1], ismask=True, duration=duration)
+        return [options.set_mask(options_mask).set_position((0, oy)).set_start(t0)]
 
     def create_timer_animation(self, start_time, duration, y_position=1550):
         """
@@ -1368,32 +1802,36 @@ class QuizVisualEffects:
         
         bar_color = self._parse_color(self.theme.get('correct', '#22C55E'))
         
-        # Progress bar segments (10 segments for smooth animation)
+        # Progress bar segments (10 segments for smooth animation), drawn as one
+        # solid bar whose mask uncovers each segment at its scheduled time
         segments = 10
         seg_width = WIDTH // segments
-        
-        for i in range(segments):
+        seg_w = seg_width - res_scale(4)  # 4px gap between segments
+        bar_h = res_scale(50)
+        rise = res_scale(10)  # Pulse height; the canvas reserves it above the bar
+        seg_delay = duration / segments
+        bar_top = int(y_position) - rise
+        bar_mask = np.zeros((bar_h + rise, WIDTH))
+        
+        def bar_mask_frame(t):
+            bar_mask.fill(0)
             # Each segment appears at its scheduled time and stays visible
-            segment_appear_time = start_time + (duration * i / segments)
-            segment_duration = duration - (duration * i / segments)  # FIXED: Stays until timer ends
-            
-            seg = ColorClip(
-                size=(seg_width - res_scale(4), res_scale(50)),  # 4px gap between segments
-                color=bar_color
-            ).set_position((i * seg_width + 2, y_position))
-            
-            # Pulse effect on appearance
-            def make_pulse(base_y, seg_index):
-                def pulse_func(t):
-                    if t < 0.15:  # Quick pulse at start
-                        offset = -res_scale(10) * math.sin(t / 0.15 * math.pi)
-                        return (seg_index * seg_width + 2, base_y + offset)
-                    return (seg_index * seg_width + 2, base_y)
-                return pulse_func
-            
-            seg = seg.set_position(make_pulse(y_position, i))
-            seg = seg.set_start(segment_appear_time).set_duration(segment_duration)
-            clips.append(seg)
+            visible = min(segments, int(t / seg_delay) + 1)
+            for i in range(visible):
+                local_t = t - i * seg_delay
+                # Pulse effect on appearance: quick rise and fall over 0.15s
+                y = int(y_position)
+                if local_t < 0.15:
+                    y = int(y_position - rise * math.sin(local_t / 0.15 * math.pi))
+                row = y - bar_top
+                x = i * seg_width + 2
+                bar_mask[row:row + bar_h, x:x + seg_w] = 1.0
+            return bar_mask
+        
+        progress_bar = ColorClip(size=(WIDTH, bar_h + rise), color=bar_color)
+        progress_bar = progress_bar.set_mask(VideoClip(bar_mask_frame, ismask=True, duration=duration))
+        progress_bar = progress_bar.set_position((0, bar_top))
+        clips.append(progress_bar.set_start(start_time).set_duration(duration))
         
         self.logger.log(f"Created {segments} progress segments", LogLevel.DEBUG)
         
@@ -1404,7 +1842,7 @@ class QuizVisualEffects:
             number = int(duration) - i
             
             try:
-                num_clip = TextClip(
+                num_clip = _text_clip(
                     str(number),
                     fontsize=res_scale(140),
                     color='white',
@@ -1413,24 +1851,13 @@ class QuizVisualEffects:
                     stroke_width=res_scale(5)
                 )
                 
-                # Pulsing scale animation
-                def make_num_pulse(num_w, num_h):
-                    def num_pulse_func(t):
-                        # Scale: 1.0 → 1.2 → 1.0 over 1 second
-                        progress = t % 1.0
-                        if progress < 0.5:
-                            scale = 1.0 + 0.2 * (progress / 0.5)
-                        else:
-                            scale = 1.2 - 0.2 * ((progress - 0.5) / 0.5)
-                        
-                        offset_x = (1 - scale) * num_w / 2
-                        offset_y = (1 - scale) * num_h / 2
-                        
-                        return (WIDTH // 2 - num_w // 2 + offset_x, 
-                               countdown_y + offset_y)
-                    return num_pulse_func
-                
-                num_clip = num_clip.set_position(make_num_pulse(num_clip.w, num_clip.h))
+                # Pulsing scale animation: 1.0 → 1.2 → 1.0 over 1 second
+                progress = _frame_times(1.0) % 1.0
+                scale = np.where(progress < 0.5, 1.0 + 0.2 * (progress / 0.5), 1.2 - 0.2 * ((progress - 0.5) / 0.5))
+                dx, dy = _pop_offsets(scale, num_clip.w, num_clip.h)
+                num_x = WIDTH // 2 - num_clip.w // 2 + dx
+                num_clip = num_clip.set_position(
+                    _lut_callback(list(zip(num_x.tolist(), (countdown_y + dy).tolist()))))
                 num_clip = num_clip.set_start(start_time + i).set_duration(1.0)
                 
                 clips.append(num_clip)
@@ -1484,40 +1911,69 @@ class QuizVisualEffects:
         glow_width = WIDTH - res_scale(100)
         glow_height = res_scale(100)
 
-        def glow_scale(t):
-            if t < 0.8:
-                return 1.0 + 0.3 * (t / 0.5)  # Expand to 1.3x
-            return 1.3
+        # Expand to 1.3x. The glow is a solid colour, so instead of resizing it every
+        # frame it is drawn once at its largest size and a mask shows the current
+        # rectangle (top edge fixed, centred horizontally), 0.15 opacity baked in
+        ts = _frame_times(0.8)
+        glow_scale = np.where(ts < 0.8, 1.0 + 0.3 * (ts / 0.5), 1.3)
+        glow_ws = (glow_width * glow_scale).astype(int).tolist()
+        glow_hs = (glow_height * glow_scale).astype(int).tolist()
+        max_w, max_h = max(glow_ws), max(glow_hs)
+        glow_last_frame = len(glow_ws) - 1
+        glow_mask_buf = np.zeros((max_h, max_w))
+        glow_last = {'k': None}
+
+        def glow_mask_frame(t):
+            k = min(int(t * FPS + 0.5), glow_last_frame)
+            if k != glow_last['k']:
+                w, h = glow_ws[k], glow_hs[k]
+                x0 = (max_w - w) // 2
+                glow_mask_buf.fill(0)
+                glow_mask_buf[:h, x0:x0 + w] = 0.15
+                glow_last['k'] = k
+            return glow_mask_buf
 
         green_glow = ColorClip(
-            size=(glow_width, glow_height),
+            size=(max_w, max_h),
             color=self._parse_color(theme.get('correct'))
         )
-
-        green_glow = green_glow.resize(glow_scale)
-        green_glow = green_glow.set_opacity(0.15)
+        glow_duration = total_remaining_time - 0.05
+        green_glow = green_glow.set_mask(VideoClip(glow_mask_frame, ismask=True, duration=glow_duration))
         green_glow = green_glow.set_position(('center', correct_y))
         #green_glow = green_glow.set_start(0).set_duration(40)
-        green_glow = green_glow.set_start(reveal_start_time+0.05).set_duration(total_remaining_time-0.05)
+        green_glow = green_glow.set_start(reveal_start_time+0.05).set_duration(glow_duration)
 
-        clips.insert(0, green_glow) 
+        clips.append(green_glow)
         
-        wrong_option_fades = []
+        # Darken wrong options: skip rows that are hidden, off-canvas or shared with
+        # the correct answer, and merge touching rows into one taller overlay
+        fade_h = res_scale(100)
+        wrong_spans = []
         for i, opt_data in enumerate(options_data):
             opt_letter = chr(ord('A') + i)
-            if opt_letter != correct_option_letter:
-                # Create fade-to-transparent overlay for wrong options
-                fade = ColorClip(
-                    size=(WIDTH - res_scale(100), res_scale(100)),
-                    color=(0, 0, 0)
-                ).set_opacity(0.6)  # Darken wrong options
-                
-                wrong_y = opt_data.get('y_position', res_scale(1050))
-                fade = fade.set_position(('center', wrong_y))
-                fade = fade.set_start(reveal_start_time+0.05).set_duration(total_remaining_time-0.05)
-                wrong_option_fades.append(fade)
-
-        clips.extend(wrong_option_fades)
+            if opt_letter == correct_option_letter:
+                continue
+            wrong_y = opt_data.get('y_position', res_scale(1050))
+            if opt_data.get('hidden') or wrong_y < 0 or wrong_y > HEIGHT or wrong_y == correct_y:
+                continue
+            wrong_spans.append([wrong_y, wrong_y + fade_h])
+        
+        merged_spans = []
+        for y0, y1 in sorted(wrong_spans):
+            if merged_spans and y0 <= merged_spans[-1][1]:
+                merged_spans[-1][1] = max(merged_spans[-1][1], y1)
+            else:
+                merged_spans.append([y0, y1])
+        
+        for y0, y1 in merged_spans:
+            fade = _solid_clip(
+                size=(WIDTH - res_scale(100), int(y1 - y0)),
+                color=(0, 0, 0),
+                opacity=0.6
+            )
+            fade = fade.set_position(('center', y0))
+            fade = fade.set_start(reveal_start_time+0.05).set_duration(total_remaining_time-0.05)
+            clips.append(fade)
 
         self.logger.log("Background flash created", LogLevel.DEBUG)
         
@@ -1533,31 +1989,69 @@ class QuizVisualEffects:
         center_x = WIDTH // 2
         center_y = confetti_y
         
-        for i in range(20):
-            color = random.choice(confetti_colors)
-            angle = (i / 20) * 2 * math.pi
-            velocity = random.uniform(res_scale(150), res_scale(250))
-            
-            confetti = ColorClip(
-                size=(res_scale(12), res_scale(12)),
-                color=color
-            ).set_opacity(0.8)
-            
-            def make_confetti_func(angle, velocity, center_x, center_y):
-                def confetti_motion(t):
-                    # Radial burst with gravity
-                    x = center_x + (math.cos(angle) * velocity * t)
-                    y = center_y + (math.sin(angle) * velocity * t) + (res_scale(200) * t * t)  # Gravity
-                    return (x, y)
-                return confetti_motion
-            
-            confetti = confetti.set_position(
-                make_confetti_func(angle, velocity, center_x, center_y)
-            ).set_start(reveal_start_time + 0.3).set_duration(1.2)
-            
-            # Fade out
-            confetti = confetti.crossfadeout(0.4)
-            clips.append(confetti)
+        rng = self._rng
+        colors = [confetti_colors[k] for k in rng.integers(0, len(confetti_colors), 20).tolist()]
+        velocity = rng.uniform(res_scale(150), res_scale(250), 20)
+        
+        # All 20 pieces are rasterized into one small clip covering the burst,
+        # so the reveal adds one composite layer instead of 20 ColorClips
+        angle = np.arange(20) / 20 * 2 * math.pi
+        cos_t, sin_t = np.cos(angle), np.sin(angle)
+        vx = cos_t * velocity
+        vy = sin_t * velocity
+        gravity = res_scale(200)
+        piece = res_scale(12)
+        burst_duration, fade_duration = 1.2, 0.4
+        
+        # Radial burst with gravity, tabulated per frame (rows = frames, cols = pieces)
+        ts = _frame_times(burst_duration)[:, None]
+        span_x = (center_x + vx * ts).astype(np.int32)
+        span_y = (center_y + vy * ts + gravity * ts * ts).astype(np.int32)
+        # 0.8 opacity, faded out over the last 0.4s
+        alpha_tab = (0.8 * np.minimum(1.0, (burst_duration - ts[:, 0]) / fade_duration)).tolist()
+        burst_last_frame = len(alpha_tab) - 1
+        ox, oy = int(span_x.min()), int(span_y.min())
+        box_w = int(span_x.max()) - ox + piece
+        box_h = int(span_y.max()) - oy + piece
+        
+        # All 20 squares are written in one fancy-indexed store per buffer. The
+        # buffers carry a one-piece margin on every side: a square that strays
+        # past the box is clamped into the margin, which is never shown.
+        colors = np.array(colors, dtype=np.uint8)
+        offsets = np.arange(piece)
+        rgb_pad = np.zeros((box_h + piece * 2, box_w + piece * 2, 3), dtype=np.uint8)
+        mask_pad = np.zeros(rgb_pad.shape[:2])
+        inner = (slice(piece, piece + box_h), slice(piece, piece + box_w))
+        
+        # RGB and mask frames are requested separately for the same t
+        burst_last = {'t': None}
+        
+        def burst_frame(t):
+            # Outside the burst window (edge frames MoviePy may still request) the
+            # buffers are cleared once and returned blank without any drawing
+            if not 0 <= t <= burst_duration:
+                if burst_last['t'] != 'idle':
+                    rgb_pad.fill(0)
+                    mask_pad.fill(0)
+                    burst_last['t'] = 'idle'
+            elif t != burst_last['t']:
+                rgb_pad.fill(0)
+                mask_pad.fill(0)
+                k = min(int(t * FPS + 0.5), burst_last_frame)
+                alpha = alpha_tab[k]
+                xs, ys = span_x[k], span_y[k]
+                rows = np.clip(ys - oy + piece, 0, box_h + piece)[:, None] + offsets
+                cols = np.clip(xs - ox + piece, 0, box_w + piece)[:, None] + offsets
+                rows, cols = rows[:, :, None], cols[:, None, :]
+                rgb_pad[rows, cols] = colors[:, None, None, :]
+                mask_pad[rows, cols] = alpha
+                burst_last['t'] = t
+            return rgb_pad[inner], mask_pad[inner]
+        
+        confetti = VideoClip(lambda t: burst_frame(t)[0], duration=burst_duration)
+        confetti_mask = VideoClip(lambda t: burst_frame(t)[1], ismask=True, duration=burst_duration)
+        confetti = confetti.set_mask(confetti_mask).set_position((ox, oy))
+        clips.append(confetti.set_start(reveal_start_time + 0.3))
     
         self.logger.log(f"Created 20 confetti particles", LogLevel.DEBUG)
         
@@ -1566,10 +2060,9 @@ class QuizVisualEffects:
 
     def _parse_color(self, color):
         """Parse color from hex or tuple to tuple"""
-        if isinstance(color, str) and color.startswith('#'):
-            hex_color = color.lstrip('#')
-            return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        elif isinstance(color, (tuple, list)):
-            return tuple(color)
-        else:
-            return (255, 255, 255)  # Default white
\ No newline at end of file
+        if isinstance(color, list):
+            color = tuple(color)  # lru_cache needs a hashable key
+        try:
+            return _parse_color_cached(color)
+        except TypeError:  # Unhashable, so not a colour we understand
+            return (255, 255, 255)
\ No newline at end of file
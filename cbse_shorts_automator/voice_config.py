@@ -5,6 +5,8 @@ Voice definitions for Google Cloud TTS and Edge TTS fallback.
 Optimized for Indian CBSE educational content with energetic delivery.
 """
 
+import random
+
 # ============================================================================
 # GOOGLE CLOUD TTS VOICES (Primary - Neural2 Quality)
 # ============================================================================
@@ -102,15 +104,17 @@ EDGE_VOICES = {
 # VOICE SELECTION HELPERS
 # ============================================================================
 
+# Key tuples built once; picks are drawn on every synthesis
+_GOOGLE_KEYS = tuple(GOOGLE_VOICES)
+_EDGE_KEYS = tuple(EDGE_VOICES)
+
 def get_random_google_voice():
     """Returns a random Google Neural2 voice key for variety."""
-    import random
-    return random.choice(list(GOOGLE_VOICES.keys()))
+    return random.choice(_GOOGLE_KEYS)
 
 def get_random_edge_voice():
     """Returns a random Edge TTS voice key for variety."""
-    import random
-    return random.choice(list(EDGE_VOICES.keys()))
+    return random.choice(_EDGE_KEYS)
 
 def get_voice_info(voice_key, provider='google'):
     """
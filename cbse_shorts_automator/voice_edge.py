@@ -9,6 +9,8 @@ import asyncio
 import edge_tts
 import os
 import re
+import threading
+from collections import OrderedDict
 import time
 
 class EdgeVoiceEngine:
@@ -19,9 +21,58 @@ class EdgeVoiceEngine:
     
     def __init__(self):
         """Initialize Edge TTS engine."""
+        self._clean_cache = OrderedDict()  # raw text -> cleaned, FIFO-bounded
+        # One long-lived event loop on a daemon thread serves every synthesis (see _run)
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
         print("✅ Edge TTS engine initialized (fallback mode)")
     
+    def _run(self, coro):
+        """
+        Run coro on the engine's event loop, started on first use, instead of building
+        and tearing down an asyncio.run() loop per segment. Concurrent callers share it.
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(target=self._loop.run_forever,
+                                                     name="edge-tts-loop", daemon=True)
+                self._loop_thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+    
+    def close(self):
+        """Stop and close the event loop; a later synthesis starts a fresh one."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
+    
     def clean_text(self, text):
+        """
+        Cleaned text, memoized per raw string: the quota estimate, the audio cache
+        key and synthesize() all clean the same text, so it is cleaned once.
+        """
+        key = text if isinstance(text, str) else str(text or "")
+        cached = self._clean_cache.get(key)
+        if cached is not None:
+            return cached
+        cleaned = self._clean_text(key)
+        self._clean_cache[key] = cleaned
+        if len(self._clean_cache) > 128:
+            try:
+                self._clean_cache.popitem(last=False)
+            except KeyError:  # Emptied by another synthesis thread
+                pass
+        return cleaned
+    
+    def _clean_text(self, text):
         """
         Clean text for TTS (same logic as Google for consistency).
         Removes Markdown, emoji, and problematic symbols.
@@ -116,7 +167,7 @@ class EdgeVoiceEngine:
         for attempt in range(max_retries):
             try:
                 # Run async synthesis
-                asyncio.run(
+                self._run(
                     self._generate_audio_async(clean_text, output_path, voice_config)
                 )
                 
@@ -7,10 +7,22 @@ Handles Neural2 voices for high-quality, natural Indian English output.
 
 import os
 import re
+import logging
+import threading
+from collections import OrderedDict
 from google.cloud import texttospeech
 from google.oauth2 import service_account
 from pathlib import Path
 
+# Child of voice_manager's logger, so it shares that console handler
+log = logging.getLogger('voice_manager.google')
+
+# HTTP/2 keepalive pings so an idle client's channel is still open for the next segment
+_CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 60000),
+    ('grpc.keepalive_timeout_ms', 20000),
+]
+
 class GoogleVoiceEngine:
     """
     Google Cloud TTS engine with multi-account support and quota management.
@@ -24,15 +36,17 @@ class GoogleVoiceEngine:
             config_dir: Directory containing google_tts_account*.json files
         """
         self.config_dir = config_dir
+        self._clean_cache = OrderedDict()  # raw text -> cleaned, FIFO-bounded
         self.accounts = self._discover_accounts()
         self.clients = {}  # Cache of initialized clients
+        self._clients_lock = threading.Lock()  # Segments may request a client concurrently
         
         if not self.accounts:
             raise FileNotFoundError(
                 f"No google_tts_account*.json files found in {config_dir}/"
             )
         
-        print(f"✅ Discovered {len(self.accounts)} Google Cloud TTS account(s)")
+        log.info("✅ Discovered %d Google Cloud TTS account(s)", len(self.accounts))
     
     def _discover_accounts(self):
         """
@@ -68,18 +82,59 @@ class GoogleVoiceEngine:
         if account_name not in self.accounts:
             raise ValueError(f"Account '{account_name}' not found")
         
-        # Load service account credentials
-        credentials = service_account.Credentials.from_service_account_file(
-            self.accounts[account_name]
-        )
-        
-        # Create client
-        client = texttospeech.TextToSpeechClient(credentials=credentials)
-        self.clients[account_name] = client
+        with self._clients_lock:
+            if account_name in self.clients:
+                return self.clients[account_name]
+            
+            # Load service account credentials
+            credentials = service_account.Credentials.from_service_account_file(
+                self.accounts[account_name]
+            )
+            
+            # Create client on a keepalive gRPC channel (plain client if this
+            # library version builds transports differently)
+            try:
+                from google.cloud.texttospeech_v1.services.text_to_speech.transports import TextToSpeechGrpcTransport
+                channel = TextToSpeechGrpcTransport.create_channel(
+                    'texttospeech.googleapis.com', credentials=credentials, options=_CHANNEL_OPTIONS
+                )
+                client = texttospeech.TextToSpeechClient(transport=TextToSpeechGrpcTransport(channel=channel))
+            except (ImportError, TypeError, AttributeError):
+                client = texttospeech.TextToSpeechClient(credentials=credentials)
+            self.clients[account_name] = client
         
         return client
     
+    def prewarm(self, account_names):
+        """
+        Build the client for each account up front, so credential loading and
+        channel setup are not paid inside the first synthesis call.
+        """
+        for account_name in account_names:
+            try:
+                self._get_client(account_name)
+            except Exception as e:
+                log.warning("⚠️ Could not prewarm Google TTS client for %s: %s", account_name, e)
+    
     def clean_text(self, text):
+        """
+        Cleaned text, memoized per raw string: the quota estimate, the audio cache
+        key and synthesize() all clean the same text, so it is cleaned once.
+        """
+        key = text if isinstance(text, str) else str(text or "")
+        cached = self._clean_cache.get(key)
+        if cached is not None:
+            return cached
+        cleaned = self._clean_text(key)
+        self._clean_cache[key] = cleaned
+        if len(self._clean_cache) > 128:
+            try:
+                self._clean_cache.popitem(last=False)
+            except KeyError:  # Emptied by another synthesis thread
+                pass
+        return cleaned
+    
+    def _clean_text(self, text):
         """
         Clean text for TTS (same logic as Edge TTS for consistency).
         Removes Markdown, emoji, and problematic symbols.
@@ -123,15 +178,16 @@ class GoogleVoiceEngine:
         
         return text
     
-    def synthesize(self, text, output_path, voice_config, account_name):
+    def synthesize(self, text, output_path, voice_config, account_name, audio_format='mp3'):
         """
         Synthesize speech using Google Cloud TTS.
         
         Args:
             text: Text to synthesize
-            output_path: Where to save MP3 file
+            output_path: Where to save the audio file
             voice_config: Voice configuration dict from voice_config.py
             account_name: Which account to use (e.g., 'account1')
+            audio_format: 'mp3', or 'opus' (Ogg Opus: smaller download, fine for ffmpeg)
         
         Returns:
             tuple: (success: bool, chars_used: int, error_msg: str or None)
@@ -141,7 +197,7 @@ class GoogleVoiceEngine:
             clean_text = self.clean_text(text)
             
             if not clean_text or len(clean_text) < 2:
-                print(f"⚠️ Warning: Text empty after cleaning. Original: '{text}'")
+                log.warning("⚠️ Warning: Text empty after cleaning. Original: '%s'", text)
                 clean_text = "Check the description."  # Fallback
             
             chars_used = len(clean_text)
@@ -160,7 +216,8 @@ class GoogleVoiceEngine:
             
             # Configure audio settings
             audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3,
+                audio_encoding=(texttospeech.AudioEncoding.OGG_OPUS if audio_format == 'opus'
+                                else texttospeech.AudioEncoding.MP3),
                 speaking_rate=voice_config.get('speaking_rate', 1.0),
                 pitch=voice_config.get('pitch', 0.0)
             )
@@ -216,5 +273,5 @@ class GoogleVoiceEngine:
             voices = client.list_voices()
             return True
         except Exception as e:
-            print(f"❌ Account '{account_name}' test failed: {e}")
+            log.error("❌ Account '%s' test failed: %s", account_name, e)
             return False
\ No newline at end of file
@@ -8,15 +8,160 @@ INTERFACE: Maintains 100% backward compatibility with existing codebase.
 """
 
 import os
+import sys
+import glob
+import json
+import queue
+import time
 import random
-from moviepy.editor import AudioFileClip
+import shutil
+import hashlib
+import logging
+import weakref
+import threading
 
 # Import our modular voice engines
 from voice_config import GOOGLE_VOICES, EDGE_VOICES, get_random_google_voice, get_random_edge_voice
-from voice_google import GoogleVoiceEngine
 from voice_edge import EdgeVoiceEngine
 from voice_usage_tracker import VoiceUsageTracker
 
+# %-args are only rendered when INFO is enabled. Every entry point (generator, test
+# scripts) gets the old print-style console lines from this default stdout handler;
+# voice_google logs under 'voice_manager.google' and shares it.
+log = logging.getLogger('voice_manager')
+if not log.handlers:
+    _console = logging.StreamHandler(sys.stdout)
+    _console.setFormatter(logging.Formatter('%(message)s'))
+    log.addHandler(_console)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+# MoviePy (numpy, imageio, ffmpeg probing) and the Google client (grpc, protobuf) are
+# imported on first use: cache hits, path-only callers and Edge-only setups never load them
+_AudioFileClip = None
+
+def _audio_file_clip(path):
+    global _AudioFileClip
+    if _AudioFileClip is None:
+        from moviepy.editor import AudioFileClip
+        _AudioFileClip = AudioFileClip
+    return _AudioFileClip(path)
+
+# Waits before re-trying a Google call that failed transiently (5xx / unavailable / timeout)
+_RETRY_DELAYS = (1.0, 2.0)
+_TRANSIENT_MARKERS = ('500', '502', '503', '504', 'UNAVAILABLE', 'DEADLINE_EXCEEDED', 'INTERNAL')
+
+def _is_transient(error_msg):
+    return any(m in str(error_msg) for m in _TRANSIENT_MARKERS)
+
+def _is_quota(error_msg):
+    return "QUOTA_EXCEEDED" in str(error_msg)
+
+def _is_valid_audio(path):
+    """
+    True if path holds more than a stub and starts like an MP3 (an ID3 tag or an
+    MPEG frame sync, 11 set bits) or an Ogg Opus stream ('OggS'). Catches zero-byte /
+    truncated files from a crashed write before ffprobe chokes on them downstream.
+    """
+    try:
+        if os.stat(path).st_size <= 128:
+            return False
+        with open(path, 'rb') as f:
+            head = f.read(4)
+    except OSError:
+        return False
+    return (head[:3] == b'ID3' or head == b'OggS' or
+            (len(head) >= 2 and head[0] == 0xFF and (head[1] & 0xE0) == 0xE0))
+
+class _VoiceCache:
+    """
+    Size-capped LRU store of synthesized MP3s (<key>.mp3 in cache_dir).
+    manifest.json maps key -> {path, bytes, last_access, voice, chars}; once the
+    total passes the cap, least recently used entries are deleted.
+    """
+    
+    def __init__(self, cache_dir, cap_mb=500):
+        self.cache_dir = cache_dir
+        self.cap_bytes = int(cap_mb * 1024 * 1024)
+        self.manifest_file = os.path.join(cache_dir, 'manifest.json')
+        self._lock = threading.Lock()  # TTS segments are synthesized from a thread pool
+        self.entries = self._load_manifest()
+    
+    def _load_manifest(self):
+        """Load the manifest and adopt any MP3s it does not list (e.g. another process's)."""
+        entries = {}
+        if os.path.exists(self.manifest_file):
+            try:
+                with open(self.manifest_file, 'r') as f:
+                    entries = json.load(f)
+            except:
+                entries = {}
+        if os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                key, ext = os.path.splitext(name)
+                if ext == '.mp3' and '.' not in key and key not in entries:
+                    path = os.path.join(self.cache_dir, name)
+                    entries[key] = {'path': path, 'bytes': os.path.getsize(path),
+                                    'last_access': os.path.getmtime(path), 'voice': None, 'chars': None}
+        return entries
+    
+    def _save_manifest(self):
+        """Write the manifest beside its final name, then swap it in."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = f"{self.manifest_file}.{os.getpid()}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp, self.manifest_file)
+    
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+    
+    def get(self, key):
+        """Path of the cached MP3 for key (marked as just used), or None."""
+        path = self._path(key)
+        with self._lock:
+            if not os.path.exists(path):
+                self.entries.pop(key, None)
+                return None
+            now = time.time()
+            os.utime(path, (now, now))
+            entry = self.entries.setdefault(key, {'path': path, 'bytes': os.path.getsize(path),
+                                                  'voice': None, 'chars': None})
+            entry['last_access'] = now
+            return path
+    
+    def put(self, key, src_path, meta=None):
+        """Copy src_path into the cache under key, then evict down to the cap."""
+        path = self._path(key)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Written beside the final name so readers never see a partial file
+        tmp = f"{path[:-4]}.{os.getpid()}.{threading.get_ident()}.mp3"
+        shutil.copyfile(src_path, tmp)
+        os.replace(tmp, path)
+        with self._lock:
+            self.entries[key] = dict({'path': path, 'bytes': os.path.getsize(path),
+                                      'last_access': time.time()}, **(meta or {}))
+            self._evict(keep=key)
+            self._save_manifest()
+    
+    def _evict(self, keep=None):
+        """Delete least recently used entries (never `keep`) until the total fits the cap."""
+        total = sum(e.get('bytes', 0) for e in self.entries.values())
+        if total <= self.cap_bytes:
+            return
+        for key, entry in sorted(self.entries.items(), key=lambda kv: kv[1].get('last_access', 0)):
+            if total <= self.cap_bytes:
+                break
+            if key == keep:
+                continue
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            total -= entry.get('bytes', 0)
+            del self.entries[key]
+
+
 class VoiceManager:
     """
     Unified voice manager with intelligent provider selection.
@@ -25,7 +170,7 @@ class VoiceManager:
     New feature: self.last_used_system for logging to Google Sheets.
     """
     
-    def __init__(self, voice_name=None, config_dir='config', data_dir='data'):
+    def __init__(self, voice_name=None, config_dir='config', data_dir='data', cache_mb=500, strategy='sticky'):
         """
         Initialize voice manager with auto-detection of available providers.
         
@@ -33,9 +178,15 @@ class VoiceManager:
             voice_name: Optional specific voice (for backward compatibility)
             config_dir: Where to find google_tts_account*.json files
             data_dir: Where to store usage tracking data
+            cache_mb: Disk cap for the synthesized-audio cache (LRU eviction)
+            strategy: Google account choice: 'sticky' (reuse one account until it
+                      cannot take the text, then move to the next) or 'random_tiebreak'
+                      (random pick among accounts within 5% of the most remaining quota)
         """
         self.config_dir = config_dir
         self.data_dir = data_dir
+        # Synthesized MP3s keyed by (provider, voice, cleaned text), shared across videos
+        self.cache = _VoiceCache(os.path.join(data_dir, 'tts_cache'), cache_mb)
         
         # Initialize engines
         self.google_engine = None
@@ -43,10 +194,14 @@ class VoiceManager:
         
         # Try to initialize Google TTS (may not be available)
         try:
+            if not glob.glob(os.path.join(config_dir, 'google_tts_account*.json')):
+                raise FileNotFoundError(config_dir)
+            from voice_google import GoogleVoiceEngine
             self.google_engine = GoogleVoiceEngine(config_dir)
             self.google_accounts = self.google_engine.get_available_accounts()
+            self.google_engine.prewarm(self.google_accounts)
         except FileNotFoundError:
-            print("⚠️ No Google Cloud TTS accounts found. Using Edge TTS only.")
+            log.warning("⚠️ No Google Cloud TTS accounts found. Using Edge TTS only.")
             self.google_accounts = []
         
         # Initialize usage tracker
@@ -56,9 +211,32 @@ class VoiceManager:
         for account in self.google_accounts:
             self.tracker.register_account(account)
         
+        # AudioFileClips returned to callers (weakly held), closed by close()
+        self._issued_clips = weakref.WeakSet()
+        
+        # Usage is counted in memory at once; the JSON files are rewritten by a daemon thread
+        self._log_q = queue.Queue()
+        threading.Thread(target=self._log_worker, args=(self._log_q, self.tracker.save),
+                         name="tts-usage-log", daemon=True).start()
+        # Runs once: from close(), when the manager is collected, or at interpreter exit.
+        # Holds no reference to self, so an unused manager can still be freed.
+        self._finalizer = weakref.finalize(self, VoiceManager._shutdown,
+                                           self._issued_clips, self._log_q, self.edge_engine)
+        
         # Voice selection (for backward compatibility)
         self.voice_name = voice_name
         
+        # Google account selection
+        self.strategy = strategy
+        self._current_account = None
+        self._exhausted_accounts = set()  # Accounts that hit a quota/429 error this session
+        # (voice_key, provider) -> (cache provider, first candidate) that last worked for that pinned voice
+        self._sticky_voice_state = {}
+        
+        # voice_key -> (provider, voice_config); Google wins a key both providers list
+        self._voice_registry = {k: ('edge', v) for k, v in EDGE_VOICES.items()}
+        self._voice_registry.update((k, ('google', v)) for k, v in GOOGLE_VOICES.items())
+        
         # Logging attributes (NEW - for Google Sheets logging)
         self.last_used_system = None  # e.g., "Google-account1-NeeraNeural2" or "Edge-PrabhatNeural"
         self.char_count = 0
@@ -94,8 +272,110 @@ class VoiceManager:
         Returns:
             int: Estimated character count
         """
-        clean = self.clean_text(text)
-        return len(clean)
+        # Cleaning only drops characters, except '&' -> 'and', '+' -> 'plus' and
+        # '%' -> ' percent' (at most 7 more each), so this bounds the cleaned length.
+        # It is exact enough while every account has ample room; near the limit, clean.
+        raw = text if isinstance(text, str) else str(text or "")
+        fast = len(raw) + 7 * (raw.count('&') + raw.count('+') + raw.count('%'))
+        if self.google_accounts:
+            acct = self.tracker.most_available_account(self.google_accounts)
+            if acct is None or self.tracker.remaining(acct) <= fast * 1.1:
+                return len(self.clean_text(text))
+        return fast
+    
+    def _cache_key(self, text, provider, voice_key, audio_format='mp3'):
+        """
+        Content address of a synthesis: SHA-256 of provider, voice and the cleaned
+        text with whitespace collapsed (case is kept; TTS reads 'US' and 'us' differently).
+        Non-MP3 Google output adds its format; Edge always writes MP3.
+        """
+        clean = " ".join(self.clean_text(text).split())
+        if provider == 'google' and audio_format != 'mp3':
+            voice_key = f"{voice_key}|{audio_format}"
+        return hashlib.sha256(f"{provider}|{voice_key}|{clean}".encode('utf-8')).hexdigest()
+    
+    def _result(self, output_path, return_clip):
+        """
+        AudioFileClip (ffprobes the file) or just the path, as the caller asked.
+        Clips are tracked so close() can release their ffmpeg readers.
+        """
+        if not return_clip:
+            return output_path
+        clip = _audio_file_clip(output_path)
+        self._issued_clips.add(clip)
+        return clip
+    
+    def _from_cache(self, text, output_path, provider, voice_key, return_clip=True, audio_format='mp3'):
+        """
+        On a cache hit, copy the stored audio to output_path and return its clip or
+        path (no API call, no quota used); None on a miss.
+        """
+        cache_path = self.cache.get(self._cache_key(text, provider, voice_key, audio_format))
+        if cache_path is None or not _is_valid_audio(cache_path):
+            return None  # Corrupt entries are re-synthesized and overwritten
+        shutil.copyfile(cache_path, output_path)
+        log.info("   💾 TTS cache hit (%s, Voice: %s)", provider, voice_key)
+        self.last_used_system = f"Cache-{voice_key}"
+        self.char_count = 0
+        return self._result(output_path, return_clip)
+    
+    def _to_cache(self, text, output_path, provider, voice_key, audio_format='mp3'):
+        """Store a fresh synthesis in the LRU cache."""
+        try:
+            self.cache.put(self._cache_key(text, provider, voice_key, audio_format), output_path,
+                           {'voice': voice_key, 'chars': self.char_count})
+        except OSError as e:
+            log.warning("   ⚠️ Could not cache TTS audio: %s", e)
+    
+    def _log_usage(self, account_name, provider, chars_used, voice_used):
+        """Count usage now (quota picks see it immediately) and queue the file write."""
+        self.tracker.log_usage(account_name, provider, chars_used, voice_used, persist=False)
+        self._log_q.put(None)
+    
+    @staticmethod
+    def _log_worker(log_q, save):
+        """Coalesces queued saves: one write of the tracker files per burst of log_usage calls."""
+        while True:
+            pending = [log_q.get()]
+            while True:
+                try:
+                    pending.append(log_q.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                save()
+            except Exception as e:
+                # Any failure, not just I/O: the thread must survive and close() must not hang
+                log.warning("   ⚠️ Could not save TTS usage: %s", e)
+            finally:
+                for _ in pending:
+                    log_q.task_done()
+    
+    def _pick_account(self, chars_needed):
+        """
+        Google account that can take chars_needed more characters, per self.strategy,
+        or None if every account is exhausted.
+        """
+        accounts = self.google_accounts
+        status = self.tracker.get_account_status
+        exhausted = self._exhausted_accounts
+        if self.strategy == 'random_tiebreak':
+            remaining = {acc: status(acc)['available'] for acc in accounts if acc not in exhausted}
+            fits = [acc for acc in remaining if remaining[acc] >= chars_needed]
+            if not fits:
+                return None
+            best = max(remaining[acc] for acc in fits)
+            return random.choice([acc for acc in fits if remaining[acc] >= best * 0.95])
+        
+        # 'sticky': keep the current account, else advance in order from it
+        start = accounts.index(self._current_account) if self._current_account in accounts else 0
+        for acc in accounts[start:] + accounts[:start]:
+            if acc in exhausted:
+                continue
+            if status(acc)['available'] >= chars_needed:
+                self._current_account = acc
+                return acc
+        return None
     
     def _select_provider_and_voice(self, text):
         """
@@ -111,29 +391,74 @@ class VoiceManager:
         
         # Try Google accounts first
         if self.google_engine and self.google_accounts:
-            available_account = self.tracker.find_available_account(
-                chars_needed, 
-                self.google_accounts
-            )
+            available_account = self._pick_account(chars_needed)
             
             if available_account:
                 # Select random Google voice
                 voice_key = get_random_google_voice()
                 voice_config = GOOGLE_VOICES[voice_key]
                 
-                print(f"   🔵 Using Google TTS (Account: {available_account}, Voice: {voice_key})")
+                log.info("   🔵 Using Google TTS (Account: %s, Voice: %s)", available_account, voice_key)
                 return 'google', available_account, voice_config, voice_key
             else:
-                print(f"   ⚠️ All Google accounts exhausted. Falling back to Edge TTS.")
+                log.warning("   ⚠️ All Google accounts exhausted. Falling back to Edge TTS.")
         
         # Fallback to Edge TTS
         voice_key = get_random_edge_voice()
         voice_config = EDGE_VOICES[voice_key]
         
-        print(f"   🟢 Using Edge TTS (Voice: {voice_key})")
+        log.info("   🟢 Using Edge TTS (Voice: %s)", voice_key)
         return 'edge', None, voice_config, voice_key
     
-    def _synthesize_with_provider(self, text, output_path, provider, account, voice_config):
+    def _candidates(self, text, first):
+        """
+        Fallback chain after the selected (provider, account, voice_config, voice_key):
+        the other Google accounts with room for the text (most remaining quota first,
+        same voice), then Edge with a random voice.
+        """
+        yield first
+        provider, account, voice_config, voice_key = first
+        if provider == 'google':
+            chars_needed = self._estimate_chars_needed(text)
+            status = self.tracker.get_account_status
+            remaining = {acc: status(acc)['available'] for acc in self.google_accounts}
+            for acc in sorted(remaining, key=remaining.get, reverse=True):
+                if acc != account and acc not in self._exhausted_accounts and remaining[acc] >= chars_needed:
+                    yield 'google', acc, voice_config, voice_key
+            edge_key = get_random_edge_voice()
+            log.info("   🟢 Falling back to Edge TTS (Voice: %s)", edge_key)
+            yield 'edge', None, EDGE_VOICES[edge_key], edge_key
+    
+    def _synthesize_with_retry(self, text, output_path, first, audio_format='mp3'):
+        """
+        Walk the candidate chain until one synthesizes. Transient Google errors are
+        retried with backoff on the same account; quota errors mark the account
+        exhausted for this session and move on. (Edge retries internally.)
+        
+        Returns:
+            tuple: (success, chars_used, error_msg, provider, account, voice_key)
+        """
+        error_msg = None
+        for provider, account, voice_config, voice_key in self._candidates(text, first):
+            for delay in _RETRY_DELAYS + (None,):
+                success, chars_used, error_msg = self._synthesize_with_provider(
+                    text, output_path, provider, account, voice_config, audio_format
+                )
+                if success:
+                    return True, chars_used, None, provider, account, voice_key
+                if provider != 'google' or delay is None or not _is_transient(error_msg):
+                    break
+                log.warning("   ⏳ Transient Google TTS error on %s; retrying in %.0fs...", account, delay)
+                time.sleep(delay + random.uniform(0, 0.5))
+            
+            if _is_quota(error_msg):
+                log.warning("   ⚠️ Quota exceeded for %s. Trying next option...", account)
+                self._exhausted_accounts.add(account)
+            else:
+                log.warning("   ⚠️ %s synthesis failed: %s. Trying next option...", provider, error_msg)
+        return False, 0, error_msg, provider, account, voice_key
+    
+    def _synthesize_with_provider(self, text, output_path, provider, account, voice_config, audio_format='mp3'):
         """
         Synthesize audio using the selected provider.
         
@@ -143,82 +468,152 @@ class VoiceManager:
             provider: 'google' or 'edge'
             account: Google account name (or None for Edge)
             voice_config: Voice configuration dict
+            audio_format: 'mp3' or 'opus' (Google only; Edge always writes MP3)
         
         Returns:
             tuple: (success: bool, chars_used: int, error_msg: str or None)
         """
         if provider == 'google':
             return self.google_engine.synthesize(
-                text, output_path, voice_config, account
+                text, output_path, voice_config, account, audio_format
             )
         else:  # edge
             return self.edge_engine.synthesize(
                 text, output_path, voice_config
             )
     
-    def generate_audio_sync(self, text, output_path, override_voice=None):
+    def _resolve_voice(self, voice_key, provider_hint=None):
         """
-        Generate audio synchronously (BACKWARD COMPATIBLE interface).
-        
-        Args:
-            text: Text to synthesize
-            output_path: Where to save MP3
-            override_voice: Optional voice override (for compatibility)
+        Look up voice_key in the merged registry (one dict probe). provider_hint only
+        matters for a key listed by both providers, which the registry resolves at init.
         
         Returns:
-            AudioFileClip: MoviePy audio clip object
+            tuple: (provider: str, voice_config: dict)
+        """
+        entry = self._voice_registry.get(voice_key)
+        if entry is None:
+            raise ValueError(f"Voice '{voice_key}' not found in Google or Edge voices")
+        if provider_hint == 'edge' and entry[0] == 'google' and voice_key in EDGE_VOICES:
+            return 'edge', EDGE_VOICES[voice_key]
+        return entry
+    
+    def _select_specific_voice(self, text, provider, voice_config, voice_key):
+        """
+        First candidate for a pinned voice: a Google account with room for the text,
+        else Edge (a random Edge voice when voice_key is a Google voice).
         
-        Raises:
-            Exception: If synthesis fails completely
+        Returns:
+            tuple: (provider: str, account: str or None, voice_config: dict, voice_key: str)
+        """
+        if provider == 'google':
+            if self.google_engine and self.google_accounts:
+                account = self._pick_account(self._estimate_chars_needed(text))
+                if account:
+                    return 'google', account, voice_config, voice_key
+            log.warning("   ⚠️ No Google account with sufficient quota. Using Edge TTS.")
+            voice_key = get_random_edge_voice()
+            voice_config = EDGE_VOICES[voice_key]
+        return 'edge', None, voice_config, voice_key
+    
+    def _generate(self, text, output_path, *, voice_key=None, provider_hint=None, return_clip=True,
+                  audio_format='mp3'):
         """
-        # Step 1: Select provider and voice
-        provider, account, voice_config, voice_key = self._select_provider_and_voice(text)
+        Shared pipeline behind generate_audio_sync and generate_audio_with_specific_voice:
+        pick the first candidate (random voice, or voice_key biased by provider_hint),
+        check the cache, synthesize with retry/fallback, log usage, validate and cache.
+        """
+        # Step 1: Select provider and voice; a pinned voice is looked up in the cache
+        # under the voice that was asked for, before any quota check
+        sticky = None
+        if voice_key is None:
+            first = self._select_provider_and_voice(text)
+            cache_provider, cache_voice = first[0], first[3]
+        else:
+            sticky_key = (voice_key, provider_hint)
+            sticky = self._sticky_voice_state.get(sticky_key)
+            if sticky is None:
+                cache_provider, voice_config = self._resolve_voice(voice_key, provider_hint)
+            else:
+                cache_provider, first = sticky
+            cache_voice = voice_key
         
-        # Step 2: Attempt synthesis
-        success, chars_used, error_msg = self._synthesize_with_provider(
-            text, output_path, provider, account, voice_config
-        )
+        cached = self._from_cache(text, output_path, cache_provider, cache_voice, return_clip, audio_format)
+        if cached is not None:
+            return cached
         
-        # Step 3: Handle quota exhaustion (try next account or fallback)
-        if not success and "QUOTA_EXCEEDED" in str(error_msg):
-            print(f"   ⚠️ Quota exceeded for {account}. Trying next option...")
-            
-            # If Google failed, try Edge
-            if provider == 'google':
-                provider = 'edge'
-                account = None
-                voice_key = get_random_edge_voice()
-                voice_config = EDGE_VOICES[voice_key]
-                
-                print(f"   🟢 Falling back to Edge TTS (Voice: {voice_key})")
-                success, chars_used, error_msg = self._synthesize_with_provider(
-                    text, output_path, provider, account, voice_config
-                )
+        # A pinned voice reuses the candidate that last succeeded while its account has room
+        if sticky is not None and first[1] is not None:
+            account = first[1]
+            if (account in self._exhausted_accounts or
+                    self.tracker.get_account_status(account)['available'] < self._estimate_chars_needed(text)):
+                self._sticky_voice_state.pop(sticky_key, None)
+                sticky = None
+                voice_config = self._resolve_voice(voice_key, provider_hint)[1]
+        if voice_key is not None and sticky is None:
+            first = self._select_specific_voice(text, cache_provider, voice_config, voice_key)
+        
+        # Steps 2-3: Attempt synthesis, retrying transient errors and falling back
+        # through the other Google accounts, then Edge
+        success, chars_used, error_msg, provider, account, used_voice = self._synthesize_with_retry(
+            text, output_path, first, audio_format
+        )
         
         # Step 4: Log usage
         if success:
-            account_label = account if account else 'edge'
-            self.tracker.log_usage(
-                account_name=account_label,
-                provider=provider,
-                chars_used=chars_used,
-                voice_used=voice_key
-            )
+            self._log_usage(account if account else 'edge', provider, chars_used, used_voice)
             
             # Set logging attributes for Google Sheets
             if provider == 'google':
-                self.last_used_system = f"Google-{account}-{voice_key}"
+                self.last_used_system = f"Google-{account}-{used_voice}"
             else:
-                self.last_used_system = f"Edge-{voice_key}"
+                self.last_used_system = f"Edge-{used_voice}"
             
             self.char_count = chars_used
         
+        if voice_key is not None:
+            if success and (provider, account, used_voice) == (first[0], first[1], first[3]):
+                self._sticky_voice_state[sticky_key] = (cache_provider, first)
+            else:
+                self._sticky_voice_state.pop(sticky_key, None)
+        
         # Step 5: Verify and return
-        if success and os.path.exists(output_path):
-            return AudioFileClip(output_path)
-        else:
-            raise Exception(f"TTS synthesis failed: {error_msg}")
-    def generate_audio_with_specific_voice(self, text, output_path, voice_key, provider='google'):
+        if success and _is_valid_audio(output_path):
+            self._to_cache(text, output_path, provider, used_voice, audio_format)
+            return self._result(output_path, return_clip)
+        if voice_key is not None:
+            raise Exception(f"Failed to synthesize audio with voice '{voice_key},{cache_provider}': {error_msg}")
+        raise Exception(f"TTS synthesis failed: {error_msg}")
+    
+    def generate_audio_sync(self, text, output_path, override_voice=None, return_clip=True, audio_format='mp3'):
+        """
+        Generate audio synchronously (BACKWARD COMPATIBLE interface).
+        
+        Args:
+            text: Text to synthesize
+            output_path: Where to save MP3
+            override_voice: Optional voice override (for compatibility)
+            return_clip: False returns output_path instead of an AudioFileClip,
+                         skipping MoviePy's ffprobe of the file
+            audio_format: 'opus' asks Google for Ogg Opus (smaller, for audio that only
+                          goes on to ffmpeg); Edge output stays MP3
+        
+        Returns:
+            AudioFileClip: MoviePy audio clip object (output_path if return_clip=False)
+        
+        Raises:
+            Exception: If synthesis fails completely
+        """
+        return self._generate(text, output_path, return_clip=return_clip, audio_format=audio_format)
+    
+    def generate_audio_sync_path(self, text, output_path, override_voice=None):
+        """
+        generate_audio_sync without the MoviePy wrap: returns output_path.
+        Prefer this when the file is only handed on to ffmpeg or a later AudioFileClip.
+        """
+        return self.generate_audio_sync(text, output_path, override_voice, return_clip=False)
+    
+    def generate_audio_with_specific_voice(self, text, output_path, voice_key, provider='google', return_clip=True,
+                                           audio_format='mp3'):
         """
         Generate audio using a specific voice (no randomization).
         Used when a video needs consistent voice across all segments.
@@ -228,103 +623,43 @@ class VoiceManager:
             output_path: Where to save MP3
             voice_key: Specific voice to use (e.g., 'NeeraNeural2' from Google or 'NeerjaNeural' from Edge)
             provider: 'google' or 'edge' (default: 'google', falls back to 'edge' if quota exhausted)
+            return_clip: False returns output_path instead of an AudioFileClip
+                         (callers that only need the file skip the ffprobe)
+            audio_format: 'mp3' or 'opus' (see generate_audio_sync)
         
         Returns:
-            AudioFileClip: MoviePy audio clip object
+            AudioFileClip: MoviePy audio clip object (output_path if return_clip=False)
         """
-
-        
-        #print(f"1.{provider}")
-        # Step 1: Get voice configuration
-        if provider == 'google' and voice_key in GOOGLE_VOICES:
-            voice_config = GOOGLE_VOICES[voice_key]
-        elif provider == 'edge' and voice_key in EDGE_VOICES:
-            voice_config = EDGE_VOICES[voice_key]
-        else:
-            # Fallback: try to find voice in either provider
-            if voice_key in GOOGLE_VOICES:
-                voice_config = GOOGLE_VOICES[voice_key]
-                provider = 'google'
-            elif voice_key in EDGE_VOICES:
-                voice_config = EDGE_VOICES[voice_key]
-                provider = 'edge'
-            else:
-                raise ValueError(f"Voice '{voice_key}' not found in Google or Edge voices")
-
-        
-        #print(f"2.{provider}")
-        
-        # Step 2: Estimate characters and check quota
-        chars_needed = self._estimate_chars_needed(text)
-        
-        # Step 3: Try Google first if requested
-        if provider == 'google' and self.google_engine and self.google_accounts:
-            available_account = self.tracker.find_available_account(
-                chars_needed,
-                self.google_accounts
-            )
-
-            print(f"3.{available_account}")
-            
-            if available_account:
-                success, chars_used, error_msg = self._synthesize_with_provider(
-                    text, output_path, 'google', available_account, voice_config
-                )
-                
-                if success:
-                    self.tracker.log_usage(available_account, 'google', chars_used, voice_key)
-                    self.last_used_system = f"Google-{available_account}-{voice_key}"
-                    self.char_count = chars_used
-                    return AudioFileClip(output_path)
-                elif "QUOTA_EXCEEDED" in str(error_msg):
-                    print(f"   ⚠️ Google quota exhausted. Falling back to Edge TTS.")
-                    provider = 'edge'
-            else:
-                print(f"   ⚠️ No Google account with sufficient quota. Using Edge TTS.")
-                provider = 'edge'
-
-        provider = 'edge'
-        # Step 4: Use Edge TTS (fallback or requested)
-        if provider == 'edge':
-            print(f" provider: {provider}")
-            # Map to equivalent Edge voice if we were trying Google
-            if voice_key in GOOGLE_VOICES:
-                # Try to find similar Edge voice (same gender)
-                edge_voice_key = get_random_edge_voice()  # Fallback to random
-                voice_config = EDGE_VOICES[edge_voice_key]
-                print(f" Voice used for {output_path}: {edge_voice_key}")
-                
-            else:
-                edge_voice_key = voice_key
-            
-            success, chars_used, error_msg = self._synthesize_with_provider(
-                text, output_path, 'edge', None, voice_config
-            )
-
-            print(f" 0.edge: {success}:{output_path}")
+        return self._generate(text, output_path, voice_key=voice_key, provider_hint=provider,
+                              return_clip=return_clip, audio_format=audio_format)
+    
+    def close(self):
+        """
+        Close the AudioFileClips handed out that are still alive (each holds an ffmpeg
+        reader process), flush queued usage writes and stop the Edge engine's event loop.
+        Call it once the clips are rendered, or use the manager as a context manager.
+        Later calls do nothing.
+        """
+        self._finalizer()
+    
+    @staticmethod
+    def _shutdown(issued_clips, log_q, edge_engine):
+        for clip in list(issued_clips):
             try:
-                if success:
-                
-                    print(f" 1.edge: {success}:{output_path}")
-                    self.tracker.log_usage('edge', 'edge', chars_used, edge_voice_key)
-                    #print(f" 2.edge: {success}:{output_path}")
-                    self.last_used_system = f"Edge-{edge_voice_key}"
-                    #print(f" 3.edge: {success}:{output_path}")
-                    self.char_count = chars_used
-                    #print(f" 4.edge: {success}:{output_path}")
-                    generated_aud_file=AudioFileClip(output_path);
-                    print(f" 5.edge: {success}:{output_path}")
-                    return generated_aud_file
-
-            
-            except Exception as e:
-                print(f"   ❌ ERROR: {e}")
-                import traceback
-                traceback.print_exc()
-        
-        # Step 5: Complete failure
-        raise Exception(f"Failed to synthesize audio with voice '{voice_key},{provider}'")
-
+                clip.close()
+            except Exception:
+                pass
+        issued_clips.clear()
+        log_q.join()
+        edge_engine.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+    
     def get_usage_summary(self):
         """
         Get current usage summary across all accounts.
@@ -8,7 +8,14 @@ Handles usage monitoring, account rotation, and fallback decisions.
 import os
 import json
 import datetime
+import threading
 from pathlib import Path
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock (run with RENDER_WORKERS=1)
+    fcntl = None
 
 # ============================================================================
 # QUOTA LIMITS (Monthly per Google Cloud Project)
@@ -25,6 +32,36 @@ GOOGLE_QUOTA_LIMITS = {
 DEFAULT_VOICE_TYPE = 'neural2'
 MONTHLY_QUOTA = GOOGLE_QUOTA_LIMITS[DEFAULT_VOICE_TYPE]
 
+def _new_account():
+    return {
+        'used_chars': 0,
+        'quota_limit': MONTHLY_QUOTA,
+        'available': MONTHLY_QUOTA
+    }
+
+def _write_json_atomic(path, text):
+    """Write beside path and rename over it, so a killed write never leaves a truncated file."""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, 'w') as f:
+            f.write(text)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+@contextmanager
+def _file_lock(path):
+    """Exclusive advisory lock shared by every process tracking the same data_dir."""
+    with open(path, 'a') as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
 class VoiceUsageTracker:
     """
     Tracks TTS usage across multiple Google Cloud accounts and Edge TTS.
@@ -34,12 +71,22 @@ class VoiceUsageTracker:
     def __init__(self, data_dir='data'):
         self.data_dir = data_dir
         os.makedirs(data_dir, exist_ok=True)
+        # Segments are synthesized concurrently; quota reads and writes go through this
+        self._lock = threading.RLock()
+        # Serializes file writes (taken before _lock, never while holding it)
+        self._write_lock = threading.Lock()
         
         self.usage_file = os.path.join(data_dir, 'voice_usage_history.json')
         self.quota_file = os.path.join(data_dir, 'voice_quota_state.json')
+        self.lock_file = os.path.join(data_dir, 'voice_usage.lock')
         
         self.usage_history = self._load_usage_history()
         self.quota_state = self._load_quota_state()
+        
+        # Usage logged since the last save. Batch workers each run a tracker on the same
+        # files, so save() merges these deltas into what is on disk instead of overwriting it
+        self._pending_chars = {}
+        self._pending_history = []
     
     def _load_usage_history(self):
         """Load cumulative usage log (append-only)."""
@@ -51,11 +98,6 @@ class VoiceUsageTracker:
                 return []
         return []
     
-    def _save_usage_history(self):
-        """Save usage history to disk."""
-        with open(self.usage_file, 'w') as f:
-            json.dump(self.usage_history, f, indent=2)
-    
     def _load_quota_state(self):
         """Load current quota state per account."""
         if os.path.exists(self.quota_file):
@@ -84,20 +126,17 @@ class VoiceUsageTracker:
         current_month = datetime.datetime.now().strftime('%Y-%m')
         return current_month != last_reset_month
     
-    def _save_quota_state(self):
-        """Save quota state to disk."""
-        with open(self.quota_file, 'w') as f:
-            json.dump(self.quota_state, f, indent=2)
-    
-    def register_account(self, account_name):
-        """Register a new Google Cloud account for tracking."""
-        if account_name not in self.quota_state['accounts']:
-            self.quota_state['accounts'][account_name] = {
-                'used_chars': 0,
-                'quota_limit': MONTHLY_QUOTA,
-                'available': MONTHLY_QUOTA
-            }
-            self._save_quota_state()
+    def register_account(self, account_name, persist=True):
+        """
+        Register a new Google Cloud account for tracking.
+        Callers already holding _lock pass persist=False (save() takes _write_lock first).
+        """
+        with self._lock:
+            added = account_name not in self.quota_state['accounts']
+            if added:
+                self.quota_state['accounts'][account_name] = _new_account()
+        if added and persist:
+            self.save()
     
     def get_account_status(self, account_name):
         """
@@ -107,7 +146,7 @@ class VoiceUsageTracker:
             dict: {'used': int, 'available': int, 'limit': int, 'percent_used': float}
         """
         if account_name not in self.quota_state['accounts']:
-            self.register_account(account_name)
+            self.register_account(account_name, persist=False)
         
         acc = self.quota_state['accounts'][account_name]
         return {
@@ -117,6 +156,15 @@ class VoiceUsageTracker:
             'percent_used': (acc['used_chars'] / acc['quota_limit']) * 100
         }
     
+    def remaining(self, account_name):
+        """Characters left this month on account_name."""
+        return self.get_account_status(account_name)['available']
+    
+    def most_available_account(self, account_names):
+        """Account with the most remaining quota, or None for an empty list."""
+        with self._lock:
+            return max(account_names, key=self.remaining, default=None)
+    
     def find_available_account(self, required_chars, account_names):
         """
         Find first account with sufficient quota.
@@ -128,13 +176,14 @@ class VoiceUsageTracker:
         Returns:
             str or None: Account name with sufficient quota, or None if all exhausted
         """
-        for acc_name in account_names:
-            status = self.get_account_status(acc_name)
-            if status['available'] >= required_chars:
-                return acc_name
+        with self._lock:
+            for acc_name in account_names:
+                status = self.get_account_status(acc_name)
+                if status['available'] >= required_chars:
+                    return acc_name
         return None
     
-    def log_usage(self, account_name, provider, chars_used, voice_used, video_id=None):
+    def log_usage(self, account_name, provider, chars_used, voice_used, video_id=None, persist=True):
         """
         Log TTS usage for tracking.
         
@@ -144,29 +193,77 @@ class VoiceUsageTracker:
             chars_used: Number of characters synthesized
             voice_used: Voice name used
             video_id: Optional video identifier
+            persist: False updates the in-memory state only; the caller saves later
         """
-        # Update quota state (only for Google)
-        if provider == 'google':
-            if account_name not in self.quota_state['accounts']:
-                self.register_account(account_name)
+        with self._lock:
+            # Update quota state (only for Google)
+            if provider == 'google':
+                if account_name not in self.quota_state['accounts']:
+                    self.register_account(account_name, persist=False)
+                
+                acc = self.quota_state['accounts'][account_name]
+                acc['used_chars'] += chars_used
+                acc['available'] = acc['quota_limit'] - acc['used_chars']
+                self._pending_chars[account_name] = self._pending_chars.get(account_name, 0) + chars_used
             
-            acc = self.quota_state['accounts'][account_name]
-            acc['used_chars'] += chars_used
-            acc['available'] = acc['quota_limit'] - acc['used_chars']
-            self._save_quota_state()
-        
-        # Append to usage history
-        log_entry = {
-            'timestamp': datetime.datetime.now().isoformat(),
-            'account': account_name,
-            'provider': provider,
-            'chars': chars_used,
-            'voice': voice_used,
-            'video_id': video_id,
-            'cost_usd': self._estimate_cost(provider, chars_used) if provider == 'google' else 0
-        }
-        self.usage_history.append(log_entry)
-        self._save_usage_history()
+            # Append to usage history
+            log_entry = {
+                'timestamp': datetime.datetime.now().isoformat(),
+                'account': account_name,
+                'provider': provider,
+                'chars': chars_used,
+                'voice': voice_used,
+                'video_id': video_id,
+                'cost_usd': self._estimate_cost(provider, chars_used) if provider == 'google' else 0
+            }
+            self.usage_history.append(log_entry)
+            self._pending_history.append(log_entry)
+        if persist:
+            self.save()
+    
+    def save(self):
+        """
+        Merge usage logged since the last save into the files and adopt the result.
+        
+        Under the data_dir file lock the files are re-read, so usage saved meanwhile by
+        other worker processes is kept (and then seen by this tracker's quota picks).
+        _write_lock keeps this process's writers from interleaving; _lock is only held
+        to swap the pending deltas and the merged state, never across disk I/O.
+        """
+        with self._write_lock:
+            with self._lock:
+                chars, self._pending_chars = self._pending_chars, {}
+                entries, self._pending_history = self._pending_history, []
+                accounts = list(self.quota_state['accounts'])
+            try:
+                with _file_lock(self.lock_file):
+                    quota = self._load_quota_state()
+                    for name in accounts:
+                        quota['accounts'].setdefault(name, _new_account())
+                    for name, used in chars.items():
+                        acc = quota['accounts'][name]
+                        acc['used_chars'] += used
+                        acc['available'] = acc['quota_limit'] - acc['used_chars']
+                    history = self._load_usage_history() + entries
+                    _write_json_atomic(self.quota_file, json.dumps(quota, indent=2))
+                    _write_json_atomic(self.usage_file, json.dumps(history, indent=2))
+            except BaseException:
+                # Not written: keep the deltas for the next save
+                with self._lock:
+                    for name, used in chars.items():
+                        self._pending_chars[name] = self._pending_chars.get(name, 0) + used
+                    self._pending_history[:0] = entries
+                raise
+            with self._lock:
+                # Re-apply what was logged while the files were being written
+                for name, used in self._pending_chars.items():
+                    acc = quota['accounts'].setdefault(name, _new_account())
+                    acc['used_chars'] += used
+                    acc['available'] = acc['quota_limit'] - acc['used_chars']
+                for name in self.quota_state['accounts']:
+                    quota['accounts'].setdefault(name, self.quota_state['accounts'][name])
+                self.quota_state = quota
+                self.usage_history = history + self._pending_history
     
     def _estimate_cost(self, provider, chars_used):
         """